@@ -28,7 +28,7 @@
 #  ============================================================================
 import itertools
 
-from camelot.core.naming import initial_naming_context
+from camelot.core.naming import BoundedNamingContext, NamingContext, initial_naming_context
 from camelot.admin.action.base import ModelContext
 
 """ModelContext and Actions that run in the context of an 
@@ -36,7 +36,13 @@ application.
 """
 
 model_context_counter = itertools.count(1)
-model_context_naming = initial_naming_context.bind_new_context('model_context')
+# Model contexts of views are evicted when they were not used recently, while
+# the model contexts of the application itself are rebound under a fixed name
+# each time the application window, navigation panel or menu is built.
+model_context_naming = BoundedNamingContext(max_bindings=256)
+initial_naming_context.bind_context('model_context', model_context_naming)
+application_context_naming = NamingContext()
+model_context_naming.bind_context('application', application_context_naming, immutable=True)
 
 class ApplicationActionModelContext(ModelContext):
     """The Model context for an :class:`camelot.admin.action.Action`.  On top 
@@ -201,6 +201,13 @@ return immediately and the :meth:`model_run` will not be blocked.
     def model_run( self, model_context, mode ):
         raise Exception('This should not happen')
 
+    def sent(self):
+        """Called after the step has been serialized and sent to the client.
+        The default implementation does nothing, reimplement it to release
+        server side resources the client no longer refers to.
+        """
+        pass
+
     @classmethod
     def deserialize_result(cls, model_context: ModelContext, serialized_result):
         """
@@ -1,11 +1,15 @@
 from dataclasses import dataclass
+import hashlib
 import itertools
 import logging
+import os
 import typing
 
+import orjson
+
 from ..admin.action.base import RenderHint
-from ..core.naming import AlreadyBoundException, initial_naming_context, NamingContext, NameNotFoundException
-from ..core.serializable import DataclassSerializable
+from ..core.naming import initial_naming_context, NamingContext, NamingException, not_found
+from ..core.serializable import DataclassSerializable, json_encoder
 
 LOGGER = logging.getLogger(__name__)
 
@@ -26,13 +30,213 @@ class RouteWithRenderHint(DataclassSerializable):
         return RouteWithRenderHint(tuple(data['route']), RenderHint(data['render_hint']))
 
 
+class AdminSnapshot(object):
+    """
+    Snapshot of the column metadata of the admin views, that is persisted to disk, so the column
+    metadata does not need to be recomputed the first time each view is opened after a restart.
+
+    The snapshot is keyed by a hash of the application version and the source code of the
+    given packages.  When that key changes, the persisted snapshot is discarded, and the column
+    metadata is computed again.
+
+    The entries are keyed by the qualified name of the admin class, the entity it displays, if any,
+    and the field names, as the admin routes themselves are numbered in the order the admins are
+    registered, which can change between restarts.  Routes in the column metadata that start with the
+    route of the admin itself are stored relative to it.  The entries are validated lazily, when the
+    column metadata of an admin is requested : all routes the column metadata refers to should be bound
+    to an object of the same class as when the snapshot was taken.  Otherwise the entry is discarded.
+
+    :param path: the file in which the snapshot is persisted.
+    :param version: the version of the application, this should change whenever the column
+        metadata might change without a change in the source code, eg. because of a different language.
+    :param packages: the names of the packages of which the source code is part of the key.
+    """
+
+    format_version = 2
+
+    # Prefix of the routes that are stored relative to the route of the admin.
+    admin_prefix = '.'
+    # Keys of the delegate state that hold a route or a list of routes.
+    route_keys = ('admin_route', 'list_action', 'drop_action_route')
+    route_list_keys = ('action_routes',)
+
+    def __init__(self, path: str, version: str, packages=('camelot',)):
+        self.path = path
+        self.key = self.compute_key(version, packages)
+        # Column metadata per admin identity and field names, either loaded or computed since startup
+        self._entries = dict()
+        self._modified = False
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def compute_key(version: str, packages) -> str:
+        """
+        Compute a hash of the application version and the source code of the given packages.
+        """
+        key = hashlib.sha1(version.encode('utf-8'))
+        for package in packages:
+            module = __import__(package, fromlist=['__path__'])
+            for package_path in module.__path__:
+                for directory, subdirectories, filenames in sorted(os.walk(package_path)):
+                    subdirectories.sort()
+                    for filename in sorted(filenames):
+                        if filename.endswith('.py'):
+                            key.update(filename.encode('utf-8'))
+                            with open(os.path.join(directory, filename), 'rb') as source:
+                                key.update(source.read())
+        return key.hexdigest()
+
+    def load(self) -> bool:
+        """
+        Load the persisted snapshot, if it exists and was taken for the same key.
+
+        :return: True if the persisted snapshot was loaded.
+        """
+        try:
+            with open(self.path, 'rb') as snapshot_file:
+                data = orjson.loads(snapshot_file.read())
+        except (OSError, ValueError) as e:
+            LOGGER.info('Could not load admin snapshot {} : {}'.format(self.path, e))
+            return False
+        if data.get('format_version') != self.format_version or data.get('key') != self.key:
+            LOGGER.info('Discarded outdated admin snapshot {}'.format(self.path))
+            return False
+        self._entries.update(data['entries'])
+        LOGGER.info('Loaded admin snapshot {} with column metadata of {} views'.format(self.path, len(self._entries)))
+        return True
+
+    def save(self):
+        """
+        Persist the snapshot, if new column metadata was computed since it was loaded.
+        """
+        if not self._modified:
+            return
+        data = {'format_version': self.format_version, 'key': self.key, 'entries': self._entries}
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'wb') as snapshot_file:
+            snapshot_file.write(json_encoder.encode(data))
+        os.replace(temporary_path, self.path)
+        self._modified = False
+
+    @staticmethod
+    def _qualified_name(cls) -> str:
+        return '{0.__module__}.{0.__qualname__}'.format(cls)
+
+    @classmethod
+    def _entry_key(cls, admin, field_names) -> str:
+        entity = getattr(admin, 'entity', None)
+        return '|'.join([
+            cls._qualified_name(type(admin)),
+            cls._qualified_name(entity) if isinstance(entity, type) else '',
+            ','.join(field_names),
+        ])
+
+    @classmethod
+    def _map_routes(cls, columns, map_route):
+        """
+        Return a copy of the serialized column metadata, with each route in the delegate states replaced by
+        the result of map_route.  Only the keys of the delegate state known to hold routes are considered.
+        """
+        mapped_columns = []
+        for column in columns:
+            state = dict(column['delegate_state'])
+            for key in cls.route_keys:
+                if state.get(key) is not None:
+                    state[key] = map_route(state[key])
+            for key in cls.route_list_keys:
+                if state.get(key) is not None:
+                    state[key] = [map_route(route) for route in state[key]]
+            if state.get('list_actions') is not None:
+                state['list_actions'] = [
+                    dict(action, route=map_route(action['route'])) for action in state['list_actions']
+                ]
+            if state.get('list_actions_states') is not None:
+                state['list_actions_states'] = [
+                    [map_route(route), action_state] for route, action_state in state['list_actions_states']
+                ]
+            mapped_columns.append(dict(column, delegate_state=state))
+        return mapped_columns
+
+    def get_columns(self, admin, field_names) -> typing.Optional[typing.List[dict]]:
+        """
+        Get the serialized column metadata for the given fields of an admin.
+
+        :return: a list with the serialized metadata of each column, or None if no valid metadata is available.
+        """
+        entry_key = self._entry_key(admin, field_names)
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            admin_route = list(admin.get_admin_route())
+            routes = []
+            def absolute_route(route):
+                if len(route) and route[0] == self.admin_prefix:
+                    route = admin_route + route[1:]
+                routes.append(tuple(route))
+                return route
+            columns = self._map_routes(entry['columns'], absolute_route)
+            if self._valid_routes(routes, entry['classes']):
+                self.hits += 1
+                return columns
+            LOGGER.info('Discarded invalid admin snapshot entry for {}'.format(entry_key))
+            self._entries.pop(entry_key)
+            self._modified = True
+        self.misses += 1
+        return None
+
+    def set_columns(self, admin, field_names, columns: typing.List[dict]):
+        """
+        Store the serialized column metadata for the given fields of an admin.
+        The class of the object each route refers to is stored as well, so the entry can be validated after loading it.
+        """
+        admin_route = list(admin.get_admin_route())
+        routes = []
+        def relative_route(route):
+            routes.append(tuple(route))
+            if list(route[:len(admin_route)]) == admin_route:
+                return [self.admin_prefix, *route[len(admin_route):]]
+            return list(route)
+        relative_columns = self._map_routes(columns, relative_route)
+        classes = []
+        for obj, error in self._resolve_routes(routes):
+            if error is not None:
+                LOGGER.info('Admin snapshot entry of {} refers to an unbound route'.format(type(admin).__name__))
+                return
+            classes.append(self._qualified_name(type(obj)))
+        entry = {'columns': relative_columns, 'classes': classes}
+        self._entries[self._entry_key(admin, field_names)] = entry
+        self._modified = True
+
+    @staticmethod
+    def _resolve_routes(routes):
+        try:
+            return initial_naming_context.resolve_many(routes)
+        except NamingException as e:
+            return [(None, e)] * len(routes)
+
+    def _valid_routes(self, routes, classes) -> bool:
+        if len(routes) != len(classes):
+            return False
+        for (obj, error), class_name in zip(self._resolve_routes(routes), classes):
+            if error is not None or self._qualified_name(type(obj)) != class_name:
+                return False
+        return True
+
+
 class AdminRoute(object):
     """
     Server side register of admins being used on the client side.
+
+    .. attribute:: snapshot
+
+        An :class:`AdminSnapshot` with the column metadata of the admins, or None if the
+        column metadata should always be computed.  The snapshot is loaded when the connection
+        with the client is established, and saved when it is closed.
     """
 
     _admin_counter = itertools.count()
     _admin_routes = initial_naming_context.bind_new_context('admin')
+    snapshot = None
 
     @classmethod
     def _register_admin_route(cls, admin) -> Route:
@@ -45,9 +249,7 @@ class AdminRoute(object):
 
         """
         next_admin = cls._admin_counter.__next__()
-        try:
-            cls._admin_routes.resolve_context(admin.get_name())
-        except NameNotFoundException:
+        if cls._admin_routes.lookup_context(admin.get_name()) is not_found:
             cls._admin_routes.bind_new_context(admin.get_name())
         admin_context = cls._admin_routes.bind_new_context((admin.get_name(), str(next_admin)))
         admin_route = cls._admin_routes.bind((admin.get_name(), str(next_admin)), admin)
@@ -89,16 +291,12 @@ class AdminRoute(object):
         assert isinstance(admin_route, tuple)
         assert isinstance(field_name, str)
         assert admin_route in initial_naming_context
-        field_context = initial_naming_context.resolve_context((*admin_route, 'field'))
-        try:
-            context = field_context.resolve_context((field_name, 'actions'))
-        except NameNotFoundException:
+        field_context = initial_naming_context.resolve_context((*admin_route, 'field'), trusted=True)
+        context = field_context.lookup_context((field_name, 'actions'))
+        if context is not_found:
             context = field_context.bind_new_context(field_name).bind_new_context('actions')
-        try:
-            action_route = context.bind(action.get_name(), action)
-        except AlreadyBoundException:
-            action_route = context.get_qual_name(action.get_name())
-            assert action == context.resolve(action.get_name()), NamingContext.verbose_name(action_route) + ' registered before with a different action : ' + type(action).__name__
+        action_route, bound_action = context.try_bind(action.get_name(), action)
+        assert action == bound_action, NamingContext.verbose_name(action_route) + ' registered before with a different action : ' + type(action).__name__
         LOGGER.debug('Registered field action route: {} -> {}'.format(action_route, action))
         return action_route
 
@@ -108,12 +306,9 @@ class AdminRoute(object):
         # assert cls._validate_action_name(action)
         assert isinstance(admin_route, tuple)
         assert admin_route in initial_naming_context
-        context = initial_naming_context.resolve_context((*admin_route, 'list', 'actions'))
-        try:
-            action_route = context.bind(action.get_name(), action, immutable=True)
-        except AlreadyBoundException:
-            action_route = context.get_qual_name(action.get_name())
-            assert action == context.resolve(action.get_name()), NamingContext.verbose_name(action_route) + ' registered before with a different action : ' + type(action).__name__
+        context = initial_naming_context.resolve_context((*admin_route, 'list', 'actions'), trusted=True)
+        action_route, bound_action = context.try_bind(action.get_name(), action, immutable=True)
+        assert action == bound_action, NamingContext.verbose_name(action_route) + ' registered before with a different action : ' + type(action).__name__
         LOGGER.debug('Registered list action route: {} -> {}'.format(action_route, action))
         return action_route
 
@@ -122,12 +317,9 @@ class AdminRoute(object):
         assert cls._validate_action_name(action)
         assert isinstance(admin_route, tuple)
         assert admin_route in initial_naming_context
-        context = initial_naming_context.resolve_context((*admin_route, 'form', 'actions'))
-        try:
-            action_route = context.bind(action.get_name(), action)
-        except AlreadyBoundException:
-            action_route = context.get_qual_name(action.get_name())
-            assert action == context.resolve(action.get_name()), NamingContext.verbose_name(action_route) + ' registered before with a different action : ' + type(action).__name__
+        context = initial_naming_context.resolve_context((*admin_route, 'form', 'actions'), trusted=True)
+        action_route, bound_action = context.try_bind(action.get_name(), action)
+        assert action == bound_action, NamingContext.verbose_name(action_route) + ' registered before with a different action : ' + type(action).__name__
         LOGGER.debug('Registered form action route: {} -> {}'.format(action_route, action))
         return action_route
 
@@ -137,12 +329,9 @@ class AdminRoute(object):
         # assert cls._validate_action_name(action)
         assert isinstance(admin_route, tuple)
         assert admin_route in initial_naming_context
-        context = initial_naming_context.resolve_context((*admin_route, 'actions'))
-        try:
-            action_route = context.bind(action.get_name(), action, immutable=True)
-        except AlreadyBoundException:
-            action_route = context.get_qual_name(action.get_name())
-            assert action == context.resolve(action.get_name()), NamingContext.verbose_name(action_route) + ' registered before with a different action : ' + type(action).__name__
+        context = initial_naming_context.resolve_context((*admin_route, 'actions'), trusted=True)
+        action_route, bound_action = context.try_bind(action.get_name(), action, immutable=True)
+        assert action == bound_action, NamingContext.verbose_name(action_route) + ' registered before with a different action : ' + type(action).__name__
         LOGGER.debug('Registered action route: {} -> {}'.format(action_route, action))
         return action_route
 
@@ -1,10 +1,10 @@
 from itertools import count
 import logging
 
-import orjson
-
 from camelot.core.qt import QtCore, Qt
+from camelot.core.serializable import json_codec
 
+from ..admin.admin_route import AdminRoute
 from ..view.requests import AbstractClientConnection
 from ..view.responses import Ready
 
@@ -36,7 +36,8 @@ def get_window():
 
 def cpp_action_step(gui_context_name, name, step=QtCore.QByteArray()):
     response = get_root_backend().action_step(gui_context_name, name, step)
-    return orjson.loads(response.data())
+    # decode from the buffer of the QByteArray, instead of copying it to bytes first
+    return json_codec.decode(memoryview(response))
 
 
 connection_counter = count()
@@ -56,34 +57,46 @@ class PythonConnection(QtCore.QObject, AbstractClientConnection):
         self.dgc = self.backend.distributed_garbage_collector()
 
     def __enter__(self):
+        if AdminRoute.snapshot is not None:
+            AdminRoute.snapshot.load()
         self.dgc.request.connect(self.on_request)
         # queued, to allow the python code to store the returned gui_run of the action before
         # the actual action step results are sent back
         self.backend.action_runner().request.connect(self.on_request, Qt.ConnectionType.QueuedConnection)
         # as this connection is used for testing, don't provide a hint for an action to start
         # running, to keep the testing code in control of when actions start running
-        self.send_response(Ready(action_name=None, model_context=None))
+        # the action runner decodes the responses itself, so only json is offered, without compression
+        self.send_response(Ready(action_name=None, model_context=None, codecs=self.offered_codecs(), compressions=self.offered_compressions()))
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.backend.action_runner().waitForCompletion()
         self.dgc.request.disconnect(self.on_request)
         self.backend.action_runner().request.disconnect(self.on_request)
+        if AdminRoute.snapshot is not None:
+            AdminRoute.snapshot.save()
         return False
 
     @QtCore.qt_slot(QtCore.QByteArray)
     def on_request(self, request):
-        self._execute_serialized_request(request.data())
+        self._execute_serialized_request(memoryview(request))
 
-    @classmethod
-    def send_response(cls, response):
+    def send_response(self, response):
         backend = get_root_backend()
         action_runner = backend.action_runner()
-        action_runner.onResponse(QtCore.QByteArray(response._to_bytes()))
+        action_runner.onResponse(QtCore.QByteArray(self.serialize_response(response)))
+
+    def offered_codecs(self):
+        return [json_codec.name]
+
+    def offered_compressions(self):
+        return []
 
     @classmethod
     def send_action_step(cls, gui_context_name, step):
-        return cpp_action_step(gui_context_name, type(step).__name__, step._to_bytes())
+        result = cpp_action_step(gui_context_name, type(step).__name__, json_codec.encode_dataclass(step))
+        step.sent()
+        return result
 
     def has_cancel_request(self):
         return False
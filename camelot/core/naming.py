@@ -4,11 +4,18 @@ Inspired by the Corba/Java NamingContext.
 """
 from __future__ import annotations
 
+import bisect
 import collections
+import contextlib
 import datetime
 import decimal
 import functools
+import itertools
+import json
 import logging
+import sys
+import threading
+import time
 import typing
 import weakref
 
@@ -18,7 +25,7 @@ from camelot.core.qt import QtGui
 from camelot.core.utils import Arity
 
 from decimal import Decimal
-from sqlalchemy import inspect, orm
+from sqlalchemy import event, inspect, orm, tuple_
 
 from .singleton import Singleton
 
@@ -29,28 +36,70 @@ CompositeName = typing.Tuple[str, ...]
 # Unified name that can be either an atomic name or a composite name.
 Name = typing.Union[str, CompositeName]
 
+def _approximate_size(obj) -> int:
+    """
+    Approximate the number of bytes retained by a bound object.
+    This sums the size of the object and the size of its items for containers, or of its attributes for other objects,
+    including their attribute dictionaries, without following references any further.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        items = obj.values()
+    elif isinstance(obj, (tuple, list, set, frozenset)):
+        items = obj
+    else:
+        items = ()
+        if hasattr(obj, '__dict__'):
+            size += sys.getsizeof(obj.__dict__)
+            items = list(obj.__dict__.values())
+    for item in items:
+        size += sys.getsizeof(item)
+        if hasattr(item, '__dict__'):
+            size += sys.getsizeof(item.__dict__)
+    return size
+
 class BindingType(Enum):
 
     named_object = 1
     named_context = 2
 
+# Sentinel that is returned by the non-raising lookups of naming contexts when no binding is found.
+not_found = object()
+
 class NamingException(Exception):
+    """
+    Base class of the exceptions raised by naming contexts.
+    The text of the message is only formatted when it is used, as most of these exceptions
+    are caught without using their message.
+    """
 
     def __init__(self, message, *args, reason=None, **kwargs):
         assert isinstance(message, self.Message)
         assert reason is None or isinstance(reason, self.Message)
-        self.message_text = message.value.format(*args)
-        if reason is not None:
-            self.message_text = self.message_text + ': ' + reason.value.format(**kwargs)
-        super().__init__(self.message_text)
+        super().__init__(message, *args)
         self.message = message
         self.reason = reason
+        self._reason_kwargs = kwargs
+
+    @property
+    def message_text(self):
+        message_text = self.message.value.format(*self.args[1:])
+        if self.reason is not None:
+            message_text = message_text + ': ' + self.reason.value.format(**self._reason_kwargs)
+        return message_text
+
+    def __str__(self):
+        return self.message_text
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.message_text)
 
     class Message(Enum):
 
         unbound = 'Can not proceed: NamingContext is not bound to another context yet'
         invalid_binding_type = 'Invalid binding type, should be a member of `camelot.core.naming.BindingType'
         name_not_found = "Name '{}' does not identify a {} binding"
+        binding_expired = "Name '{}' identified a {} binding that has expired"
         already_bound = "A {} is already bound under the name '{}'"
         context_expected = 'Expected an instance of `camelot.core.naming.AbstractNamingContext`, instead got {0}'
         binding_immutable = 'Can not proceed: the {} binding under name {} is immutable'
@@ -91,6 +140,15 @@ class NameNotFoundException(NamingException):
         self.name = name
         self.binding_type = binding_type
 
+class ExpiredBindingException(NameNotFoundException):
+    """A NameNotFoundException that is thrown when the binding that was identified by a name has been evicted."""
+
+    def __init__(self, name, binding_type: BindingType):
+        assert binding_type in BindingType
+        NamingException.__init__(self, NamingException.Message.binding_expired, name, binding_type.name.replace('_', ' '))
+        self.name = name
+        self.binding_type = binding_type
+
 class AlreadyBoundException(NamingException):
     """
     A NamingException that is thrown if an attempt is made to bind an object
@@ -113,6 +171,11 @@ class AbstractNamingContext(object):
     or composite names (composed of multiple atomic parts), for binding through subcontexts using the recursive resolve.
     Internally, a context always uses the composite form of names, even when provided with atomic values.
 
+    Names composed by the server itself (e.g. using get_qual_name), or validated once at the request boundary,
+    can be passed as trusted names to the resolve, bind and unbind methods, using the trusted flag.
+    For trusted names, the per-level validation of the recursive resolve is skipped by the naming contexts,
+    except for the endpoint contexts, as their names are the values to resolve.
+
     Each context also keeps track of its fully qualified composite name, once it gets bound to another context.
     This composite name is always relative to the initial naming context :see: camelot.core.naming.InitialNamingContext.
     The context uses this name to compose and return the fully qualified name of created bindings,
@@ -159,10 +222,10 @@ class AbstractNamingContext(object):
             raise NamingException(NamingException.Message.invalid_name, reason=NamingException.Message.invalid_composite_name)
         elif len(name) == 0:
             raise NamingException(NamingException.Message.invalid_name, reason=NamingException.Message.multiary_name_expected)
-        elif not all([isinstance(name_part, str) for name_part in name]):
+        elif not all(isinstance(name_part, str) for name_part in name):
             raise NamingException(NamingException.Message.invalid_name, reason=NamingException.Message.invalid_composite_name_parts)
 
-    def get_composite_name(self, name: Name) -> CompositeName:
+    def get_composite_name(self, name: Name, trusted=False) -> CompositeName:
         """
         Utility method that returns the composite form of the given name (atomic or composite).
         The composite result will also be generally validated for use within this context,
@@ -171,12 +234,15 @@ class AbstractNamingContext(object):
         as its validation might differ from this one.
 
         :param name: the name to convert, atomic or composite.
+        :param trusted: flag that indicates the name is known to be valid, in which case the validation is skipped.
 
         :return: the composite form of the provided name.
 
         :raises:
             NamingException NamingException.Message.invalid_name: The supplied name or one of its composed part is invalid for this context.
         """
+        if trusted:
+            return (name,) if isinstance(name, str) else name
         if isinstance(name, str):
             self.validate_atomic_name(name)
             composite_name = tuple([name])
@@ -217,30 +283,32 @@ class AbstractNamingContext(object):
         name = self.get_composite_name(name)
         return (*self._name, *name)
 
-    def bind(self, name: Name, obj: object, immutable=False) -> CompositeName:
+    def bind(self, name: Name, obj: object, immutable=False, trusted=False) -> CompositeName:
         """
         Creates a binding of a name and an object in the naming context.
 
         :param name: Name of the object, atomic or composite, and relative to this naming context.
         :param obj: The object to bind with the given name
         :param immutable: flag that indicates whether the created binding should be immutable.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
 
         :return: The fully qualified composite name of the resulting binding, relative to the initial naming context.
         """
         raise NotImplementedError
 
-    def rebind(self, name: Name, obj) -> CompositeName:
+    def rebind(self, name: Name, obj, trusted=False) -> CompositeName:
         """
         Creates a binding of a name and an object in the naming context even if the name is already bound in the context.
 
         :param name: Name of the object, atomic or composite, and relative to this naming context.
         :param obj: The object to bind with the given name
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
 
         :return: The fully qualified composite name of the resulting binding, relative to the initial naming context.
         """
         raise NotImplementedError
 
-    def bind_context(self, name: Name, context: AbstractNamingContext, immutable=False) -> CompositeName:
+    def bind_context(self, name: Name, context: AbstractNamingContext, immutable=False, trusted=False) -> CompositeName:
         """
         Names an object that is a naming context.
         Naming contexts that are bound using bind_context() participate in recursive name resolution when composite names are passed to be resolved.
@@ -248,17 +316,19 @@ class AbstractNamingContext(object):
         :param name: Name of the object, atomic or composite, and relative to this naming context.
         :param obj: The AbstractNamingContext obj to bind with the given name
         :param immutable: flag that indicates whether the created context binding should be immutable.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
 
         :return: The fully qualified composite name of the resulting binding, relative to the initial naming context.
         """
         raise NotImplementedError
 
-    def rebind_context(self, name: Name, context: AbstractNamingContext) -> CompositeName:
+    def rebind_context(self, name: Name, context: AbstractNamingContext, trusted=False) -> CompositeName:
         """
         Creates a binding of a name and a naming context in the naming context even if the name is already bound in the context.
 
         :param name: Name of the object, atomic or composite, and relative to this naming context.
         :param obj: The AbstractNamingContext obj to bind with the given name
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
 
         :return: The fully qualified composite name of the resulting binding, relative to the initial naming context.
         """
@@ -283,38 +353,153 @@ class AbstractNamingContext(object):
         """
         raise NotImplementedError
 
-    def unbind(self, name: Name) -> None:
+    def unbind(self, name: Name, trusted=False) -> None:
         """
         Removes a named binding from the context.
 
         :param name: Name of the object, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
         """
         raise NotImplementedError
 
-    def unbind_context(self, name: Name) -> None:
+    def unbind_context(self, name: Name, trusted=False) -> None:
         """
         Removes a name context binding from the context.
 
         :param name: Name of the context, atomic or composite.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
         """
         raise NotImplementedError
 
-    def resolve(self, name: Name) -> object:
+    def resolve(self, name: Name, trusted=False) -> object:
         """
         Retrieve the object bound to a name in the context. The given name must exactly match the bound name.
 
         :param name: Name of the object, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
         """
         raise NotImplementedError
 
-    def resolve_context(self, name: Name) -> AbstractNamingContext:
+    def resolve_context(self, name: Name, trusted=False) -> AbstractNamingContext:
         """
         Retrieve the context bound to a name in the context. The given name must exactly match the bound name.
 
         :param name: Name of the context, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
+        """
+        raise NotImplementedError
+
+    def lookup(self, name: Name, default=not_found, trusted=False) -> object:
+        """
+        Retrieve the object bound to a name in the context, or the given default if no binding was found.
+        This is the non-raising counterpart of `resolve`, for when a missing binding is part of the normal control flow.
+        This default implementation catches the exception raised by `resolve`, subclasses can implement a more efficient strategy.
+
+        :param name: Name of the object, atomic or composite, and relative to this naming context.
+        :param default: the object to return if no binding was found, defaults to the `camelot.core.naming.not_found` sentinel.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
+
+        :raises:
+            NamingException NamingException.Message.invalid_name: when the name is invalid.
+        """
+        try:
+            return self.resolve(name, trusted=trusted)
+        except NameNotFoundException:
+            return default
+
+    def lookup_context(self, name: Name, default=not_found, trusted=False) -> AbstractNamingContext:
+        """
+        Retrieve the context bound to a name in the context, or the given default if no binding was found.
+        This is the non-raising counterpart of `resolve_context`.
+
+        :param name: Name of the context, atomic or composite, and relative to this naming context.
+        :param default: the object to return if no binding was found, defaults to the `camelot.core.naming.not_found` sentinel.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
+
+        :raises:
+            NamingException NamingException.Message.invalid_name: when the name is invalid.
+        """
+        try:
+            return self.resolve_context(name, trusted=trusted)
+        except NameNotFoundException:
+            return default
+
+    def try_bind(self, name: Name, obj: object, immutable=False, trusted=False) -> typing.Tuple[CompositeName, object]:
+        """
+        Bind an object under a name in the context, unless an object is bound under that name already.
+        This is the non-raising counterpart of `bind`.
+
+        :param name: Name of the object, atomic or composite, and relative to this naming context.
+        :param obj: The object to bind with the given name
+        :param immutable: flag that indicates whether the created binding should be immutable.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped.
+
+        :return: a tuple of the fully qualified composite name of the binding, and the object bound under that name,
+            which is the given object if it was bound, or the object that was bound before.
         """
         raise NotImplementedError
 
+    def resolve_many(self, names: typing.Iterable[Name], trusted=False) -> typing.List[typing.Tuple[object, typing.Optional[NamingException]]]:
+        """
+        Retrieve the objects bound to multiple names in the context.
+        Instead of raising an exception for the first name that could not be resolved, the error is reported per name.
+        This default implementation resolves the names one by one, subclasses can implement a more efficient strategy.
+
+        :param names: Names of the objects, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the names are known to be valid, so their validation can be skipped.
+
+        :return: a list with, for each name in the order of the given names, a tuple of the resolved object
+            and None, or of None and the `camelot.core.naming.NamingException` raised for that name.
+        """
+        results = []
+        for name in names:
+            try:
+                results.append((self.resolve(name, trusted=trusted), None))
+            except NamingException as e:
+                results.append((None, e))
+        return results
+
+    def bind_many(self, bindings: typing.Iterable[typing.Tuple[Name, object]], immutable=False, trusted=False) -> typing.List[typing.Tuple[typing.Optional[CompositeName], typing.Optional[NamingException]]]:
+        """
+        Creates multiple bindings of names and objects in the context.
+        Instead of raising an exception for the first binding that could not be created, the error is reported per binding.
+        This default implementation binds the objects one by one, subclasses can implement a more efficient strategy.
+
+        :param bindings: tuples of the name, atomic or composite and relative to this naming context, and the object to bind with that name.
+        :param immutable: flag that indicates whether the created bindings should be immutable.
+        :param trusted: flag that indicates the names are known to be valid, so their validation can be skipped.
+
+        :return: a list with, for each binding in the order of the given bindings, a tuple of the fully qualified composite name
+            of the resulting binding and None, or of None and the `camelot.core.naming.NamingException` raised for that binding.
+        """
+        results = []
+        for name, obj in bindings:
+            try:
+                results.append((self.bind(name, obj, immutable=immutable, trusted=trusted), None))
+            except NamingException as e:
+                results.append((None, e))
+        return results
+
+    def unbind_many(self, names: typing.Iterable[Name], trusted=False) -> typing.List[typing.Optional[NamingException]]:
+        """
+        Removes multiple named bindings from the context.
+        Instead of raising an exception for the first name that could not be unbound, the error is reported per name.
+        This default implementation unbinds the names one by one, subclasses can implement a more efficient strategy.
+
+        :param names: Names of the objects, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the names are known to be valid, so their validation can be skipped.
+
+        :return: a list with, for each name in the order of the given names, None or the `camelot.core.naming.NamingException` raised for that name.
+        """
+        results = []
+        for name in names:
+            try:
+                self.unbind(name, trusted=trusted)
+                results.append(None)
+            except NamingException as e:
+                results.append(e)
+        return results
+
     def list(self):
         """
         Returns the set of bindings in the naming context.
@@ -323,9 +508,8 @@ class AbstractNamingContext(object):
 
     def __contains__(self, name: Name):
         try:
-            self.resolve(name)
-            return True
-        except (NameNotFoundException, KeyError):
+            return self.lookup(name) is not not_found
+        except KeyError:
             return False
 
     @classmethod
@@ -335,7 +519,7 @@ class AbstractNamingContext(object):
     @check_bounded
     def dump_names(self):
         for name in self.list():
-            LOGGER.info(self.verbose_name(*self._name, name))
+            LOGGER.info(self.verbose_name((*self._name, *name)))
 
 class AbstractBindingStorage(object):
     """
@@ -380,6 +564,15 @@ class AbstractBindingStorage(object):
         """
         raise NotImplementedError
 
+    def lookup(self, name, default):
+        """
+        Retrieve the object bound under the given name, or the given default if no binding was found.
+
+        :param name: name under which the object should have been bound.
+        :param default: the object to return if no binding was found.
+        """
+        raise NotImplementedError
+
     def copy(self):
         """
         Return a copy of this binding storage.
@@ -399,35 +592,49 @@ class BindingStorage(AbstractBindingStorage):
     """
     Default binding storage implementation that stores the bindings in a
     name-to-object dictionary.
+
+    Retrieving and listing bindings is safe while other threads add or remove bindings,
+    but adding and removing bindings should be serialized by the naming context that owns the storage.
     """
 
+    # Flag that indicates whether the bindings in this storage can be
+    # registered in the flat index of the initial naming context.
+    indexable = True
+
     def __init__(self, binding_type):
         self.binding_type = binding_type
         self._bindings = {}
-        self._immutable = []
+        self._immutable = set()
 
     def add(self, name, obj, immutable=False):
         if name in self._bindings and name in self._immutable:
             raise ImmutableBindingException(self.binding_type, name)
         self._bindings[name] = obj
         if immutable:
-            self._immutable.append(name)
+            self._immutable.add(name)
 
     def remove(self, name):
-        if name not in self._bindings:
-            raise NameNotFoundException(name, self.binding_type)
-        if name in self._immutable:
+        if name in self._immutable and name in self._bindings:
             raise ImmutableBindingException(self.binding_type, name)
-        return self._bindings.pop(name)
+        # Use a single lookup, as weakly referenced bindings can disappear at any time.
+        try:
+            return self._bindings.pop(name)
+        except KeyError:
+            raise NameNotFoundException(name, self.binding_type)
 
     def get(self, name):
-        if name not in self._bindings:
+        # Use a single lookup, so the binding can not be removed between checking and retrieving it.
+        try:
+            return self._bindings[name]
+        except KeyError:
             raise NameNotFoundException(name, self.binding_type)
-        return self._bindings[name]
+
+    def lookup(self, name, default):
+        return self._bindings.get(name, default)
 
     def copy(self):
         duplicate = self.__class__(self.binding_type)
-        for name, obj in self._bindings.items():
+        for name, obj in self._snapshot():
             duplicate.add(name, obj, immutable=name in self._immutable)
         return duplicate
 
@@ -435,9 +642,15 @@ class BindingStorage(AbstractBindingStorage):
         """
         Return the names of the bindings as valid names (tuples)
         """
-        for key in self._bindings.keys():
+        for key, _obj in self._snapshot():
             yield (key,)
 
+    def _snapshot(self):
+        """
+        Return a list of the names and objects of the bindings, as bindings may be added or removed while iterating.
+        """
+        return list(self._bindings.items())
+
     def __contains__(self, name):
         return name in self._bindings
 
@@ -452,25 +665,311 @@ class WeakValueBindingStorage(BindingStorage):
 
     This means that object bindings can be removed in two ways, either explicitly using the remove functionality, or implicitly by the garbage collection.
     Additionally, this also means that with this storage backend, immutable bindings can get removed by the latter process.
+    As the garbage collection does not notify the naming contexts, these bindings are not registered in the flat index of the initial naming context.
     """
 
+    indexable = False
+
     def __init__(self, binding_type):
         super().__init__(binding_type)
         self._bindings = weakref.WeakValueDictionary()
 
+    def _snapshot(self):
+        # Iterating a WeakValueDictionary is not safe while other threads modify it,
+        # so copy its underlying dictionary of weak references at once.
+        snapshot = []
+        for name, ref in self._bindings.data.copy().items():
+            obj = ref()
+            if obj is not None:
+                snapshot.append((name, obj))
+        return snapshot
+
+class UnindexedBindingStorage(BindingStorage):
+    """
+    Binding storage implementation of which the bindings are not registered in the flat index of the initial naming context,
+    so they are always retrieved through the naming context that owns the storage.
+    """
+
+    indexable = False
+
+class LRUBindingStorage(BindingStorage):
+    """
+    Binding storage implementation that keeps its bindings in least recently used order,
+    by moving a binding to the end each time it gets retrieved.
+
+    Bindings can be expired, which removes them like the remove functionality, but remembers their names,
+    so retrieving them afterwards raises an ´camelot.core.naming.ExpiredBindingException´ instead of a plain
+    ´camelot.core.naming.NameNotFoundException´.
+
+    :param expired_entries: the maximum number of names of expired bindings that are remembered.
+    """
+
+    def __init__(self, binding_type, expired_entries=1000):
+        super().__init__(binding_type)
+        self._bindings = collections.OrderedDict()
+        self._expired = collections.OrderedDict()
+        self.expired_entries = expired_entries
+
+    def add(self, name, obj, immutable=False):
+        super().add(name, obj, immutable)
+        self._expired.pop(name, None)
+
+    def get(self, name):
+        try:
+            obj = self._bindings[name]
+        except KeyError:
+            if name in self._expired:
+                raise ExpiredBindingException(name, self.binding_type)
+            raise NameNotFoundException(name, self.binding_type)
+        # The binding might have been removed by another thread in the meantime.
+        with contextlib.suppress(KeyError):
+            self._bindings.move_to_end(name)
+        return obj
+
+    def lookup(self, name, default):
+        obj = self._bindings.get(name, not_found)
+        if obj is not_found:
+            return default
+        with contextlib.suppress(KeyError):
+            self._bindings.move_to_end(name)
+        return obj
+
+    def copy(self):
+        duplicate = self.__class__(self.binding_type, self.expired_entries)
+        for name, obj in self._snapshot():
+            duplicate.add(name, obj, immutable=name in self._immutable)
+        return duplicate
+
+    def expire(self, name):
+        """
+        Remove the binding under the given name and remember it as expired.
+
+        :raises:
+            NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
+            ImmutableBindingException NamingException.Message.binding_immutable: when trying to expire an immutable binding.
+        """
+        obj = self.remove(name)
+        self._expired[name] = None
+        if len(self._expired) > self.expired_entries:
+            self._expired.popitem(last=False)
+        return obj
+
+    def least_recently_used(self):
+        """
+        Return the name of the least recently used mutable binding, or None if there is no such binding.
+        """
+        for name in list(self._bindings):
+            if name not in self._immutable:
+                return name
+
+class TieredBindingStorage(LRUBindingStorage):
+    """
+    Binding storage implementation with two tiers : a strong tier that keeps the most recently used objects alive,
+    in front of a weak tier that only keeps weak references to the objects.
+
+    When the strong tier exceeds its maximum number of bindings or its byte budget, the least recently used mutable
+    bindings are demoted to the weak tier, where the objects remain resolvable as long as they are referenced elsewhere.
+    Retrieving a demoted binding promotes it to the strong tier again.
+    Objects that can not be weakly referenced are dropped instead of demoted, and are remembered as expired.
+    The size of the objects is approximated with ´camelot.core.naming._approximate_size´ when they enter the strong tier.
+
+    The demotion is left to the naming context that owns the storage, as demoted bindings can disappear
+    at any time, and should thus no longer be registered in the flat index of the initial naming context.
+
+    :param max_bindings: the maximum number of bindings in the strong tier, or None if unlimited.
+    :param max_bytes: the maximum approximate number of bytes held by the strong tier, or None if unlimited.
+    """
+
+    def __init__(self, binding_type, max_bindings=256, max_bytes=None, expired_entries=1000):
+        super().__init__(binding_type, expired_entries)
+        self.max_bindings = max_bindings
+        self.max_bytes = max_bytes
+        self._weak = weakref.WeakValueDictionary()
+        # Names of the objects in the strong tier by their id, which is unique as long as
+        # they are kept alive by the strong tier.
+        self._names = dict()
+        self._sizes = dict()
+        self._bytes_held = 0
+        # Lock that serializes moving bindings between the tiers, as promotions happen while resolving,
+        # which is not serialized by the naming context.
+        self._tier_lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.promoted = 0
+        self.demoted = 0
+        self.dropped = 0
+
+    def add(self, name, obj, immutable=False):
+        with self._tier_lock:
+            if name in self._immutable and name in self:
+                raise ImmutableBindingException(self.binding_type, name)
+            self._forget(name)
+            super().add(name, obj, immutable)
+            self._bindings.move_to_end(name)
+            self._remember(name, obj)
+            self._weak.pop(name, None)
+
+    def remove(self, name):
+        with self._tier_lock:
+            if name in self._immutable and name in self:
+                raise ImmutableBindingException(self.binding_type, name)
+            self._forget(name)
+            with contextlib.suppress(KeyError):
+                return self._bindings.pop(name)
+            try:
+                return self._weak.pop(name)
+            except KeyError:
+                raise NameNotFoundException(name, self.binding_type)
+
+    def get(self, name):
+        obj = self.lookup(name, not_found)
+        if obj is not_found:
+            if name in self._expired:
+                raise ExpiredBindingException(name, self.binding_type)
+            raise NameNotFoundException(name, self.binding_type)
+        return obj
+
+    def lookup(self, name, default):
+        obj = self._bindings.get(name, not_found)
+        if obj is not not_found:
+            # Moving a binding while another thread demotes the least recently used bindings
+            # could reorder them halfway the demotion, so it is serialized with the moves between the tiers.
+            with self._tier_lock:
+                with contextlib.suppress(KeyError):
+                    self._bindings.move_to_end(name)
+                self.hits += 1
+            return obj
+        obj = self._weak.get(name, not_found)
+        if obj is not_found:
+            self.misses += 1
+            return default
+        with self._tier_lock:
+            # Add the object to the strong tier before removing it from the weak tier,
+            # so it remains retrievable by other threads.
+            if self._bindings.setdefault(name, obj) is obj and name not in self._sizes:
+                self._remember(name, obj)
+                self._weak.pop(name, None)
+                self.promoted += 1
+        return obj
+
+    def name_of(self, obj) -> typing.Optional[str]:
+        """
+        Return the name under which the given object is bound in the strong tier, or None if it is not bound there.
+        """
+        name = self._names.get(id(obj))
+        if name is not None and self._bindings.get(name, not_found) is obj:
+            return name
+
+    def _remember(self, name, obj):
+        """
+        Helper method that keeps track of the name and size of an object that entered the strong tier.
+        """
+        size = _approximate_size(obj)
+        self._names[id(obj)] = name
+        self._sizes[name] = size
+        self._bytes_held += size
+
+    def _forget(self, name):
+        """
+        Helper method that discards the name and size of the object bound under the given name in the strong tier.
+        """
+        obj = self._bindings.get(name, not_found)
+        if obj is not not_found and self._names.get(id(obj)) == name:
+            del self._names[id(obj)]
+        self._bytes_held -= self._sizes.pop(name, 0)
+
+    @property
+    def bytes_held(self) -> int:
+        """
+        The approximate number of bytes held by the strong tier.
+        """
+        return self._bytes_held
+
+    def over_budget(self) -> bool:
+        """
+        :return: True if the strong tier exceeds its maximum number of bindings or its byte budget.
+        """
+        if self.max_bindings is not None and len(self._bindings) > self.max_bindings:
+            return True
+        return self.max_bytes is not None and self._bytes_held > self.max_bytes
+
+    def least_recently_used(self):
+        # Avoid copying the names of all bindings when the least recently used binding is mutable.
+        with contextlib.suppress(StopIteration, RuntimeError):
+            name = next(iter(self._bindings))
+            if name not in self._immutable:
+                return name
+        return super().least_recently_used()
+
+    def demote(self) -> typing.List[str]:
+        """
+        Demote the least recently used mutable bindings until the strong tier is within its limits.
+
+        :return: the names of the demoted and dropped bindings.
+        """
+        names = []
+        with self._tier_lock:
+            while self.over_budget():
+                name = self.least_recently_used()
+                if name is None:
+                    break
+                names.append(name)
+                obj = self._bindings[name]
+                self._forget(name)
+                try:
+                    # Add the object to the weak tier before removing it from the strong tier,
+                    # so it remains retrievable by other threads.
+                    self._weak[name] = obj
+                except TypeError:
+                    self.expire(name)
+                    self.dropped += 1
+                    continue
+                del self._bindings[name]
+                self.demoted += 1
+        return names
+
+    def copy(self):
+        duplicate = self.__class__(self.binding_type, self.max_bindings, self.max_bytes, self.expired_entries)
+        for name, obj in self._snapshot():
+            duplicate.add(name, obj, immutable=name in self._immutable)
+        return duplicate
+
+    def _snapshot(self):
+        bindings = list(self._weak.data.items())
+        snapshot = [(name, ref()) for name, ref in bindings]
+        snapshot = [(name, obj) for name, obj in snapshot if obj is not None]
+        snapshot.extend(self._bindings.items())
+        return snapshot
+
+    def __contains__(self, name):
+        return name in self._bindings or name in self._weak
+
+    def __len__(self):
+        return len(self._bindings) + len(self._weak)
+
 class NamingContext(AbstractNamingContext):
     """
     Represents a naming context, which consists of a set of name-to-object bindings.
     It implements the AbstractNamingContext interface to provide methods for adding, examining and updating these bindings,
     as well as to define subcontexts that take part in recursive resolving of names.
+
+    Naming contexts can be used from multiple threads : adding and removing bindings is serialized by a lock per context,
+    while resolving names does not acquire any lock.
     """
 
     def __init__(self):
         super().__init__()
         self._bindings = {btype: BindingStorage(btype) for btype in BindingType}
+        # Lock that serializes the modifications of the bindings of this context,
+        # reentrant as specialized contexts extend those modifications.
+        self._lock = threading.RLock()
+        # Flat index of the initial naming context, that maps the fully qualified names
+        # of the bindings in this context and its subcontexts to their storage and key.
+        # This is shared with the subcontexts once this context is bound to the initial naming context.
+        self._index = None
 
     @AbstractNamingContext.check_bounded
-    def bind(self, name: Name, obj: object, immutable=False) -> CompositeName:
+    def bind(self, name: Name, obj: object, immutable=False, trusted=False) -> CompositeName:
         """
         Bind an object under a name in this NamingContext.
         If the name is atomic or composed out of a single atomic part, the given object will be bound with that atomic name to this NamingContext.
@@ -483,6 +982,7 @@ class NamingContext(AbstractNamingContext):
         :param obj: the object reference to be bound.
         :param immutable: flag that indicates whether the object should be bound as immutable,
          which will throw a `camelot.core.naming.ImmutableBindingException` when trying to mutate the binding afterwards
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
 
         :return: the full qualified composite name of the bound object, relative to the initial naming context.
 
@@ -492,10 +992,10 @@ class NamingContext(AbstractNamingContext):
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the supplied name.
             AlreadyBoundException NamingException.Message.already_bound : An object is already bound under the supplied name.
         """
-        return self._add_binding(name, obj, False, BindingType.named_object, immutable)
+        return self._add_binding(name, obj, False, BindingType.named_object, immutable, trusted)
 
     @AbstractNamingContext.check_bounded
-    def rebind(self, name: Name, obj: object) -> CompositeName:
+    def rebind(self, name: Name, obj: object, trusted=False) -> CompositeName:
         """
         Bind an object under a name in this NamingContext.
         If the name is atomic or composed out of a single atomic part, the given object will be rebound with that atomic name to this NamingContext.
@@ -506,6 +1006,7 @@ class NamingContext(AbstractNamingContext):
 
         :param name: name under which the object will be bound, atomic or composite, and relative to this naming context.
         :param obj: the object reference to be bound.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
 
         :return: the full qualified composite name of the bound object, relative to the initial naming context.
 
@@ -515,10 +1016,10 @@ class NamingContext(AbstractNamingContext):
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the supplied name.
             ImmutableBindingException NamingException.Message.binding_immutable: when trying to rebind an immutable object binding.
         """
-        return self._add_binding(name, obj, True, BindingType.named_object)
+        return self._add_binding(name, obj, True, BindingType.named_object, trusted=trusted)
 
     @AbstractNamingContext.check_bounded
-    def bind_context(self, name: Name, context: AbstractNamingContext, immutable=False) -> CompositeName:
+    def bind_context(self, name: Name, context: AbstractNamingContext, immutable=False, trusted=False) -> CompositeName:
         """
         Bind a NamingContext under a name in this NamingContext.
         If the name is atomic or composed out of a single atomic part, the given context will be bound with that atomic name to this NamingContext.
@@ -530,6 +1031,7 @@ class NamingContext(AbstractNamingContext):
         :param context: the NamingContext object reference to be bound.
         :param immutable: flag that indicates whether the context should be bound as immutable,
          which will throw a `camelot.core.naming.ImmutableBindingException` when trying to mutate the binding afterwards
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
 
         :return: the full qualified name of the bound object across the whole context hierarchy.
 
@@ -542,10 +1044,10 @@ class NamingContext(AbstractNamingContext):
         """
         if not isinstance(context, AbstractNamingContext):
             raise NamingException(NamingException.Message.context_expected, context)
-        return self._add_binding(name, context, False, BindingType.named_context, immutable)
+        return self._add_binding(name, context, False, BindingType.named_context, immutable, trusted)
 
     @AbstractNamingContext.check_bounded
-    def rebind_context(self, name: Name, context: AbstractNamingContext) -> CompositeName:
+    def rebind_context(self, name: Name, context: AbstractNamingContext, trusted=False) -> CompositeName:
         """
         Bind a NamingContext under a name in this NamingContext.
         If the name is atomic or composed out of a single atomic part, the given context will be rebound with that atomic name to this NamingContext.
@@ -555,6 +1057,7 @@ class NamingContext(AbstractNamingContext):
 
         :param name: name under which the object will be bound, atomic or composite, and relative to this naming context.
         :param context: the NamingContext object reference to be bound.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
 
         :return: the full qualified composite name of the bound object, relative to the initial naming context.
 
@@ -568,7 +1071,7 @@ class NamingContext(AbstractNamingContext):
         """
         if not isinstance(context, AbstractNamingContext):
             raise NamingException(NamingException.Message.context_expected, context)
-        return self._add_binding(name, context, True, BindingType.named_context)
+        return self._add_binding(name, context, True, BindingType.named_context, trusted=trusted)
 
     def new_context(self) -> NamingContext:
         """
@@ -598,7 +1101,7 @@ class NamingContext(AbstractNamingContext):
         return context
 
     @AbstractNamingContext.check_bounded
-    def _add_binding(self, name: Name, obj, rebind: bool, binding_type: BindingType, immutable=False) -> CompositeName:
+    def _add_binding(self, name: Name, obj, rebind: bool, binding_type: BindingType, immutable=False, trusted=False) -> CompositeName:
         """
         Helper method that implements the addition of all types of bindings.
         It resolves the name to make sure no binding exists already (in case of a bind and bind_context).
@@ -610,6 +1113,7 @@ class NamingContext(AbstractNamingContext):
         :param rebind: flag indicating if an existing binding should be replaced or not.
         :param binding_type: the type of the binding to add, a member of `camelot.core.orm.BindingType`.
         :param immutable: flag that indicates whether the binding should be added as immutable, which will throw a `camelot.core.naming.ImmutableBindingException` when trying to mutate it afterwards
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped at every level.
 
         :return: the full qualified composite name of the bound object, relative to the initial naming context.
 
@@ -621,36 +1125,65 @@ class NamingContext(AbstractNamingContext):
             NamingException NamingException.Message.invalid_binding_type: if the binding type is not a valid BindingType enum member.
             ImmutableBindingException NamingException.Message.binding_immutable: when trying to rebind an immutable binding.
         """
-        name = self.get_composite_name(name)
+        name = self.get_composite_name(name, trusted)
         if binding_type not in BindingType:
             raise NamingException(NamingException.Message.invalid_binding_type)
         if len(name) == 1:
+            return self._add_atomic_binding(name[0], obj, rebind, binding_type, immutable)
+        else:
+            context = self._bindings[BindingType.named_context].get(name[0])
+            if binding_type == BindingType.named_context:
+                if rebind:
+                    return context.rebind_context(name[1:], obj, trusted=trusted)
+                return context.bind_context(name[1:], obj, trusted=trusted)
+            elif binding_type == BindingType.named_object:
+                if rebind:
+                    return context.rebind(name[1:], obj, trusted=trusted)
+                return context.bind(name[1:], obj, trusted=trusted)
+
+    def _add_atomic_binding(self, name: str, obj, rebind: bool, binding_type: BindingType, immutable=False) -> CompositeName:
+        """
+        Helper method that adds a binding under the given atomic name to the storage of this NamingContext.
+        Specialized naming contexts can extend this method to keep track of the bindings that are added to them.
+
+        :return: the full qualified composite name of the bound object, relative to the initial naming context.
+        """
+        with self._lock:
+            # This context might have been unbound by another thread since it was resolved.
+            context_name = self._name
+            if context_name is None:
+                raise UnboundException()
+            storage = self._bindings[binding_type]
             # If binding, check if their exists one already
-            if name[0] in self._bindings[binding_type] and not rebind:
-                raise AlreadyBoundException(name[0], binding_type)
+            previous = None
+            replaced = False
+            if name in storage:
+                if not rebind:
+                    raise AlreadyBoundException(name, binding_type)
+                previous = storage.get(name)
+                replaced = True
             # Add the object and its mutability to the registry for the given binding_type.
-            self._bindings[binding_type].add(name[0], obj, immutable)
+            storage.add(name, obj, immutable)
             # Determine the full qualified named of the bound object (extending that of this NamingContext).
-            qual_name = self.get_qual_name(name[0])
+            qual_name = (*context_name, name)
             # If the object is a NamingContext, assign the qualified name.
             if binding_type == BindingType.named_context:
+                # The bindings of a replaced context should no longer be resolvable through the index.
+                if isinstance(previous, NamingContext) and previous is not obj:
+                    previous._unindex()
                 if obj._name is not None:
-                    raise AlreadyBoundException(name[0], binding_type)
+                    raise AlreadyBoundException(name, binding_type)
                 obj._name = qual_name
+                if isinstance(obj, NamingContext):
+                    obj._index = self._index
+            if self._index is not None and storage.indexable:
+                self._index[binding_type][qual_name] = (storage, name)
+            if _statistics is not None:
+                _statistics.record_binding(context_name, replaced)
             return qual_name
-        else:
-            context = self._bindings[BindingType.named_context].get(name[0])
-            if binding_type == BindingType.named_context:
-                if rebind:
-                    return context.rebind_context(name[1:], obj)
-                return context.bind_context(name[1:], obj)
-            elif binding_type == BindingType.named_object:
-                if rebind:
-                    return context.rebind(name[1:], obj)
-                return context.bind(name[1:], obj)
 
     @AbstractNamingContext.check_bounded
-    def unbind(self, name: Name) -> None:
+    def unbind(self, name: Name, trusted=False) -> None:
         """
         Removes an object binding from this NamingContext.
         If the name is atomic, or composed of only a single atomic part, the object binding under the given name will be removed from this NamingContext.
@@ -658,6 +1191,7 @@ class NamingContext(AbstractNamingContext):
         and the remaining parts are resolved in that resulting context.
 
         :param name: name under which the object should have been bound, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
 
         :raises:
             UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
@@ -665,10 +1199,10 @@ class NamingContext(AbstractNamingContext):
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
             ImmutableBindingException NamingException.Message.binding_immutable: when trying to unbind an immutable object binding.
         """
-        self._remove_binding(name, BindingType.named_object)
+        self._remove_binding(name, BindingType.named_object, trusted)
 
     @AbstractNamingContext.check_bounded
-    def unbind_context(self, name: Name) -> None:
+    def unbind_context(self, name: Name, trusted=False) -> None:
         """
         Remove a context binding from this NamingContext.
         If the name is atomic, or composed of only a single atomic part, the context binding under the given name will be removed from this NamingContext.
@@ -677,6 +1211,7 @@ class NamingContext(AbstractNamingContext):
         As a result of this removal, the found NamingContext will get unbound and not be usable unless its reassociated.
 
         :param name: name under which the context should have been bound, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
 
         :raises:
             UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
@@ -684,10 +1219,10 @@ class NamingContext(AbstractNamingContext):
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
             ImmutableBindingException NamingException.Message.binding_immutable: when trying to unbind an immutable context binding.
         """
-        self._remove_binding(name, BindingType.named_context)
+        self._remove_binding(name, BindingType.named_context, trusted)
 
     @AbstractNamingContext.check_bounded
-    def _remove_binding(self, name: Name, binding_type: BindingType) -> None:
+    def _remove_binding(self, name: Name, binding_type: BindingType, trusted=False) -> None:
         """
         Helper method that supports removing all types of bindings from this NamingContext.
         If the name is atomic, or composed of only a single atomic part, the binding under the given name will be removed from this NamingContext.
@@ -696,6 +1231,7 @@ class NamingContext(AbstractNamingContext):
 
         :param name: name of the binding to remove, atomic or composite, and relative to this naming context.
         :param binding_type: the type of the binding to remove, a member of `camelot.core.orm.BindingType.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped at every level.
 
         :raises:
             UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
@@ -704,27 +1240,50 @@ class NamingContext(AbstractNamingContext):
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
             ImmutableBindingException NamingException.Message.binding_immutable: when trying to remove an immutable binding.
         """
-        name = self.get_composite_name(name)
+        name = self.get_composite_name(name, trusted)
         if binding_type not in BindingType:
             raise NamingException(NamingException.Message.invalid_binding_type)
         if len(name) == 1:
-            obj = self._bindings[binding_type].remove(name[0])
-            if binding_type == BindingType.named_context:
-                obj._name = None
+            self._remove_atomic_binding(name[0], binding_type)
         else:
             context = self._bindings[BindingType.named_context].get(name[0])
             if binding_type == BindingType.named_context:
-                context.unbind_context(name[1:])
+                context.unbind_context(name[1:], trusted=trusted)
             elif binding_type == BindingType.named_object:
-                context.unbind(name[1:])
+                context.unbind(name[1:], trusted=trusted)
+
+    def _remove_atomic_binding(self, name: str, binding_type: BindingType) -> None:
+        """
+        Helper method that removes the binding under the given atomic name from the storage of this NamingContext.
+        Specialized naming contexts can extend this method to keep track of the bindings that are removed from them.
+        """
+        with self._lock:
+            # This context might have been unbound by another thread since it was resolved.
+            context_name = self._name
+            if context_name is None:
+                raise UnboundException()
+            obj = self._bindings[binding_type].remove(name)
+            if self._index is not None:
+                self._index[binding_type].pop((*context_name, name), None)
+            if binding_type == BindingType.named_context:
+                if isinstance(obj, NamingContext):
+                    # Unbind the context while holding its lock, so it is not unbound halfway its own modifications.
+                    with obj._lock:
+                        obj._unindex()
+                        obj._name = None
+                else:
+                    obj._name = None
+            if _statistics is not None:
+                _statistics.record_unbinding(context_name)
 
     @AbstractNamingContext.check_bounded
-    def resolve(self, name: Name) -> object:
+    def resolve(self, name: Name, trusted=False) -> object:
         """
         Resolve a name in this NamingContext and return the bound object.
         It will throw appropriate exceptions if not found.
 
         :param name: name under which the object should have been bound, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
 
         :return: the object that was bound under the given name.
 
@@ -733,31 +1292,33 @@ class NamingContext(AbstractNamingContext):
             NamingException NamingException.Message.invalid_name: when the name is invalid (None or length less than 1).
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
         """
-        return self._resolve_binding(name, BindingType.named_object)
+        return self._resolve_binding(name, BindingType.named_object, trusted)
 
     @AbstractNamingContext.check_bounded
-    def resolve_context(self, name: Name) -> AbstractNamingContext:
+    def resolve_context(self, name: Name, trusted=False) -> AbstractNamingContext:
         """
         Resolve a name in this NamingContext and return the bound object, expecting it to be a NamingContext.
         It will throw appropriate exceptions if not found.
 
         :param name: name under which the context should have been bound, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
 
         :raises:
             UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
             NamingException NamingException.Message.invalid_name: when the name is invalid (None or length less than 1).
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
         """
-        return self._resolve_binding(name, BindingType.named_context)
+        return self._resolve_binding(name, BindingType.named_context, trusted)
 
     @AbstractNamingContext.check_bounded
-    def _resolve_binding(self, name: Name, binding_type: BindingType) -> object:
+    def _resolve_binding(self, name: Name, binding_type: BindingType, trusted=False) -> object:
         """
         Helper method that implements the lookup of all types of bindings, returning the bound object.
         It will throw appropriate exceptions if not found.
 
         :param name: name under which the object should have been bound, atomic or composite, and relative to this naming context.
         :param binding_type: the type of binding to resolve, a member of `camelot.core.orm.BindingType.
+        :param trusted: flag that indicates the name is known to be valid, so its validation can be skipped at every level.
 
         :return: the object that was bound under the given name.
 
@@ -767,7 +1328,7 @@ class NamingContext(AbstractNamingContext):
             NamingException NamingException.Message.invalid_binding_type: if the binding type is not a valid BindingType enum member.
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
         """
-        name = self.get_composite_name(name)
+        name = self.get_composite_name(name, trusted)
         if binding_type not in BindingType:
             raise NamingException(NamingException.Message.invalid_binding_type)
         if len(name) == 1:
@@ -775,9 +1336,208 @@ class NamingContext(AbstractNamingContext):
         else:
             context = self._bindings[BindingType.named_context].get(name[0])
             if binding_type == BindingType.named_context:
-                return context.resolve_context(name[1:])
+                return context.resolve_context(name[1:], trusted=trusted)
             elif binding_type == BindingType.named_object:
-                return context.resolve(name[1:])
+                return context.resolve(name[1:], trusted=trusted)
+
+    @AbstractNamingContext.check_bounded
+    def lookup(self, name: Name, default=not_found, trusted=False) -> object:
+        """
+        Resolve a name in this NamingContext and return the bound object, or the given default if no binding was found.
+        No exceptions are raised or caught when the binding is not found.
+
+        :param name: name under which the object should have been bound, atomic or composite, and relative to this naming context.
+        :param default: the object to return if no binding was found, defaults to the `camelot.core.naming.not_found` sentinel.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
+
+        :raises:
+            UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
+            NamingException NamingException.Message.invalid_name: when the name is invalid (None or length less than 1).
+        """
+        return self._lookup_binding(name, BindingType.named_object, default, trusted)
+
+    @AbstractNamingContext.check_bounded
+    def lookup_context(self, name: Name, default=not_found, trusted=False) -> AbstractNamingContext:
+        """
+        Resolve a name in this NamingContext and return the bound context, or the given default if no binding was found.
+        No exceptions are raised or caught when the binding is not found.
+
+        :param name: name under which the context should have been bound, atomic or composite, and relative to this naming context.
+        :param default: the object to return if no binding was found, defaults to the `camelot.core.naming.not_found` sentinel.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
+
+        :raises:
+            UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
+            NamingException NamingException.Message.invalid_name: when the name is invalid (None or length less than 1).
+        """
+        return self._lookup_binding(name, BindingType.named_context, default, trusted)
+
+    def _lookup_binding(self, name: Name, binding_type: BindingType, default, trusted=False) -> object:
+        """
+        Helper method that implements the non-raising lookup of all types of bindings.
+        """
+        name = self.get_composite_name(name, trusted)
+        if len(name) == 1:
+            return self._bindings[binding_type].lookup(name[0], default)
+        context = self._bindings[BindingType.named_context].lookup(name[0], not_found)
+        if context is not_found:
+            return default
+        if binding_type == BindingType.named_context:
+            return context.lookup_context(name[1:], default, trusted=trusted)
+        return context.lookup(name[1:], default, trusted=trusted)
+
+    @AbstractNamingContext.check_bounded
+    def try_bind(self, name: Name, obj: object, immutable=False, trusted=False) -> typing.Tuple[CompositeName, object]:
+        """
+        Bind an object under a name in this NamingContext, unless an object is bound under that name already.
+        No exceptions are raised or caught when the name is bound already.
+
+        :param name: name under which the object will be bound, atomic or composite, and relative to this naming context.
+        :param obj: the object reference to be bound.
+        :param immutable: flag that indicates whether the object should be bound as immutable.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
+
+        :return: a tuple of the full qualified composite name of the binding, and the object bound under that name,
+            which is the given object if it was bound, or the object that was bound before.
+
+        :raises:
+            UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
+            NamingException NamingException.Message.invalid_name: The supplied name is invalid (i.e., is None or has length less than 1).
+            NameNotFoundException NamingException.Message.name_not_found: if no context was found for the first parts of the supplied name.
+        """
+        name = self.get_composite_name(name, trusted)
+        if len(name) > 1:
+            context = self._bindings[BindingType.named_context].get(name[0])
+            return context.try_bind(name[1:], obj, immutable, trusted=trusted)
+        with self._lock:
+            bound_obj = self._bindings[BindingType.named_object].lookup(name[0], not_found)
+            if bound_obj is not not_found:
+                return (*self._name, name[0]), bound_obj
+            return self._add_atomic_binding(name[0], obj, False, BindingType.named_object, immutable), obj
+
+    @AbstractNamingContext.check_bounded
+    def resolve_many(self, names: typing.Iterable[Name], trusted=False) -> typing.List[typing.Tuple[object, typing.Optional[NamingException]]]:
+        """
+        Resolve multiple names in this NamingContext.
+        Names that are composed out of multiple parts are grouped per subcontext, so each subcontext can resolve its names at once.
+
+        :param names: names under which the objects should have been bound, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the names are known to be valid, e.g. because they were composed by the server, so their validation can be skipped.
+
+        :return: a list with, for each name in the order of the given names, a tuple of the resolved object
+            and None, or of None and the `camelot.core.naming.NamingException` raised for that name.
+        """
+        names = list(names)
+        results = [None] * len(names)
+        local, delegated = self._partition_names(names, trusted, results, lambda e: (None, e))
+        storage = self._bindings[BindingType.named_object]
+        for i, name in local:
+            try:
+                results[i] = (storage.get(name[0]), None)
+            except NamingException as e:
+                results[i] = (None, e)
+        for context, positions in delegated.items():
+            context_results = context.resolve_many([name for _i, name in positions], trusted=trusted)
+            for (i, _name), result in zip(positions, context_results):
+                results[i] = result
+        return results
+
+    @AbstractNamingContext.check_bounded
+    def bind_many(self, bindings: typing.Iterable[typing.Tuple[Name, object]], immutable=False, trusted=False) -> typing.List[typing.Tuple[typing.Optional[CompositeName], typing.Optional[NamingException]]]:
+        """
+        Bind multiple objects under their names in this NamingContext.
+        The names are validated once, the bindings in this context are added while acquiring its lock only once,
+        and bindings with names that are composed out of multiple parts are grouped per subcontext, so each subcontext can bind its objects at once.
+
+        :param bindings: tuples of the name, atomic or composite and relative to this naming context, and the object to bind with that name.
+        :param immutable: flag that indicates whether the objects should be bound as immutable.
+        :param trusted: flag that indicates the names are known to be valid, e.g. because they were composed by the server, so their validation can be skipped.
+
+        :return: a list with, for each binding in the order of the given bindings, a tuple of the full qualified composite name
+            of the bound object and None, or of None and the `camelot.core.naming.NamingException` raised for that binding.
+        """
+        bindings = list(bindings)
+        results = [None] * len(bindings)
+        local, delegated = self._partition_names([name for name, _obj in bindings], trusted, results, lambda e: (None, e))
+        with self._lock:
+            for i, name in local:
+                try:
+                    results[i] = (self._add_atomic_binding(name[0], bindings[i][1], False, BindingType.named_object, immutable), None)
+                except NamingException as e:
+                    results[i] = (None, e)
+        for context, positions in delegated.items():
+            context_results = context.bind_many([(name, bindings[i][1]) for i, name in positions], immutable=immutable, trusted=trusted)
+            for (i, _name), result in zip(positions, context_results):
+                results[i] = result
+        return results
+
+    @AbstractNamingContext.check_bounded
+    def unbind_many(self, names: typing.Iterable[Name], trusted=False) -> typing.List[typing.Optional[NamingException]]:
+        """
+        Remove multiple object bindings from this NamingContext.
+        The names are validated once, the bindings in this context are removed while acquiring its lock only once,
+        and names that are composed out of multiple parts are grouped per subcontext, so each subcontext can unbind its names at once.
+
+        :param names: names under which the objects should have been bound, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the names are known to be valid, e.g. because they were composed by the server, so their validation can be skipped.
+
+        :return: a list with, for each name in the order of the given names, None or the `camelot.core.naming.NamingException` raised for that name.
+        """
+        names = list(names)
+        results = [None] * len(names)
+        local, delegated = self._partition_names(names, trusted, results, lambda e: e)
+        with self._lock:
+            for i, name in local:
+                try:
+                    self._remove_atomic_binding(name[0], BindingType.named_object)
+                except NamingException as e:
+                    results[i] = e
+        for context, positions in delegated.items():
+            context_results = context.unbind_many([name for _i, name in positions], trusted=trusted)
+            for (i, _name), result in zip(positions, context_results):
+                results[i] = result
+        return results
+
+    def _partition_names(self, names, trusted, results, error_result):
+        """
+        Helper method for the bulk operations, that validates the given names and partitions them in the names of
+        bindings in this NamingContext and the remaining names per subcontext.
+        For each name that is invalid or of which the subcontext could not be resolved, the error result is stored at its position in the results.
+
+        :return: a list of (position, name) tuples for the names of bindings in this context,
+            and a dictionary of subcontexts to lists of (position, remaining name) tuples.
+        """
+        local = []
+        delegated = collections.defaultdict(list)
+        for i, name in enumerate(names):
+            try:
+                name = self.get_composite_name(name, trusted)
+                if len(name) == 1:
+                    local.append((i, name))
+                else:
+                    context = self._bindings[BindingType.named_context].get(name[0])
+                    delegated[context].append((i, name[1:]))
+            except NamingException as e:
+                results[i] = error_result(e)
+        return local, delegated
+
+    def _unindex(self):
+        """
+        Helper method that removes the bindings of this NamingContext and those of its subcontexts
+        from the flat index of the initial naming context, and detaches them from that index.
+        This should be called when this NamingContext gets unbound or replaced, while it still has its qualified name.
+        """
+        with self._lock:
+            if self._index is None:
+                return
+            for binding_type, storage in self._bindings.items():
+                for name in storage.list():
+                    self._index[binding_type].pop((*self._name, *name), None)
+            for name in self._bindings[BindingType.named_context].list():
+                context = self._bindings[BindingType.named_context].get(name[0])
+                if isinstance(context, NamingContext):
+                    context._unindex()
+            self._index = None
 
     def list(self):
         yield from self._bindings[BindingType.named_object].list()
@@ -871,24 +1631,57 @@ class ConstantNamingContext(EndpointNamingContext):
     The supported constant types are described by the ´camelot.core.naming.Constant´ enumeration.
     Because of this context idempotent resolving nature, this context does not (need to) implement object binding and does not store any physical bindings.
 
+    As resolving the same name always results in the same value, resolved values are memoized in a bounded,
+    least recently used cache, unless the values of the constant type are mutable.
+
     :param constant_type: an instance of ´camelot.core.naming.Constant´, which described name resolution strategy of this constant naming context to use.
+    :param memo_size: the maximum number of resolved values to memoize.
 
     :raises:
             AssertionError: if the provided constant_type is not a valid instance of ´camelot.core.naming.Constant´.
     """
 
-    def __init__(self, constant_type):
+    # Specialized conversions of a validated composite name into its value, for each constant type.
+    converters = {
+        Constant.integer: lambda name: int(name[0]),
+        Constant.string:  lambda name: name[0],
+        Constant.decimal: lambda name: Decimal(name[0]),
+        Constant.color:   lambda name: QtGui.QColor(name[0]),
+        Constant.time:    lambda name: datetime.datetime(*map(int, name)),
+        Constant.date:    lambda name: datetime.date(*map(int, name)),
+    }
+
+    # Constant types of which the values are mutable, and should thus not be shared by memoizing them.
+    mutable_types = {Constant.color}
+
+    def __init__(self, constant_type, memo_size=1024):
         super().__init__()
         assert isinstance(constant_type, Constant)
         self.constant_type = constant_type
+        self._converter = self.converters.get(constant_type, self._convert)
+        self._memo = collections.OrderedDict() if constant_type not in self.mutable_types else None
+        self._memo_size = memo_size
+
+    def _convert(self, name: CompositeName) -> object:
+        """
+        Generic conversion of a validated composite name into its value, using the atomic and composite type of the constant type.
+        """
+        # Convert atomic parts if the composite type does not support string-conversion of its arguments.
+        if self.constant_type.atomic_type != str:
+            converted_name = [self.constant_type.atomic_type(atomic_name) for atomic_name in name]
+            return self.constant_type.composite_type(*converted_name)
+        return self.constant_type.composite_type(*name)
 
     @AbstractNamingContext.check_bounded
-    def resolve(self, name: Name) -> object:
+    def resolve(self, name: Name, trusted=False) -> object:
         """
         Resolve a name in this ConstantNamingContext.
         It will throw appropriate exceptions if the resolution failed.
+        As the name defines the value to resolve, it is always validated, even if it is trusted,
+        unless its value was memoized, as only valid names are memoized.
 
         :param name: name to resolve, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is trusted, which has no effect on this endpoint context.
 
         :return: the resolved object, an instance of this ConstantNamingContext's constant_type.
 
@@ -897,15 +1690,26 @@ class ConstantNamingContext(EndpointNamingContext):
             NamingException NamingException.Message.invalid_name: when the name is invalid.
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
         """
-        name = self.get_composite_name(name)
+        memo = self._memo
+        if memo is not None:
+            try:
+                value = memo[name]
+                memo.move_to_end(name)
+                return value
+            except (KeyError, TypeError):
+                pass
+        composite_name = self.get_composite_name(name)
         try:
-            # Convert atomic parts if the composite type does not support string-conversion of its arguments.
-            if self.constant_type.atomic_type != str:
-                converted_name = [self.constant_type.atomic_type(atomic_name) for atomic_name in name]
-                return self.constant_type.composite_type(*converted_name)
-            return self.constant_type.composite_type(*name)
+            value = self._converter(composite_name)
         except (ValueError, decimal.InvalidOperation):
-            raise NameNotFoundException(name, BindingType.named_object)
+            raise NameNotFoundException(composite_name, BindingType.named_object)
+        if memo is not None:
+            memo[name] = value
+            if len(memo) > self._memo_size:
+                # Another thread might have emptied the memo in the meantime.
+                with contextlib.suppress(KeyError):
+                    memo.popitem(last=False)
+        return value
 
     def validate_atomic_name(self, name: str) -> bool:
         """
@@ -943,6 +1747,49 @@ class ConstantNamingContext(EndpointNamingContext):
         """
         return []
 
+# Registry of the sessions of named entity instances, by their hash key,
+# used to lookup the session of an entity name.
+_sessions = weakref.WeakValueDictionary()
+
+def register_session(session):
+    """
+    Register a session, so the names of entity instances in that session can be resolved.
+    This happens implicitly when an entity instance is named.
+
+    :param session: an instance of `sqlalchemy.orm.Session`
+    """
+    _sessions[session.hash_key] = session
+
+def _register_begun_session(session, transaction, connection):
+    register_session(session)
+
+# Sessions are registered as soon as they begin a transaction, which they do before
+# any entity instance is loaded in them.
+event.listen(orm.Session, 'after_begin', _register_begun_session)
+
+def _get_session(hash_key):
+    """
+    Return the registered session with the given hash key, or None if no such session exists.
+    """
+    return _sessions.get(hash_key)
+
+@functools.lru_cache(None)
+def _entity_class():
+    """
+    Return the base class of the entities that can be named, which is imported once, when it is needed for the first time.
+    """
+    from vfinance.model.entity import Entity
+    return Entity
+
+@functools.lru_cache(None)
+def _entity_mapper(entity):
+    """
+    Return the mapper of the given entity class.
+    This function is a performance-optimized replacement for calling
+    `orm.class_mapper(entity)` each time an entity name is validated or resolved.
+    """
+    return orm.class_mapper(entity)
+
 class EntityNamingContext(EndpointNamingContext):
     """
     Represents a stateless endpoint naming context, which handles resolving instances of a ´camelot.core.orm.entity.Entity´ class.
@@ -959,6 +1806,9 @@ class EntityNamingContext(EndpointNamingContext):
             AssertionError: if the provided entity class is not a subclass of ´camelot.core.orm.entity.Entity´
     """
 
+    # The maximum number of primary keys in the IN clause of a single query when resolving many names.
+    in_clause_size = 500
+
     def __init__(self, entity):
         super().__init__()
         from vfinance.model.entity import EntityBase
@@ -993,22 +1843,24 @@ class EntityNamingContext(EndpointNamingContext):
             not equal the dimension of primary key of this context's entity mapper incremented by 1.
         """
         super(EndpointNamingContext, self).validate_composite_name(name)
-        mapper = orm.class_mapper(self.entity)
-        if len(name) != len(mapper.primary_key) + 1:
-            raise NamingException(NamingException.Message.invalid_name, reason=NamingException.Message.invalid_composite_name_length, length=len(mapper.primary_key)+1)
-        if not all([name_part.isdecimal() for name_part in name]):
+        length = len(_entity_mapper(self.entity).primary_key) + 1
+        if len(name) != length:
+            raise NamingException(NamingException.Message.invalid_name, reason=NamingException.Message.invalid_composite_name_length, length=length)
+        if not all(name_part.isdecimal() for name_part in name):
             raise NamingException(NamingException.Message.invalid_name, reason=NamingException.Message.invalid_atomic_name_numeric)
 
     @AbstractNamingContext.check_bounded
-    def resolve(self, name: Name) -> object:
+    def resolve(self, name: Name, trusted=False) -> object:
         """
         Resolve a name in this EntityNamingContext and return the bound object.
         The name should be singular and its atomic form numeric, as it is used
         as the primary key to query the corresponding instance with of the entity of this naming context.
+        As the name defines the primary key to query, it is always validated, even if it is trusted.
 
         It will throw appropriate exceptions if the resolution failed.
 
         :param name: name under which the object should have been bound, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the name is trusted, which has no effect on this endpoint context.
 
         :return: the bound object, an instance of this EntityNamingContext's entity class.
 
@@ -1018,12 +1870,78 @@ class EntityNamingContext(EndpointNamingContext):
             NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
         """
         name = self.get_composite_name(name)
-        session = orm.session._sessions.get(int(name[0]))
-        instance = session.query(self.entity).get(name[1:]) if session is not None else None
+        session = _get_session(int(name[0]))
+        instance = None
+        if session is not None:
+            primary_key = tuple(int(key) for key in name[1:])
+            instance = self._get_from_identity_map(session, primary_key)
+            if instance is None:
+                instance = session.query(self.entity).get(primary_key)
         if instance is None:
             raise NameNotFoundException(name[0], BindingType.named_object)
         return instance
 
+    def _get_from_identity_map(self, session, primary_key):
+        """
+        Helper method that returns the instance of the entity with the given primary key
+        if it is present in the identity map of the given session, without querying the database.
+        """
+        identity_key = _entity_mapper(self.entity).identity_key_from_primary_key(primary_key)
+        return session.identity_map.get(identity_key)
+
+    @AbstractNamingContext.check_bounded
+    def resolve_many(self, names: typing.Iterable[Name], trusted=False) -> typing.List[typing.Tuple[object, typing.Optional[NamingException]]]:
+        """
+        Resolve multiple names in this EntityNamingContext.
+        The names are grouped per session, and for each session, the instances that are not yet in its identity map
+        are queried at once, using an IN clause on the primary key of the entity.
+
+        :param names: names under which the objects should have been bound, atomic or composite, and relative to this naming context.
+        :param trusted: flag that indicates the names are trusted, which has no effect on this endpoint context.
+
+        :return: a list with, for each name in the order of the given names, a tuple of the resolved instance
+            and None, or of None and the `camelot.core.naming.NamingException` raised for that name.
+        """
+        names = list(names)
+        results = [None] * len(names)
+        mapper = _entity_mapper(self.entity)
+        names_by_session = collections.defaultdict(list)
+        for i, name in enumerate(names):
+            try:
+                name = self.get_composite_name(name)
+            except NamingException as e:
+                results[i] = (None, e)
+                continue
+            names_by_session[name[0]].append((i, name))
+        for session_name, positions in names_by_session.items():
+            session = _get_session(int(session_name))
+            missing = collections.defaultdict(list)
+            for i, name in positions:
+                primary_key = tuple(int(key) for key in name[1:])
+                instance = None
+                if session is not None:
+                    instance = self._get_from_identity_map(session, primary_key)
+                if instance is not None:
+                    results[i] = (instance, None)
+                else:
+                    missing[primary_key].append(i)
+            if session is not None and len(missing):
+                primary_keys = list(missing.keys())
+                for start in range(0, len(primary_keys), self.in_clause_size):
+                    chunk = primary_keys[start:start+self.in_clause_size]
+                    if len(mapper.primary_key) == 1:
+                        condition = mapper.primary_key[0].in_([primary_key[0] for primary_key in chunk])
+                    else:
+                        condition = tuple_(*mapper.primary_key).in_(chunk)
+                    for instance in session.query(self.entity).filter(condition):
+                        primary_key = tuple(mapper.primary_key_from_instance(instance))
+                        for i in missing.pop(primary_key, []):
+                            results[i] = (instance, None)
+            for positions in missing.values():
+                for i in positions:
+                    results[i] = (None, NameNotFoundException(names[i], BindingType.named_object))
+        return results
+
     def list(self):
         """
         The database might contain a very large number of entities, to avoid looping over all entities in the
@@ -1045,11 +1963,619 @@ class WeakRefNamingContext(NamingContext):
         super().__init__()
         self._bindings[BindingType.named_object] = WeakValueBindingStorage(BindingType.named_object)
 
+class BoundedNamingContext(NamingContext):
+    """
+    Specialized naming context that limits the number and size of its named object bindings.
+    Its bindings are kept in a ´camelot.core.naming.LRUBindingStorage´, and when a new binding exceeds
+    the maximum number of bindings or the byte budget, the least recently resolved mutable bindings are evicted.
+    Immutable bindings are never evicted.
+    Resolving an evicted name raises an ´camelot.core.naming.ExpiredBindingException´.
+    The size of the objects is approximated with ´camelot.core.naming._approximate_size´ when they are bound.
+
+    :param max_bindings: the maximum number of named object bindings in this context.
+    :param max_bytes: the maximum approximate number of bytes held by the named object bindings, or None if unlimited.
+    """
+
+    def __init__(self, max_bindings=256, max_bytes=None):
+        super().__init__()
+        self.max_bindings = max_bindings
+        self.max_bytes = max_bytes
+        self.evicted = 0
+        self._sizes = dict()
+        self._bytes_held = 0
+        self._bindings[BindingType.named_object] = LRUBindingStorage(BindingType.named_object)
+
+    def new_context(self) -> BoundedNamingContext:
+        return self.__class__(self.max_bindings, self.max_bytes)
+
+    def _add_atomic_binding(self, name: str, obj, rebind: bool, binding_type: BindingType, immutable=False) -> CompositeName:
+        if binding_type != BindingType.named_object:
+            return super()._add_atomic_binding(name, obj, rebind, binding_type, immutable)
+        size = _approximate_size(obj)
+        with self._lock:
+            qual_name = super()._add_atomic_binding(name, obj, rebind, binding_type, immutable)
+            self._bytes_held += size - self._sizes.pop(name, 0)
+            self._sizes[name] = size
+            self._evict()
+            return qual_name
+
+    def _remove_atomic_binding(self, name: str, binding_type: BindingType) -> None:
+        with self._lock:
+            super()._remove_atomic_binding(name, binding_type)
+            if binding_type == BindingType.named_object:
+                self._bytes_held -= self._sizes.pop(name, 0)
+
+    def _over_budget(self, storage) -> bool:
+        if len(storage) > self.max_bindings:
+            return True
+        return self.max_bytes is not None and self._bytes_held > self.max_bytes
+
+    def _evict(self):
+        """
+        Helper method that evicts the least recently used mutable bindings until the maximum number of bindings
+        and the byte budget are respected.
+        """
+        storage = self._bindings[BindingType.named_object]
+        while self._over_budget(storage):
+            name = storage.least_recently_used()
+            if name is None:
+                break
+            storage.expire(name)
+            self._bytes_held -= self._sizes.pop(name, 0)
+            if self._index is not None:
+                self._index[BindingType.named_object].pop((*self._name, name), None)
+            self.evicted += 1
+            if _statistics is not None:
+                _statistics.record_eviction(self._name)
+            LOGGER.debug('Evicted {} from {}'.format(name, self.verbose_name(self._name)))
+
+    def release(self, obj) -> None:
+        """
+        Unbind the mutable bindings of the given object from this context, e.g. when the view that uses it was closed.
+
+        :param obj: the object bound in this context.
+        """
+        storage = self._bindings[BindingType.named_object]
+        with self._lock:
+            for name, bound_obj in storage._snapshot():
+                if bound_obj is obj and name not in storage._immutable:
+                    self.unbind(name, trusted=True)
+
+    @property
+    def bytes_held(self) -> int:
+        """
+        The approximate number of bytes held by the named object bindings in this context.
+        """
+        return self._bytes_held
+
+tier_usage = collections.namedtuple('tier_usage', ('strong', 'weak', 'bytes', 'hits', 'misses', 'promoted', 'demoted', 'dropped'))
+
+class TieredNamingContext(NamingContext):
+    """
+    Specialized naming context that keeps its named object bindings in a ´camelot.core.naming.TieredBindingStorage´,
+    so only its most recently bound or resolved objects are kept alive, within a maximum number of bindings and a byte budget,
+    while the others remain resolvable as long as they are referenced elsewhere.
+
+    :param max_bindings: the maximum number of objects kept alive by this context, or None if unlimited.
+    :param max_bytes: the maximum approximate number of bytes kept alive by this context, or None if unlimited.
+    """
+
+    def __init__(self, max_bindings=256, max_bytes=None):
+        super().__init__()
+        self._bindings[BindingType.named_object] = TieredBindingStorage(BindingType.named_object, max_bindings, max_bytes)
+
+    @property
+    def max_bindings(self) -> typing.Optional[int]:
+        return self._bindings[BindingType.named_object].max_bindings
+
+    @max_bindings.setter
+    def max_bindings(self, max_bindings: typing.Optional[int]):
+        self._bindings[BindingType.named_object].max_bindings = max_bindings
+        self._demote()
+
+    @property
+    def max_bytes(self) -> typing.Optional[int]:
+        return self._bindings[BindingType.named_object].max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: typing.Optional[int]):
+        self._bindings[BindingType.named_object].max_bytes = max_bytes
+        self._demote()
+
+    def new_context(self) -> TieredNamingContext:
+        return self.__class__(self.max_bindings, self.max_bytes)
+
+    def _add_atomic_binding(self, name: str, obj, rebind: bool, binding_type: BindingType, immutable=False) -> CompositeName:
+        with self._lock:
+            qual_name = super()._add_atomic_binding(name, obj, rebind, binding_type, immutable)
+            if binding_type == BindingType.named_object:
+                self._demote()
+            return qual_name
+
+    def _resolve_binding(self, name: Name, binding_type: BindingType, trusted=False) -> object:
+        obj = super()._resolve_binding(name, binding_type, trusted)
+        # Resolving a demoted binding promotes it, which might exceed the limits of the strong tier.
+        if self._bindings[BindingType.named_object].over_budget():
+            self._demote()
+        return obj
+
+    def _lookup_binding(self, name: Name, binding_type: BindingType, default, trusted=False) -> object:
+        obj = super()._lookup_binding(name, binding_type, default, trusted)
+        if self._bindings[BindingType.named_object].over_budget():
+            self._demote()
+        return obj
+
+    def _demote(self):
+        """
+        Helper method that demotes the least recently used bindings until the strong tier is within its limits.
+        """
+        with self._lock:
+            for name in self._bindings[BindingType.named_object].demote():
+                if self._index is not None:
+                    self._index[BindingType.named_object].pop((*self._name, name), None)
+                if _statistics is not None:
+                    _statistics.record_eviction(self._name)
+
+    def usage(self) -> tier_usage:
+        """
+        :return: the number of bindings in each tier, the approximate number of bytes held by the strong tier,
+            the number of hits in the strong tier, the number of misses, and the number of bindings that were promoted,
+            demoted and dropped.
+        """
+        storage = self._bindings[BindingType.named_object]
+        return tier_usage(
+            len(storage._bindings), len(storage._weak), storage.bytes_held,
+            storage.hits, storage.misses, storage.promoted, storage.demoted, storage.dropped
+        )
+
+    @property
+    def hit_rate(self) -> typing.Optional[float]:
+        """
+        The fraction of the retrievals that were served by the strong tier, or None if nothing was retrieved yet.
+        """
+        storage = self._bindings[BindingType.named_object]
+        retrievals = storage.hits + storage.promoted + storage.misses
+        if retrievals:
+            return storage.hits / retrievals
+
+class ObjectNamingContext(TieredNamingContext):
+    """
+    Specialized naming context for objects that can not be named by themselves, and are thus bound under a generated name.
+    The names are generated from a counter, so they are never reused, and a name that refers to an object
+    that is no longer bound can not resolve to another object.
+
+    :param max_bindings: the maximum number of objects kept alive by this context.
+    :param max_bytes: the maximum approximate number of bytes kept alive by this context, or None if unlimited.
+    """
+
+    def __init__(self, max_bindings=256, max_bytes=None):
+        super().__init__(max_bindings, max_bytes)
+        self._counter = itertools.count(1)
+
+    @AbstractNamingContext.check_bounded
+    def bind_object(self, obj) -> CompositeName:
+        """
+        Bind an object under a generated name in this context, unless it is bound already in the strong tier.
+
+        :return: the full qualified composite name of the bound object, relative to the initial naming context.
+        """
+        storage = self._bindings[BindingType.named_object]
+        with self._lock:
+            name = storage.name_of(obj)
+            if name is None:
+                return self.bind(str(next(self._counter)), obj, trusted=True)
+            # Mark the binding as recently used.
+            storage.lookup(name, None)
+            return (*self._name, name)
+
+lease = collections.namedtuple('lease', ('created', 'run_name', 'client', 'size'))
+
+class LeaseNamingContext(NamingContext):
+    """
+    Specialized naming context for objects that are leased to the client, such as the objects
+    referred to by the ´camelot.view.action_steps.orm.CreateUpdateDelete´ action steps.
+    Those leases are normally released when the client sends an unbind request, but a slow or crashed client would
+    keep them alive forever.
+
+    Therefore this context keeps track of the creation time, the owning run and client, and the approximate size of each lease,
+    and expires leases after a time to live.  Expired leases are swept each time a lease is bound, unbound or looked up,
+    and the sweep interval has passed since the previous sweep, so the number of leases stays bounded on long running servers.
+    The leases are kept in a ´camelot.core.naming.UnindexedBindingStorage´, so they are looked up through this context.
+
+    :param ttl: the time to live of a lease, in seconds.
+    :param sweep_interval: the minimum number of seconds between two sweeps that are triggered by using the leases.
+    """
+
+    def __init__(self, ttl=600, sweep_interval=60):
+        super().__init__()
+        self._bindings[BindingType.named_object] = UnindexedBindingStorage(BindingType.named_object)
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self._leases = collections.OrderedDict()
+        self._bytes_held = 0
+        self._last_sweep = time.monotonic()
+        # The owner of the leases is kept per thread, as model runs can bind leases concurrently.
+        self._owner = threading.local()
+
+    def new_context(self) -> LeaseNamingContext:
+        return self.__class__(self.ttl, self.sweep_interval)
+
+    @contextlib.contextmanager
+    def owned_by(self, run_name: CompositeName, client):
+        """
+        Context manager that registers the given run and client as the owner of the leases bound within its scope.
+
+        :param run_name: the fully qualified name of the `camelot.view.requests.ModelRun` that binds the leases.
+        :param client: the client connection the leases are sent to.
+        """
+        previous_owner = getattr(self._owner, 'owner', (None, None))
+        self._owner.owner = (run_name, client)
+        try:
+            yield
+        finally:
+            self._owner.owner = previous_owner
+
+    def _add_atomic_binding(self, name: str, obj, rebind: bool, binding_type: BindingType, immutable=False) -> CompositeName:
+        if binding_type != BindingType.named_object:
+            return super()._add_atomic_binding(name, obj, rebind, binding_type, immutable)
+        size = _approximate_size(obj)
+        with self._lock:
+            # Sweep before binding, so the new lease is not swept as part of its own binding.
+            self._sweep_if_due()
+            qual_name = super()._add_atomic_binding(name, obj, rebind, binding_type, immutable)
+            self._release(name)
+            run_name, client = getattr(self._owner, 'owner', (None, None))
+            self._leases[name] = lease(time.monotonic(), run_name, client, size)
+            self._bytes_held += size
+            return qual_name
+
+    def _remove_atomic_binding(self, name: str, binding_type: BindingType) -> None:
+        with self._lock:
+            super()._remove_atomic_binding(name, binding_type)
+            if binding_type == BindingType.named_object:
+                self._release(name)
+
+    def unbind(self, name: Name, trusted=False) -> None:
+        super().unbind(name, trusted)
+        self._sweep_if_due()
+
+    def unbind_many(self, names: typing.Iterable[Name], trusted=False) -> typing.List[typing.Optional[NamingException]]:
+        results = super().unbind_many(names, trusted)
+        self._sweep_if_due()
+        return results
+
+    def _resolve_binding(self, name: Name, binding_type: BindingType, trusted=False) -> object:
+        if binding_type == BindingType.named_object:
+            self._sweep_if_due()
+        return super()._resolve_binding(name, binding_type, trusted)
+
+    def _lookup_binding(self, name: Name, binding_type: BindingType, default, trusted=False) -> object:
+        if binding_type == BindingType.named_object:
+            self._sweep_if_due()
+        return super()._lookup_binding(name, binding_type, default, trusted)
+
+    def _sweep_if_due(self):
+        """
+        Helper method that sweeps the expired leases, if the sweep interval has passed since the previous sweep.
+        """
+        if time.monotonic() - self._last_sweep >= self.sweep_interval:
+            self.sweep()
+
+    def _release(self, name: str):
+        """
+        Helper method that removes the bookkeeping of the lease under the given atomic name, if any.
+        """
+        released = self._leases.pop(name, None)
+        if released is not None:
+            self._bytes_held -= released.size
+
+    def sweep(self) -> int:
+        """
+        Unbind all leases that outlived the time to live of this context.
+
+        :return: the number of leases that expired.
+        """
+        with self._lock:
+            now = self._last_sweep = time.monotonic()
+            expired = []
+            # Leases are ordered by creation time, so stop at the first one that did not expire.
+            for name, bound_lease in self._leases.items():
+                if now - bound_lease.created < self.ttl:
+                    break
+                expired.append(name)
+            for name in expired:
+                self._remove_atomic_binding(name, BindingType.named_object)
+            if len(expired):
+                LOGGER.info('Expired {} leases, {} leases of {} bytes remain'.format(len(expired), len(self._leases), self._bytes_held))
+            return len(expired)
+
+    def get_lease(self, name: Name) -> lease:
+        """
+        Return the bookkeeping of the lease bound under the given name.
+
+        :param name: the name of the lease, atomic or composite, and relative to this naming context.
+
+        :raises:
+            NameNotFoundException NamingException.Message.name_not_found: if no lease is bound under the given name.
+        """
+        name = self.get_composite_name(name)
+        bound_lease = self._leases.get(name[0]) if len(name) == 1 else None
+        if bound_lease is None:
+            raise NameNotFoundException(name, BindingType.named_object)
+        return bound_lease
+
+    @property
+    def bytes_held(self) -> int:
+        """
+        The approximate number of bytes held by the leases bound in this context.
+        """
+        return self._bytes_held
+
+class NameTable(object):
+    """
+    Table of interned fully qualified names, that assigns a small integer id to each name the first time it is interned.
+    A table is kept per client connection, so names that are sent repeatedly to the client can be sent as their id,
+    once the mapping of the id to the name was sent.  The client can refer to an interned name by either its id or its name.
+    The ids are never reused, so only names of which the number is limited, such as routes, should be interned.
+    """
+
+    def __init__(self):
+        self._ids = dict()
+        self._names = []
+        self._unsent = []
+
+    def intern(self, name: CompositeName) -> int:
+        """
+        Return the id of the given name, and assign an id to it when needed.
+        """
+        name = tuple(name)
+        try:
+            return self._ids[name]
+        except KeyError:
+            name_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+            self._unsent.append((name_id, name))
+            return name_id
+
+    def get_name(self, name: typing.Union[int, Name]) -> Name:
+        """
+        Return the name referred to by the client, either by its id or by the name itself.
+
+        :raises:
+            NameNotFoundException NamingException.Message.name_not_found: if no name was interned with the given id.
+        """
+        if isinstance(name, int) and not isinstance(name, bool):
+            if not 0 <= name < len(self._names):
+                raise NameNotFoundException(str(name), BindingType.named_object)
+            return self._names[name]
+        return name
+
+    def take_unsent(self) -> typing.List[typing.Tuple[int, CompositeName]]:
+        """
+        Return the ids and names that were interned since the previous call, which still need to be sent to the client.
+        """
+        unsent, self._unsent = self._unsent, []
+        return unsent
+
+    def __len__(self):
+        return len(self._names)
+
+class ContextStatistics(object):
+    """
+    Counters of the operations on the bindings of a single naming context.
+    The resolve latencies are counted in a histogram, of which the upper bounds of the buckets
+    are given in microseconds by `latency_bounds`, the last bucket counts the latencies above the last bound.
+    """
+
+    latency_bounds = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 10000)
+
+    def __init__(self):
+        self.binds = 0
+        self.rebinds = 0
+        self.unbinds = 0
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self.latencies = [0] * (len(self.latency_bounds) + 1)
+
+    def merge(self, other: ContextStatistics):
+        self.binds += other.binds
+        self.rebinds += other.rebinds
+        self.unbinds += other.unbinds
+        self.evictions += other.evictions
+        self.hits += other.hits
+        self.misses += other.misses
+        self.latencies = [a + b for a, b in zip(self.latencies, other.latencies)]
+
+    def asdict(self):
+        return {
+            'binds': self.binds,
+            'rebinds': self.rebinds,
+            'unbinds': self.unbinds,
+            'evictions': self.evictions,
+            'hits': self.hits,
+            'misses': self.misses,
+            'latencies': dict(zip((*(str(bound) for bound in self.latency_bounds), 'inf'), self.latencies)),
+        }
+
+class NamingStatistics(object):
+    """
+    Instrumentation of the naming contexts in the hierarchy of the initial naming context.
+    The counters are kept per naming context, by the fully qualified name of that context.
+
+    Bindings are counted by the context in which they are added or removed, while resolves are counted when
+    they pass through the initial naming context, and attributed to the innermost named context that contains the name.
+    Objects that disappear from a `camelot.core.naming.WeakRefNamingContext` because they were garbage collected
+    are not counted as unbinds.
+
+    The instrumentation is enabled with `enable_statistics`, as long as it is disabled, no counting takes place at all.
+    """
+
+    def __init__(self, context_index: typing.Dict[CompositeName, typing.Any]):
+        self._context_index = context_index
+        self._contexts = collections.defaultdict(ContextStatistics)
+        self._lock = threading.Lock()
+
+    def record_binding(self, context_name: CompositeName, rebind: bool):
+        with self._lock:
+            statistics = self._contexts[context_name]
+            if rebind:
+                statistics.rebinds += 1
+            else:
+                statistics.binds += 1
+
+    def record_unbinding(self, context_name: CompositeName):
+        with self._lock:
+            self._contexts[context_name].unbinds += 1
+
+    def record_eviction(self, context_name: CompositeName):
+        with self._lock:
+            self._contexts[context_name].evictions += 1
+
+    def record_resolve(self, name: Name, hit: bool, elapsed: typing.Optional[float]=None):
+        """
+        :param name: the fully qualified name that was resolved
+        :param hit: flag indicating whether a binding was found
+        :param elapsed: the time it took to resolve the name in seconds, or None if it was not measured
+        """
+        context_name = self._context_name(name)
+        with self._lock:
+            statistics = self._contexts[context_name]
+            if hit:
+                statistics.hits += 1
+            else:
+                statistics.misses += 1
+            if elapsed is not None:
+                statistics.latencies[bisect.bisect_left(ContextStatistics.latency_bounds, elapsed * 1000000)] += 1
+
+    def measure(self, name: Name, default, resolver, *args) -> object:
+        """
+        Call the resolver with the given arguments and record its result and latency as a resolve of the given name.
+        The resolve is a miss if a `camelot.core.naming.NameNotFoundException` is raised or the default is returned.
+        """
+        start = time.perf_counter()
+        try:
+            obj = resolver(*args)
+        except NameNotFoundException:
+            self.record_resolve(name, False, time.perf_counter() - start)
+            raise
+        self.record_resolve(name, obj is not default, time.perf_counter() - start)
+        return obj
+
+    def _context_name(self, name: Name) -> CompositeName:
+        """
+        Helper method that returns the qualified name of the innermost named context that contains the given name.
+        """
+        if not isinstance(name, (tuple, list)):
+            return tuple()
+        for i in range(len(name) - 1, 0, -1):
+            context_name = tuple(name[:i])
+            if context_name in self._context_index:
+                return context_name
+        return tuple()
+
+    def get_statistics(self, context_name: CompositeName=tuple(), subtree=True) -> ContextStatistics:
+        """
+        :param context_name: the fully qualified name of a naming context.
+        :param subtree: flag indicating whether the counters of the subcontexts should be included.
+        :return: the counters of the given naming context.
+        """
+        context_name = tuple(context_name)
+        result = ContextStatistics()
+        with self._lock:
+            for name, statistics in self._contexts.items():
+                if name == context_name or (subtree and name[:len(context_name)] == context_name):
+                    result.merge(statistics)
+        return result
+
+    @classmethod
+    def retained_size(cls, context: AbstractNamingContext) -> typing.Tuple[int, int]:
+        """
+        Approximate the memory retained by the bindings of the given naming context and its subcontexts.
+        The bindings of endpoint contexts are not taken into account, as those are created when resolved.
+
+        :return: a tuple with the number of named object bindings and their approximate size in bytes.
+        """
+        if not isinstance(context, NamingContext):
+            return 0, 0
+        count, size = 0, 0
+        for _name, obj in context._bindings[BindingType.named_object]._snapshot():
+            count += 1
+            size += _approximate_size(obj)
+        for _name, subcontext in context._bindings[BindingType.named_context]._snapshot():
+            subcount, subsize = cls.retained_size(subcontext)
+            count += subcount
+            size += subsize
+        return count, size
+
+    def asdict(self, context: AbstractNamingContext) -> dict:
+        """
+        :param context: the naming context of which the statistics should be reported.
+        :return: a dictionary with the statistics of the given naming context and its subcontexts, including
+            the counters and the number of bindings and retained bytes of each subtree.
+        """
+        bindings, size = self.retained_size(context)
+        result = self.get_statistics(context._name).asdict()
+        result['bindings'] = bindings
+        result['bytes'] = size
+        if isinstance(context, TieredNamingContext):
+            result['tiers'] = context.usage()._asdict()
+            result['hit_rate'] = context.hit_rate
+        contexts = dict()
+        if isinstance(context, NamingContext):
+            for name, subcontext in context._bindings[BindingType.named_context]._snapshot():
+                contexts[name] = self.asdict(subcontext)
+        result['contexts'] = contexts
+        return result
+
+    def dumps(self, context: typing.Optional[NamingContext]=None) -> str:
+        """
+        :return: the statistics of the given naming context, or of the initial naming context, as json.
+        """
+        return json.dumps(self.asdict(context or initial_naming_context), indent=2)
+
+    def reset(self):
+        with self._lock:
+            self._contexts.clear()
+
+# The active instrumentation of the naming contexts, None if disabled.
+_statistics = None
+
+def enable_statistics() -> NamingStatistics:
+    """
+    Start counting the operations on the naming contexts, if this was not the case already.
+
+    :return: the `camelot.core.naming.NamingStatistics` that keeps the counters.
+    """
+    global _statistics
+    if _statistics is None:
+        _statistics = NamingStatistics(initial_naming_context._index[BindingType.named_context])
+    return _statistics
+
+def disable_statistics() -> None:
+    """
+    Stop counting the operations on the naming contexts, and discard the counters.
+    """
+    global _statistics
+    _statistics = None
+
+def get_statistics() -> typing.Optional[NamingStatistics]:
+    """
+    :return: the active `camelot.core.naming.NamingStatistics`, or None if the instrumentation is disabled.
+    """
+    return _statistics
+
 class InitialNamingContext(NamingContext, metaclass=Singleton):
     """
     Singleton class that is the starting context for performing naming operations.
     All naming operations are relative to a context.
     This initial context implements the NamingContext interface and provides the starting point for resolution of names.
+
+    To avoid walking the context hierarchy one level at a time, the initial naming context keeps a flat index
+    of the fully qualified names of all bindings in its hierarchy, which is kept in sync when binding or unbinding.
+    Resolving a fully qualified name is thus a single lookup in that index.
+    Only names that are not registered in the index, as those of the stateless endpoint contexts (e.g. ´camelot.core.naming.ConstantNamingContext´
+    and ´camelot.core.naming.EntityNamingContext´) or of weak references, fall back to the recursive resolve.
     """
 
     def __init__(self):
@@ -1058,6 +2584,9 @@ class InitialNamingContext(NamingContext, metaclass=Singleton):
         # so that it becomes bounded but does not contribute to the full composite name
         # resolution of subcontexts.
         self._name = tuple()
+        self._index = {btype: dict() for btype in BindingType}
+        # Functions that name an object, for each exact type of object bound with `_bind_object`.
+        self._namers = dict()
 
         # Add immutable bindings for constants' values and contexts for each supported 'constant' python type.
         constants = self.bind_new_context('constant', immutable=True)
@@ -1067,9 +2596,11 @@ class InitialNamingContext(NamingContext, metaclass=Singleton):
         constants.bind('true', True, immutable=True)
         constants.bind('false', False, immutable=True)
         self.bind_new_context('entity', immutable=True)
-        self.bind_new_context('object', immutable=True)
-        self.bind_new_context('leases', immutable=True)
-        self.bind_context('transient', WeakRefNamingContext(), immutable=True)
+        self.bind_context('object', ObjectNamingContext(), immutable=True)
+        self.bind_context('leases', LeaseNamingContext(), immutable=True)
+        # Transient objects are kept alive within a byte budget, so expensive results survive between requests.
+        # As their size is only approximated one level deep, the number of objects kept alive is limited as well.
+        self.bind_context('transient', TieredNamingContext(max_bindings=4096, max_bytes=32*1024*1024), immutable=True)
 
     def new_context(self) -> NamingContext:
         """
@@ -1081,6 +2612,125 @@ class InitialNamingContext(NamingContext, metaclass=Singleton):
         """
         return NamingContext()
 
+    def resolve(self, name: Name, trusted=False) -> object:
+        """
+        Resolve a fully qualified name and return the bound object.
+        The name is looked up in the flat index first, and only resolved recursively if it is not registered there.
+
+        :param name: the fully qualified name of the object, atomic or composite.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
+
+        :return: the object that was bound under the given name.
+
+        :raises:
+            NamingException NamingException.Message.invalid_name: when the name is invalid (None or length less than 1).
+            NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
+        """
+        if _statistics is not None:
+            return _statistics.measure(name, not_found, self._resolve_indexed, name, BindingType.named_object, trusted)
+        try:
+            storage, key = self._index[BindingType.named_object][name]
+        except (KeyError, TypeError):
+            return super().resolve(name, trusted)
+        return storage.get(key)
+
+    def resolve_context(self, name: Name, trusted=False) -> AbstractNamingContext:
+        """
+        Resolve a fully qualified name and return the bound context.
+        The name is looked up in the flat index first, and only resolved recursively if it is not registered there.
+
+        :param name: the fully qualified name of the context, atomic or composite.
+        :param trusted: flag that indicates the name is known to be valid, e.g. because it was composed by the server, so its validation can be skipped.
+
+        :raises:
+            NamingException NamingException.Message.invalid_name: when the name is invalid (None or length less than 1).
+            NameNotFoundException NamingException.Message.name_not_found: if no binding was found for the given name.
+        """
+        if _statistics is not None:
+            return _statistics.measure(name, not_found, self._resolve_indexed, name, BindingType.named_context, trusted)
+        try:
+            storage, key = self._index[BindingType.named_context][name]
+        except (KeyError, TypeError):
+            return super().resolve_context(name, trusted)
+        return storage.get(key)
+
+    def _resolve_indexed(self, name: Name, binding_type: BindingType, trusted=False) -> object:
+        try:
+            storage, key = self._index[binding_type][name]
+        except (KeyError, TypeError):
+            return self._resolve_binding(name, binding_type, trusted)
+        return storage.get(key)
+
+    def lookup(self, name: Name, default=not_found, trusted=False) -> object:
+        """
+        Resolve a fully qualified name and return the bound object, or the given default if no binding was found.
+        The name is looked up in the flat index first, and only looked up recursively if it is not registered there.
+
+        :raises:
+            NamingException NamingException.Message.invalid_name: when the name is invalid (None or length less than 1).
+        """
+        if _statistics is not None:
+            return _statistics.measure(name, default, self._lookup_indexed, name, BindingType.named_object, default, trusted)
+        return self._lookup_indexed(name, BindingType.named_object, default, trusted)
+
+    def lookup_context(self, name: Name, default=not_found, trusted=False) -> AbstractNamingContext:
+        """
+        Resolve a fully qualified name and return the bound context, or the given default if no binding was found.
+        The name is looked up in the flat index first, and only looked up recursively if it is not registered there.
+
+        :raises:
+            NamingException NamingException.Message.invalid_name: when the name is invalid (None or length less than 1).
+        """
+        if _statistics is not None:
+            return _statistics.measure(name, default, self._lookup_indexed, name, BindingType.named_context, default, trusted)
+        return self._lookup_indexed(name, BindingType.named_context, default, trusted)
+
+    def _lookup_indexed(self, name: Name, binding_type: BindingType, default, trusted=False) -> object:
+        try:
+            entry = self._index[binding_type].get(name)
+        except TypeError:
+            entry = None
+        if entry is None:
+            return self._lookup_binding(name, binding_type, default, trusted)
+        storage, key = entry
+        return storage.lookup(key, default)
+
+    def resolve_many(self, names: typing.Iterable[Name], trusted=False) -> typing.List[typing.Tuple[object, typing.Optional[NamingException]]]:
+        """
+        Resolve multiple fully qualified names.
+        Names registered in the flat index are resolved directly, the others are grouped per subcontext,
+        so for example entity names are resolved with a single query per entity and session.
+
+        :param names: the fully qualified names of the objects, atomic or composite.
+        :param trusted: flag that indicates the names are known to be valid, e.g. because they were composed by the server, so their validation can be skipped.
+
+        :return: a list with, for each name in the order of the given names, a tuple of the resolved object
+            and None, or of None and the `camelot.core.naming.NamingException` raised for that name.
+        """
+        names = list(names)
+        results = [None] * len(names)
+        unresolved = []
+        index = self._index[BindingType.named_object]
+        for i, name in enumerate(names):
+            try:
+                storage, key = index[name]
+            except (KeyError, TypeError):
+                unresolved.append(i)
+                continue
+            try:
+                results[i] = (storage.get(key), None)
+            except NamingException as e:
+                results[i] = (None, e)
+        if len(unresolved):
+            unresolved_results = super().resolve_many([names[i] for i in unresolved], trusted)
+            for i, result in zip(unresolved, unresolved_results):
+                results[i] = result
+        if _statistics is not None:
+            for name, (_obj, exception) in zip(names, results):
+                if exception is None or isinstance(exception, NameNotFoundException):
+                    _statistics.record_resolve(name, exception is None)
+        return results
+
     def _bind_object(self, obj):
         """
         Helper method for binding any type of python object under the appropriate name.
@@ -1094,38 +2744,91 @@ class InitialNamingContext(NamingContext, metaclass=Singleton):
             UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
             NotImplementedError: if trying to bind an object which is not supported.
         """
-        from vfinance.model.entity import Entity
-        if obj is None:
-            return ('constant', 'null')
-        if isinstance(obj, bool):
-            return ('constant', 'true' if obj else 'false')
+        cls = type(obj)
+        try:
+            namer = self._namers[cls]
+        except KeyError:
+            namer = self._namers[cls] = self._get_namer(cls)
+        return namer(obj)
+
+    def bind_objects(self, objs):
+        """
+        Bulk variant of `_bind_object`, that binds each object of the given iterable under the appropriate name.
+
+        :param objs: an iterable of objects to be bound.
+
+        :return: a list with the full qualified composite name of each bound object, in the order of the given objects.
+
+        :raises:
+            UnboundException NamingException.unbound: if this NamingContext has not been bound to a name yet.
+            NotImplementedError: if trying to bind an object which is not supported.
+        """
+        namers = self._namers
+        names = []
+        # Lists of objects are mostly homogeneous, so only lookup the namer when the type changes.
+        cls, namer = None, None
+        for obj in objs:
+            if type(obj) is not cls:
+                cls = type(obj)
+                try:
+                    namer = namers[cls]
+                except KeyError:
+                    namer = namers[cls] = self._get_namer(cls)
+            names.append(namer(obj))
+        return names
+
+    def _get_namer(self, cls):
+        """
+        Helper method that returns a function that names objects of the given exact type.
+        The isinstance checks of the types to name need to be done only once per type,
+        after which the namer is kept in a dispatch table.
+        """
+        if cls is type(None):
+            return lambda obj: ('constant', 'null')
+        if issubclass(cls, bool):
+            return lambda obj: ('constant', 'true' if obj else 'false')
         for constant_type in Constant:
-            if isinstance(obj, constant_type.composite_type):
+            if issubclass(cls, constant_type.composite_type):
                 base_name = ('constant', constant_type.name)
                 # Important to put the check on datetime first here, before the date check
                 # as datetimes are also dates.
-                if isinstance(obj, Constant.time.composite_type):
-                    return (*base_name, *[str(atomic_name) for atomic_name in [obj.year, obj.month, obj.day, obj.hour, obj.minute, obj.second]])
-                if isinstance(obj, Constant.date.composite_type):
-                    return (*base_name, *[str(atomic_name) for atomic_name in [obj.year, obj.month, obj.day]])
-                if isinstance(obj, Constant.decimal.composite_type):
+                if issubclass(cls, Constant.time.composite_type):
+                    return lambda obj: (*base_name, str(obj.year), str(obj.month), str(obj.day), str(obj.hour), str(obj.minute), str(obj.second))
+                if issubclass(cls, Constant.date.composite_type):
+                    return lambda obj: (*base_name, str(obj.year), str(obj.month), str(obj.day))
+                if issubclass(cls, Constant.decimal.composite_type):
                     # Normalize decimals to remove trailing zeros, to allow equality comparisons between named bindings.
-                    return (*base_name, str(obj.normalize()))
-                if isinstance(obj, Constant.color.composite_type):
-                    return (*base_name, obj.name())
-                return (*base_name, str(obj))
-        if isinstance(obj, Entity):
-            session = orm.object_session(obj)
-            if session is None:
-                raise NotImplementedError('Only entity instances that are bound to a session are supported')
-            primary_key = orm.object_mapper(obj).primary_key_from_instance(obj)
-            if not inspect(obj).persistent or None in primary_key:
-                raise NotImplementedError('Only persistent entity instances are supported')
-            entity = type(obj)
-            return ('entity', entity.endpoint.resource_name, str(session.hash_key), *[str(key) for key in primary_key])
-        if isinstance(obj, float):
-            raise NotImplementedError('Use Decimal instead')
+                    return lambda obj: (*base_name, str(obj.normalize()))
+                if issubclass(cls, Constant.color.composite_type):
+                    return lambda obj: (*base_name, obj.name())
+                return lambda obj: (*base_name, str(obj))
+        if issubclass(cls, _entity_class()):
+            base_name = ('entity', cls.endpoint.resource_name)
+            return lambda obj: (*base_name, *self._get_entity_name(obj))
+        if issubclass(cls, float):
+            def namer(obj):
+                raise NotImplementedError('Use Decimal instead')
+            return namer
+        return self._bind_delegated_object
+
+    def _get_entity_name(self, obj):
+        """
+        Helper method that returns the name of a persistent entity instance, relative to the context of its entity.
+        """
+        state = inspect(obj)
+        session = state.session
+        if session is None:
+            raise NotImplementedError('Only entity instances that are bound to a session are supported')
+        if not state.persistent:
+            raise NotImplementedError('Only persistent entity instances are supported')
+        register_session(session)
+        return (str(session.hash_key), *[str(key) for key in state.key[1]])
+
+    def _bind_delegated_object(self, obj):
+        """
+        Helper method that binds an object that can not be named by itself in the 'object' context.
+        """
         LOGGER.warn('Binding non-delegated object of type {}'.format(type(obj)))
-        return self.rebind(('object', str(hash(obj))), obj)
+        return self.resolve_context('object').bind_object(obj)
 
 initial_naming_context = InitialNamingContext()
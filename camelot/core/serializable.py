@@ -1,16 +1,38 @@
+import collections
+import concurrent.futures
 import dataclasses
 import datetime
 import functools
 import io
 import base64
+import logging
+import threading
+import time
+import typing
+import weakref
+import zlib
 
 import orjson
 
+try:
+    import msgpack
+except ImportError:
+    # msgpack is only needed for the binary codec
+    msgpack = None
+
+try:
+    import lz4.frame
+except ImportError:
+    # lz4 is only needed for the lz4 frame compression
+    lz4 = None
+
 from camelot.core.qt import QtCore, QtGui
 from enum import Enum
 
 from .utils import ugettext_lazy
 
+LOGGER = logging.getLogger('camelot.core.serializable')
+
 
 class Serializable(object):
     """
@@ -68,20 +90,19 @@ class Serializable(object):
         
 
 def orjson_default(obj):
+    # Enums are checked first, as all enums that subclass str or int end up here.
+    if isinstance(obj, Enum):
+        return obj.value
     if isinstance(obj, ugettext_lazy):
         return str(obj)
     if isinstance(obj, QtGui.QKeySequence):
         return obj.toString()
-    if isinstance(obj, Enum):
-        return obj.value
     if isinstance(obj, QtCore.QJsonValue):
         return obj.toVariant()
+    if isinstance(obj, ImagePreview):
+        return image_encoder.encode(obj.image, obj.width, obj.height)
     if isinstance(obj, QtGui.QImage):
-        byte_array = QtCore.QByteArray()
-        buffer = QtCore.QBuffer(byte_array)
-        buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
-        obj.save(buffer, "PNG");
-        return base64.b64encode(byte_array).decode()
+        return image_encoder.encode(obj)
         # FIXME: Remove this when all classes are serializable.
         #        Currently needed to serialize some fields
         #        (e.g. RouteWithRenderHint) from SetColumns._to_dict().
@@ -97,8 +118,149 @@ def orjson_default(obj):
         return str(obj)
     raise TypeError
 
+def _png_bytes(image):
+    byte_array = QtCore.QByteArray()
+    buffer = QtCore.QBuffer(byte_array)
+    buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG");
+    return byte_array.data()
+
+
+class ImagePreview(object):
+    """
+    An image that is sent downscaled to fit within a preview size, such as the
+    preview_width and preview_height of a DbImageDelegate, instead of at its full size.
+    """
+
+    __slots__ = ('image', 'width', 'height')
+
+    def __init__(self, image, width: int, height: int):
+        self.image = image
+        self.width = width
+        self.height = height
+
+
+image_usage = collections.namedtuple('image_usage', ('images', 'bytes', 'hits', 'misses', 'evictions'))
+
+class ImageEncoder(object):
+    """
+    PNG encoding of images, with a cache of the encoded images keyed by the cacheKey of the image,
+    so images that are sent repeatedly, such as the previews in the rows of a table, are encoded once.
+    The cache key of an image changes when the image is modified.
+
+    :param max_bytes: the maximum size of the encoded images kept in the cache, after which the least
+        recently used ones are evicted.
+    :param max_workers: the maximum number of threads that encode the images of a batch.
+    """
+
+    def __init__(self, max_bytes=16*1024*1024, max_workers=4):
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._images = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @staticmethod
+    def _encode(image, width, height, binary):
+        if width is not None and height is not None and (image.width() > width or image.height() > height):
+            image = image.scaled(
+                width, height, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation
+            )
+        data = _png_bytes(image)
+        return data if binary else base64.b64encode(data).decode()
+
+    def _store(self, key, encoded):
+        with self._lock:
+            if key in self._images:
+                return
+            self._images[key] = encoded
+            self._bytes += len(encoded)
+            while self._bytes > self.max_bytes and len(self._images):
+                _key, evicted = self._images.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def encode(self, image, width=None, height=None, binary=False):
+        """
+        :param width: the maximum width of the encoded image, the image is downscaled if it is wider or higher.
+        :param height: the maximum height of the encoded image.
+        :param binary: True to return the png bytes, False to return them as base64 text.
+        :return: the encoded image, from the cache if it was encoded before.
+        """
+        key = (image.cacheKey(), width, height, binary)
+        with self._lock:
+            encoded = self._images.get(key)
+            if encoded is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return encoded
+            self.misses += 1
+        encoded = self._encode(image, width, height, binary)
+        self._store(key, encoded)
+        return encoded
+
+    def prefetch(self, images, binary=False):
+        """
+        Encode the images of a batch that are not yet in the cache, so the serialization of the batch finds them there.
+        When several images need to be encoded, they are encoded in parallel threads instead of the calling thread.
+
+        :param images: `QtGui.QImage` or `ImagePreview` objects.
+        """
+        pending = dict()
+        with self._lock:
+            for value in images:
+                if isinstance(value, ImagePreview):
+                    image, width, height = value.image, value.width, value.height
+                else:
+                    image, width, height = value, None, None
+                key = (image.cacheKey(), width, height, binary)
+                if key not in self._images:
+                    pending[key] = (image, width, height, binary)
+            if len(pending) < 2:
+                return
+            self.misses += len(pending)
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(self.max_workers, thread_name_prefix='image_encoder')
+        for key, encoded in zip(pending, self._executor.map(lambda args: self._encode(*args), pending.values())):
+            self._store(key, encoded)
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._bytes = 0
+
+    def usage(self) -> image_usage:
+        """
+        :return: the number of cached images, the size of the cached images, and the number of hits, misses and evictions.
+        """
+        return image_usage(len(self._images), self._bytes, self.hits, self.misses, self.evictions)
+
+    @property
+    def hit_rate(self) -> typing.Optional[float]:
+        """
+        The fraction of the image encodings that were served from the cache, or None if no images were encoded yet.
+        """
+        retrievals = self.hits + self.misses
+        if retrievals:
+            return self.hits / retrievals
+
+
+image_encoder = ImageEncoder()
+
 
 class DataclassEncoderOrjson:
+    """
+    :param native_dataclasses: flag indicating whether dataclasses of which all fields are annotated as primitive types
+        should be handed to orjson as they are, instead of being turned into a dictionary first.
+        The output is the same in both cases.
+    """
+
+    def __init__(self, native_dataclasses=True):
+        self.native_dataclasses = native_dataclasses
 
     def encode(self, obj):
         return orjson.dumps(obj, default=orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS)
@@ -106,10 +268,198 @@ class DataclassEncoderOrjson:
     def iterencode(self, obj):
         yield orjson.dumps(obj, default=orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS)
 
+    def encode_dataclass(self, obj):
+        """
+        Encode a `DataclassSerializable` object as it would be encoded after turning it into a dictionary with its `asdict` method.
+        """
+        if self.native_dataclasses and type(obj).asdict.__func__ is DataclassSerializable.asdict.__func__:
+            return self.encode(_encode_value(obj))
+        return self.encode(obj.asdict(obj))
+
 
 json_encoder = DataclassEncoderOrjson()
 
 
+def msgpack_default(obj):
+    # Images are sent as their png bytes instead of base64 text.
+    if isinstance(obj, QtGui.QImage):
+        return image_encoder.encode(obj, binary=True)
+    if isinstance(obj, ImagePreview):
+        return image_encoder.encode(obj.image, obj.width, obj.height, binary=True)
+    # Dates and times are sent as ISO 8601 text, as orjson does natively.
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    return orjson_default(obj)
+
+
+class AbstractCodec(object):
+    """
+    The encoding of the requests and responses exchanged with the client.
+
+    .. attribute:: name
+
+        The name by which the client selects the codec.
+    """
+
+    name = None
+
+    def encode(self, obj) -> bytes:
+        raise NotImplementedError()
+
+    def encode_dataclass(self, obj) -> bytes:
+        """
+        Encode a `DataclassSerializable` object as it would be encoded after turning it into a dictionary with its `asdict` method.
+        """
+        return self.encode(obj.asdict(obj))
+
+    def decode(self, data):
+        raise NotImplementedError()
+
+
+class JsonCodec(AbstractCodec):
+    """
+    The default codec, encoding with orjson.
+    """
+
+    name = 'json'
+
+    def __init__(self, encoder=json_encoder):
+        self.encoder = encoder
+
+    def encode(self, obj):
+        return self.encoder.encode(obj)
+
+    def encode_dataclass(self, obj):
+        return self.encoder.encode_dataclass(obj)
+
+    def decode(self, data):
+        return orjson.loads(data)
+
+
+class MsgpackCodec(AbstractCodec):
+    """
+    A compact binary codec, using the msgpack format.  Integers, bytes and the tuples of composite names
+    are encoded as they are, without a round trip through text.  Dictionary keys keep their type, and images
+    are encoded as their png bytes.  This codec requires the optional msgpack package.
+    """
+
+    name = 'msgpack'
+
+    def encode(self, obj):
+        return msgpack.packb(obj, default=msgpack_default, use_bin_type=True)
+
+    def decode(self, data):
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+json_codec = JsonCodec()
+
+_codecs = {json_codec.name: json_codec}
+if msgpack is not None:
+    _codecs[MsgpackCodec.name] = MsgpackCodec()
+
+def get_codec(name):
+    """
+    :return: the codec registered with name, or None if no such codec is available.
+    """
+    return _codecs.get(name)
+
+def available_codecs():
+    """
+    :return: a list with the names of the available codecs, starting with the default codec.
+    """
+    return list(_codecs)
+
+
+compression = collections.namedtuple('compression', ('header', 'compress', 'decompress'))
+
+# The compressions of frames by name, with the header that flags a frame compressed with it.
+_compressions = {
+    'zlib': compression(b'\x01', functools.partial(zlib.compress, level=1), zlib.decompress),
+}
+if lz4 is not None:
+    _compressions['lz4'] = compression(b'\x02', lz4.frame.compress, lz4.frame.decompress)
+
+_uncompressed_header = b'\x00'
+
+def available_compressions():
+    """
+    :return: a list with the names of the available frame compressions, the fastest one from the standard library first.
+    """
+    return list(_compressions)
+
+compression_usage = collections.namedtuple('compression_usage', ('frames', 'compressed', 'bytes_in', 'bytes_out', 'cpu_time'))
+
+class FrameCompressor(object):
+    """
+    Compression of the encoded frames sent to the client.  Each frame starts with a one byte header,
+    that flags whether the rest of the frame is compressed, and with which compression.
+    Frames smaller than the threshold are not compressed, as compressing them takes more time than
+    sending the bytes saved.
+
+    :param compression: the name of the compression, one of `available_compressions`
+    :param threshold: the size in bytes from which frames are compressed
+    """
+
+    def __init__(self, compression='zlib', threshold=16*1024):
+        self.compression = compression
+        self.threshold = threshold
+        self._header = _compressions[compression].header
+        self._compress = _compressions[compression].compress
+        self.frames = 0
+        self.compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_time = 0.0
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        :return: the frame with the data, compressed if it is at least as large as the threshold.
+        """
+        self.frames += 1
+        if len(data) < self.threshold:
+            return _uncompressed_header + data
+        start = time.thread_time()
+        frame = self._header + self._compress(data)
+        cpu_time = time.thread_time() - start
+        self.compressed += 1
+        self.bytes_in += len(data)
+        self.bytes_out += len(frame)
+        self.cpu_time += cpu_time
+        LOGGER.debug('Compressed frame of {} bytes to {} bytes ({:.1%}) in {:.2f}ms'.format(
+            len(data), len(frame), len(frame) / len(data), cpu_time * 1000
+        ))
+        return frame
+
+    @staticmethod
+    def decompress(frame) -> bytes:
+        """
+        :return: the data in a frame, decompressed with the compression flagged in its header.
+        """
+        header = bytes(frame[:1])
+        if header == _uncompressed_header:
+            return frame[1:]
+        for c in _compressions.values():
+            if c.header == header:
+                return c.decompress(frame[1:])
+        raise ValueError('Unknown frame header {!r}'.format(header))
+
+    def usage(self) -> compression_usage:
+        """
+        :return: the number of frames, the number of compressed frames, the number of bytes before and after
+            compression of those frames, and the cpu time spent compressing them in seconds.
+        """
+        return compression_usage(self.frames, self.compressed, self.bytes_in, self.bytes_out, self.cpu_time)
+
+    @property
+    def ratio(self) -> typing.Optional[float]:
+        """
+        The size of the compressed frames relative to their size before compression, or None if no frames were compressed yet.
+        """
+        if self.bytes_in:
+            return self.bytes_out / self.bytes_in
+
+
 @functools.lru_cache(None)
 def _is_dataclass_type(t):
     """
@@ -147,7 +497,7 @@ class DataclassSerializable(Serializable):
     def write_object(self, stream):
         # for chunk in json_encoder.iterencode(self.asdict(self)):
         #     stream.write(chunk.encode())
-        stream.write(json_encoder.encode(self.asdict(self)))
+        stream.write(json_encoder.encode_dataclass(self))
         # TODO: favored encode() over iterencode(), as the latter is actually slower for small objects.
         #   encode() is a thin wrapper around json.dumps implemented in C (CPython’s json module uses C accelerators when possible),
         #   while iterencode() may fall back to calling Python-level code more often and creating many intermediate small strings.
@@ -171,16 +521,7 @@ class DataclassSerializable(Serializable):
     
     @classmethod
     def _asdict_inner(cls, obj):
-        t = type(obj)
-        if _is_dataclass_type(t):
-            return t.serialize_fields(obj)
-        if t is dict:
-            return {k: cls._asdict_inner(v) for k, v in obj.items()}
-        if t is list:
-            return [cls._asdict_inner(v) for v in obj]
-        if t is tuple:
-            return tuple(cls._asdict_inner(v) for v in obj)
-        return obj
+        return _serialize_value(obj)
 
     @classmethod
     def serialize_fields(cls, obj):
@@ -188,11 +529,7 @@ class DataclassSerializable(Serializable):
         Serialize the given dataclass object's fields.
         By default this will return a dictionary with each field turned into a key-value pair of its name and its value.
         """
-        result = []
-        for f in _dataclass_fields(type(obj)):
-            value = cls._asdict_inner(getattr(obj, f.name))
-            result.append((f.name, value))
-        return dict(result)
+        return _fields_serializer(type(obj))(obj)
 
 class MetaNamedDataclassSerializable(type):
 
@@ -223,3 +560,397 @@ class NamedDataclassSerializable(DataclassSerializable, metaclass=MetaNamedDatac
     @classmethod
     def serialize_fields(cls, obj): 
         return type(obj).__name__, super(NamedDataclassSerializable, cls).serialize_fields(obj)
+
+
+# Types of which the annotated fields need no serialization.
+_primitive_types = (str, int, float, bool, type(None))
+
+def _is_primitive_type(t):
+    """
+    Return True if the given type annotation only allows primitive values, such as `str` or `typing.Optional[int]`.
+    """
+    if t in _primitive_types:
+        return True
+    if typing.get_origin(t) is typing.Union:
+        return all(_is_primitive_type(arg) for arg in typing.get_args(t))
+    return False
+
+def _field_types(t):
+    """
+    Return the type annotation of each field name of the dataclass type t, as far as they can be resolved.
+    """
+    try:
+        return typing.get_type_hints(t)
+    except Exception:
+        # Annotations that refer to names that are not available at runtime can not be resolved.
+        return {f.name: f.type for f in _dataclass_fields(t) if not isinstance(f.type, str)}
+
+def _never(obj):
+    return False
+
+@functools.lru_cache(None)
+def _native_check(t):
+    """
+    Return a function that checks if an instance of dataclass type t can be handed to orjson as it is.
+
+    Orjson serializes the instance dictionary of a dataclass, so this is only possible if the type serializes its fields
+    without envelope, if the instance dictionary contains exactly the dataclass fields, and if the values of the fields
+    can be handed to orjson as well.  As annotations are not enforced, the value of each field is checked at runtime,
+    values of a plain type are recognized without calling a function.
+    """
+    if '__slots__' in t.__dict__ or _get_serializer(t, _fields_serializer) is not _fields_serializer(t):
+        return _never
+    names = []
+    checks = []
+    for f in _dataclass_fields(t):
+        # Fields with a default that are not initialized remain class attributes, so they are missing from
+        # the instance dictionary, unless assigned after initialization.
+        if f.name.startswith('_') or (not f.init and f.default is not dataclasses.MISSING):
+            return _never
+        names.append(f.name)
+        checks.append('(type(obj.{0}) in plain_value_types or is_native(obj.{0}))'.format(f.name))
+    source = 'def check(obj):\n    return {}\n'.format(' and '.join(['tuple(obj.__dict__) == names'] + checks))
+    namespace = {'names': tuple(names), 'is_native': _is_native_value, 'plain_value_types': _plain_value_types}
+    exec(source, namespace)
+    return namespace['check']
+
+def _is_native_dict(obj):
+    return _is_native_sequence(obj.values())
+
+def _is_native_sequence(obj):
+    # Most containers only hold plain values, which is checked without calling a function for each value.
+    if _plain_value_types.issuperset(map(type, obj)):
+        return True
+    return all(_is_native_value(v) for v in obj)
+
+def _get_native_check(t):
+    if _is_dataclass_type(t):
+        check = _native_check(t)
+        # frozen instances are serialized through the fragment cache instead
+        if check is _never or not _is_freezable(t):
+            return check
+        if _is_frozen_type(t):
+            return _never
+        return lambda obj: _serialized_version(obj) is None and check(obj)
+    _plain_value_types.add(t)
+    return None
+
+# Lock that serializes changes to the dispatch tables of the exact types, as `freeze` removes the functions
+# of the frozen types, which should not be added again afterwards by a thread that created them before.
+_dispatch_lock = threading.RLock()
+# The check of each exact type of value encountered, None for values that can always be handed to orjson.
+_native_checks = dict.fromkeys(_primitive_types)
+# The exact types of values that can always be handed to orjson.
+_plain_value_types = set(_primitive_types)
+_native_checks.update({
+    dict: _is_native_dict,
+    list: _is_native_sequence,
+    tuple: _is_native_sequence,
+})
+
+def _is_native_value(obj):
+    """
+    Return True if a value can be handed to orjson as it is, because it would be serialized the same way
+    after `DataclassSerializable.asdict`.
+    """
+    t = type(obj)
+    try:
+        check = _native_checks[t]
+    except KeyError:
+        with _dispatch_lock:
+            check = _native_checks[t] = _get_native_check(t)
+    return check is None or check(obj)
+
+def _generate_fields_serializer(t, serialize_value):
+    """
+    Return a function that serializes the fields of an instance of dataclass type t to a dictionary.
+
+    The function is generated from the dataclass fields, and builds the dictionary in a single expression,
+    without looking up the fields and dispatching on the type of each value at runtime.
+    Values of fields annotated as primitive types are used as they are if they are indeed primitive,
+    the others are passed to serialize_value.
+    """
+    field_types = _field_types(t)
+    items = []
+    for i, f in enumerate(_dataclass_fields(t)):
+        if _is_primitive_type(field_types.get(f.name)):
+            # annotations are not enforced, so the type of the value is checked before using it as it is
+            items.append('{0!r}: (v{1} if type(v{1} := obj.{2}) in primitive_types else serialize_value(v{1}))'.format(f.name, i, f.name))
+        else:
+            items.append('{0!r}: serialize_value(obj.{1})'.format(f.name, f.name))
+    source = 'def serialize_fields(obj):\n    return {{{0}}}\n'.format(', '.join(items))
+    namespace = {'serialize_value': serialize_value, 'primitive_types': frozenset(_primitive_types)}
+    exec(source, namespace)
+    serialize_fields = namespace['serialize_fields']
+    serialize_fields.__qualname__ = '{}.serialize_fields'.format(t.__qualname__)
+    return serialize_fields
+
+@functools.lru_cache(None)
+def _fields_serializer(t):
+    """
+    Return the generated function that serializes the fields of an instance of dataclass type t to a dictionary.
+    """
+    return _generate_fields_serializer(t, _serialize_value)
+
+@functools.lru_cache(None)
+def _fields_encoder(t):
+    """
+    Return the generated function that serializes the fields of an instance of dataclass type t to a dictionary,
+    leaving the values that can be handed to orjson as they are.
+    """
+    return _generate_fields_serializer(t, _encode_value)
+
+def _get_serializer(t, fields_serializer):
+    """
+    Return the function that serializes values of exact type t, or None if those need no serialization.
+    Dataclasses that do not override `serialize_fields` use the generated serializer of their fields,
+    within the envelope of `NamedDataclassSerializable` if needed.
+    """
+    if not _is_dataclass_type(t):
+        return None
+    serialize_fields = getattr(t, 'serialize_fields', None)
+    if serialize_fields is None:
+        return lambda obj: t.serialize_fields(obj)
+    implementation = getattr(serialize_fields, '__func__', None)
+    if implementation is DataclassSerializable.serialize_fields.__func__:
+        return fields_serializer(t)
+    if implementation is NamedDataclassSerializable.serialize_fields.__func__:
+        fields_serializer = fields_serializer(t)
+        name = t.__name__
+        return lambda obj: (name, fields_serializer(obj))
+    return serialize_fields
+
+def _get_value_serializer(t):
+    """
+    Return the function that serializes values of exact type t for `_serialize_value`, or None if those need no serialization.
+    """
+    serializer = _get_serializer(t, _fields_serializer)
+    if _is_freezable(t):
+        return _with_fragment_cache(serializer, serializer, _is_frozen_type(t))
+    return serializer
+
+def _get_encoder(t):
+    """
+    Return the function that prepares values of exact type t for orjson, or None if orjson can serialize them as they are.
+    """
+    serializer = _get_serializer(t, _fields_encoder)
+    if _is_dataclass_type(t):
+        check = _native_check(t)
+        if check is not _never:
+            encoder = serializer
+            serializer = lambda obj: obj if check(obj) else encoder(obj)
+        if _is_freezable(t):
+            return _with_fragment_cache(_get_serializer(t, _fields_serializer), serializer, _is_frozen_type(t))
+    return serializer
+
+def _serialize_dict(obj):
+    return {k: _serialize_value(v) for k, v in obj.items()}
+
+def _serialize_list(obj):
+    return [_serialize_value(v) for v in obj]
+
+def _serialize_tuple(obj):
+    return tuple(_serialize_value(v) for v in obj)
+
+# The serializer of each exact type of value encountered, None for values that need no serialization.
+_serializers = dict.fromkeys(_primitive_types)
+_serializers.update({
+    dict: _serialize_dict,
+    list: _serialize_list,
+    tuple: _serialize_tuple,
+})
+
+def _serialize_value(obj):
+    """
+    Serialize a value of a dataclass field, turning dataclasses, dictionaries, lists and tuples
+    into their serialized form, and leaving other values as they are.
+    """
+    t = type(obj)
+    try:
+        serializer = _serializers[t]
+    except KeyError:
+        with _dispatch_lock:
+            serializer = _serializers[t] = _get_value_serializer(t)
+    if serializer is None:
+        return obj
+    return serializer(obj)
+
+def _encode_dict(obj):
+    return {k: _encode_value(v) for k, v in obj.items()}
+
+def _encode_list(obj):
+    return [_encode_value(v) for v in obj]
+
+def _encode_tuple(obj):
+    return tuple(_encode_value(v) for v in obj)
+
+# The encoder of each exact type of value encountered, None for values that orjson can serialize as they are.
+_encoders = dict.fromkeys(_primitive_types)
+_encoders.update({
+    dict: _encode_dict,
+    list: _encode_list,
+    tuple: _encode_tuple,
+})
+
+def _encode_value(obj):
+    """
+    Prepare a value for orjson, serializing it as `_serialize_value` would, except for the dataclasses
+    that can be handed to orjson as they are.
+    """
+    t = type(obj)
+    try:
+        encoder = _encoders[t]
+    except KeyError:
+        with _dispatch_lock:
+            encoder = _encoders[t] = _get_encoder(t)
+    if encoder is None:
+        return obj
+    return encoder(obj)
+
+
+fragment_usage = collections.namedtuple('fragment_usage', ('fragments', 'max_fragments', 'hits', 'misses', 'evictions'))
+
+class FragmentCache(object):
+    """
+    Cache of the serialized form of frozen dataclass instances, keyed by the identity of the instance and its version.
+    The serialized form of a frozen instance is shared by all frames that contain the instance, so the fragments are
+    not walked again by the serializer, and should not be modified.
+
+    A fragment keeps its instance alive, so the identity of an instance can not be reused while its fragment is cached.
+
+    :param max_fragments: the maximum number of fragments kept, after which the least recently used fragments
+        are evicted, or None if unlimited.
+    """
+
+    def __init__(self, max_fragments=4096):
+        self.max_fragments = max_fragments
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._fragments = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, obj, version, serializer):
+        """
+        Return the cached serialized form of obj at the given version, or serialize it with serializer and cache it.
+        """
+        key = id(obj)
+        with self._lock:
+            entry = self._fragments.get(key)
+            if entry is not None and entry[1] == version and entry[0] is obj:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+        # serialize outside the lock, as frozen instances may contain other frozen instances
+        fragment = serializer(obj)
+        with self._lock:
+            self._fragments[key] = (obj, version, fragment)
+            self._fragments.move_to_end(key)
+            while self.max_fragments is not None and len(self._fragments) > self.max_fragments:
+                self._fragments.popitem(last=False)
+                self.evictions += 1
+        return fragment
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
+
+    def usage(self) -> fragment_usage:
+        """
+        :return: the number of cached fragments, the maximum number of fragments, and the number of hits, misses and evictions.
+        """
+        return fragment_usage(len(self._fragments), self.max_fragments, self.hits, self.misses, self.evictions)
+
+    @property
+    def hit_rate(self) -> typing.Optional[float]:
+        """
+        The fraction of the serializations of frozen instances that were served from the cache, or None if nothing was serialized yet.
+        """
+        retrievals = self.hits + self.misses
+        if retrievals:
+            return self.hits / retrievals
+
+
+fragment_cache = FragmentCache()
+
+# Dataclass types of which all instances are frozen.
+_frozen_types = set()
+# Dataclass types of which individual instances have been frozen.
+_freezable_types = set()
+# The reference to each individually frozen instance and the version of its serialized form, by the identity
+# of the instance.  The state is kept aside, so the instances themselves are not modified.  Instances that can
+# not be weakly referenced are kept alive, so their identity is not reused.
+_frozen_instances = dict()
+
+def _is_frozen_type(t):
+    return any(issubclass(t, frozen_type) for frozen_type in _frozen_types)
+
+def _is_freezable(t):
+    return t in _freezable_types or _is_frozen_type(t)
+
+def _serialized_version(obj, default=None):
+    """
+    Return the version of the serialized form of a frozen instance, or default if the instance was not frozen individually.
+    """
+    entry = _frozen_instances.get(id(obj))
+    if entry is not None:
+        reference, version = entry
+        if reference is obj or (type(reference) is weakref.ref and reference() is obj):
+            return version
+    return default
+
+def _set_serialized_version(obj, version):
+    key = id(obj)
+    try:
+        reference = weakref.ref(obj, lambda _reference: _frozen_instances.pop(key, None))
+    except TypeError:
+        reference = obj
+    _frozen_instances[key] = (reference, version)
+
+def _with_fragment_cache(serialize_fragment, serialize, frozen_type):
+    """
+    Return a function that serializes frozen instances through the fragment cache with serialize_fragment,
+    and the other instances with serialize.
+
+    :param frozen_type: True if all instances of the serialized type are frozen.
+    """
+    default_version = 0 if frozen_type else None
+    def serialize_frozen(obj):
+        version = _serialized_version(obj, default_version)
+        if version is None:
+            return serialize(obj)
+        return fragment_cache.get(obj, version, serialize_fragment)
+    return serialize_frozen
+
+def freeze(obj):
+    """
+    Mark a dataclass instance, or all instances of a dataclass type, as frozen.  The serialized form of a frozen
+    instance is cached in the `fragment_cache` and reused in every frame that contains the instance, until the
+    instance is touched.  This function returns its argument, so it can be used as a class decorator.
+
+    Only instances that are no longer modified, or that are touched after each modification, should be frozen.
+    """
+    t = obj if isinstance(obj, type) else type(obj)
+    if not _is_dataclass_type(t):
+        raise TypeError('{} is not a dataclass'.format(t.__name__))
+    with _dispatch_lock:
+        if obj is t:
+            _frozen_types.add(t)
+        else:
+            _set_serialized_version(obj, 0)
+            _freezable_types.add(t)
+        # the serializers of the affected types are created again, with the fragment cache
+        for serializers in (_serializers, _encoders, _native_checks):
+            for serialized_type in [k for k in serializers if isinstance(k, type) and issubclass(k, t)]:
+                del serializers[serialized_type]
+    return obj
+
+def touch(obj):
+    """
+    Invalidate the cached serialized form of a frozen instance after it has been modified.
+    """
+    with _dispatch_lock:
+        version = _serialized_version(obj, 0 if _is_frozen_type(type(obj)) else None)
+        if version is not None:
+            _set_serialized_version(obj, version + 1)
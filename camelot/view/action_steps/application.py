@@ -32,7 +32,7 @@ import logging
 import typing
 
 from ...admin.action.base import ActionStep, State, ModelContext
-from ...admin.action.application_action import model_context_naming, model_context_counter
+from ...admin.action.application_action import application_context_naming
 from ...admin.admin_route import AdminRoute, Route
 from ...admin.menu import MenuItem
 from ...core.naming import initial_naming_context
@@ -87,7 +87,7 @@ class MainWindow(ActionStep, DataclassSerializable):
     model_context_name: Route = field(default_factory=list)
 
     def __post_init__(self, model_context):
-        self.model_context_name = model_context_naming.bind(str(next(model_context_counter)), model_context)
+        self.model_context_name = application_context_naming.rebind('main_window', model_context, trusted=True)
 
 
 @dataclass
@@ -110,7 +110,7 @@ class NavigationPanel(ActionStep, DataclassSerializable):
 
     # noinspection PyDataclass
     def __post_init__(self, model_context):
-        self.model_context_name = model_context_naming.bind(str(next(model_context_counter)), model_context)
+        self.model_context_name = application_context_naming.rebind('navigation_panel', model_context, trusted=True)
         self._add_action_states(model_context, self.menu.items, self.action_states)
 
     @classmethod
@@ -141,7 +141,7 @@ class NavigationPanel(ActionStep, DataclassSerializable):
             self._add_action_states(model_context, item.items, action_states)
             action_route = item.action_route
             if action_route is not None:
-                action = initial_naming_context.resolve(action_route)
+                action = initial_naming_context.resolve(action_route, trusted=True)
                 state = action.get_state(model_context)
                 action_states.append((action_route, state))
 
@@ -162,7 +162,7 @@ class MainMenu(ActionStep, DataclassSerializable):
     model_context: InitVar(ModelContext) = None
 
     def __post_init__(self, model_context):
-        self.model_context_name = model_context_naming.bind(str(next(model_context_counter)), model_context)
+        self.model_context_name = application_context_naming.rebind('main_menu', model_context, trusted=True)
         self._add_action_states(model_context, self.menu.items, self.action_states)
 
     @classmethod
@@ -174,7 +174,7 @@ class MainMenu(ActionStep, DataclassSerializable):
             self._add_action_states(model_context, item.items, action_states)
             action_route = item.action_route
             if action_route is not None:
-                action = initial_naming_context.resolve(action_route)
+                action = initial_naming_context.resolve(action_route, trusted=True)
                 state = action.get_state(model_context)
                 action_states.append((action_route, state))
 
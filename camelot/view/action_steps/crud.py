@@ -4,10 +4,10 @@ import typing
 logger = logging.getLogger(__name__)
 
 from camelot.view.controls import DelegateType
-from camelot.admin.admin_route import Route
+from camelot.admin.admin_route import AdminRoute, Route
 from camelot.admin.action.base import ActionStep, State
 from camelot.admin.icon import CompletionValue
-from camelot.core.serializable import DataclassSerializable
+from camelot.core.serializable import DataclassSerializable, freeze
 from camelot.view.crud_action import CrudActions, DataUpdate
 from camelot.view.utils import get_settings_group
 
@@ -43,6 +43,9 @@ class DataColumn(ActionStep, DataclassSerializable):
     default_visible: bool # TableView
 
 
+# The frozen columns of each admin route and its field names, built by `SetColumns.for_admin`.
+_admin_columns = dict()
+
 @dataclass
 class SetColumns(ActionStep, DataclassSerializable):
 
@@ -67,6 +70,36 @@ class SetColumns(ActionStep, DataclassSerializable):
                 default_visible = field_name in columns
             ))
 
+    @classmethod
+    def for_admin(cls, admin, field_names):
+        """
+        Construct the column metadata for the given fields of an admin.
+        The columns are built once for each admin and its fields, reusing the column
+        metadata in the `AdminRoute.snapshot` if available.  They are frozen, so their
+        serialized form is reused as well.
+        """
+        field_names = list(field_names)
+        key = (admin.get_admin_route(), tuple(field_names))
+        columns = _admin_columns.get(key)
+        if columns is None:
+            columns = cls._build_columns(admin, field_names)
+            for column in columns:
+                freeze(column)
+            columns = _admin_columns.setdefault(key, columns)
+        return cls(admin, [], columns=list(columns))
+
+    @classmethod
+    def _build_columns(cls, admin, field_names):
+        snapshot = AdminRoute.snapshot
+        if snapshot is not None:
+            columns = snapshot.get_columns(admin, field_names)
+            if columns is not None:
+                return [DataColumn(**column) for column in columns]
+        columns = cls(admin, admin.get_static_field_attributes(field_names)).columns
+        if snapshot is not None:
+            snapshot.set_columns(admin, field_names, [column._to_dict() for column in columns])
+        return columns
+
     def get_delegate_state(self, static_field_attributes):
         fa = static_field_attributes
         delegate_type = fa['delegate'].delegate_type
@@ -137,7 +170,16 @@ class Update(ActionStep, DataUpdate):
 
 @dataclass
 class ChangeSelection(ActionStep, DataclassSerializable):
+    """
+    Update the states of the actions of a table view after its selection changed.
+
+    :param action_states: the route and state of the actions.
+    :param resync: True if the action states are complete and replace all previous states,
+        False if only the states that changed since the previous `ChangeSelection` of the
+        same view are included.
+    """
 
     blocking: ClassVar[bool] = False
 
     action_states: List[Tuple[Route, State]] = field(default_factory=list)
+    resync: bool = True
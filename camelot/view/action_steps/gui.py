@@ -33,11 +33,12 @@ Various ``ActionStep`` subclasses that manipulate the GUI of the application.
 
 import traceback
 import typing
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
 from io import StringIO
 from typing import List, Union
 
 from camelot.admin.action.base import ActionStep
+from camelot.admin.action.application_action import model_context_naming
 from camelot.admin.icon import Icon
 from camelot.core.exception import UserException
 from camelot.core.naming import initial_naming_context
@@ -91,10 +92,30 @@ class CloseView(ActionStep, DataclassSerializable):
         instead of accepting the close event.  The close action might involve
         validating if the view can be closed, or requesting confirmation from
         the user.
+    :param model_context: the model context of the view that is closed, if
+        the close event is accepted, the model context is released on the
+        server once the step has been sent.  This defaults to the model context
+        of the action that yields this step.
     """
 
     blocking: bool = False
     accept: bool = True
+    model_context: InitVar[typing.Any] = None
+
+    def __post_init__(self, model_context):
+        self._model_context = model_context
+
+    def closes(self, model_context):
+        """
+        Set the model context of the view that is closed, unless it was given explicitly.
+        """
+        if self._model_context is None:
+            self._model_context = model_context
+
+    def sent(self):
+        if self.accept and (self._model_context is not None):
+            model_context_naming.release(self._model_context)
+            self._model_context = None
 
 
 @dataclass
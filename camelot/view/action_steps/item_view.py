@@ -36,7 +36,7 @@ from typing import Union, List, Tuple, Any
 import logging
 
 from ...admin import AbstractAdmin
-from ...admin.admin_route import Route, RouteWithRenderHint
+from ...admin.admin_route import AdminRoute, Route, RouteWithRenderHint
 from ...admin.action import ActionStep, State
 from ...admin.action.application_action import model_context_naming, model_context_counter
 from ...admin.model_context import ObjectsModelContext
@@ -48,6 +48,7 @@ from ...core.serializable import DataclassSerializable
 from ...core.utils import ugettext_lazy
 from ...view.utils import get_settings_group
 from ...view.crud_action import CrudActions
+from .crud import SetColumns
 
 LOGGER = logging.getLogger(__name__)
 
@@ -97,7 +98,7 @@ class AbstractCrudView(ActionStep, DataclassSerializable):
     @staticmethod
     def _add_action_states(model_context, actions, action_states):
         for action_route in actions:
-            action = initial_naming_context.resolve(action_route.route)
+            action = initial_naming_context.resolve(action_route.route, trusted=True)
             state = action.get_state(model_context)
             action_states.append((action_route.route, state))
 
@@ -106,7 +107,7 @@ class AbstractCrudView(ActionStep, DataclassSerializable):
 
         :return: the list of objects to display in the form view
         """
-        model_context = initial_naming_context.resolve(self.model_context_name)
+        model_context = initial_naming_context.resolve(self.model_context_name, trusted=True)
         return model_context.proxy.get_model()
 
 @dataclass
@@ -134,12 +135,18 @@ class UpdateTableView(AbstractCrudView):
         assert (search_text is None) or isinstance(search_text, str)
         self.title = admin.get_verbose_name_plural()
         self._add_actions(admin, self.actions)
-        for field_name in admin.get_columns():
-            fa = list(admin.get_static_field_attributes([field_name]))
-            self.columns.append(Column(field_name, fa[0]['name'], True))
-        for field_name in admin.get_extra_columns():
-            fa = list(admin.get_static_field_attributes([field_name]))
-            self.columns.append(Column(field_name, fa[0]['name'], False))
+        if AdminRoute.snapshot is not None:
+            # reuse the verbose names in the column metadata of the snapshot
+            field_names = list(admin.get_columns()) + list(admin.get_extra_columns())
+            for column in SetColumns.for_admin(admin, field_names).columns:
+                self.columns.append(Column(column.field_name, column.verbose_name, column.default_visible))
+        else:
+            for field_name in admin.get_columns():
+                fa = list(admin.get_static_field_attributes([field_name]))
+                self.columns.append(Column(field_name, fa[0]['name'], True))
+            for field_name in admin.get_extra_columns():
+                fa = list(admin.get_static_field_attributes([field_name]))
+                self.columns.append(Column(field_name, fa[0]['name'], False))
         self.list_action = admin.get_list_action()
         self.close_route = None
         if proxy is None:
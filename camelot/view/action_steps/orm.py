@@ -82,7 +82,7 @@ class CreateUpdateDelete(ActionStep, DataclassSerializable):
         if len(objects_created):
             self.created = leases.bind(str(next(self._lease_counter)), objects_created)
         if len(leases) > 10:
-            LOGGER.warn('Number of leases is growing to {}'.format(len(leases)))
+            LOGGER.warn('Number of leases is growing to {}, holding {} bytes'.format(len(leases), leases.bytes_held))
 
 
 class FlushSession(CreateUpdateDelete):
@@ -139,7 +139,7 @@ class UpdateObjects(CreateUpdateDelete):
 
     def get_objects(self):
         """Use this method to get access to the objects to change in unit tests"""
-        return initial_naming_context.resolve(self.updated)
+        return initial_naming_context.resolve(self.updated, trusted=True)
 
 class DeleteObjects(CreateUpdateDelete):
     """Inform the GUI that objects are going to be deleted.
@@ -152,7 +152,7 @@ class DeleteObjects(CreateUpdateDelete):
 
     def get_objects(self):
         """Use this method to get access to the objects to change in unit tests"""
-        return initial_naming_context.resolve(self.deleted)
+        return initial_naming_context.resolve(self.deleted, trusted=True)
 
 class CreateObjects(CreateUpdateDelete):
     """Inform the GUI that objects were created.
@@ -165,4 +165,4 @@ class CreateObjects(CreateUpdateDelete):
 
     def get_objects(self):
         """Use this method to get access to the objects to change in unit tests"""
-        return initial_naming_context.resolve(self.created)
+        return initial_naming_context.resolve(self.created, trusted=True)
@@ -30,7 +30,7 @@
 from dataclasses import dataclass, field
 import typing
 
-from camelot.core.naming import initial_naming_context, NameNotFoundException
+from camelot.core.naming import initial_naming_context, not_found
 from camelot.admin.action.base import Mode
 
 from .item_view import OpenTableView
@@ -63,7 +63,7 @@ class SelectObjects(OpenTableView):
         self.verbose_name = str(admin.get_verbose_name_plural())
         self.action_states = list()
         self._add_action_states(
-            initial_naming_context.resolve(self.model_context_name),
+            initial_naming_context.resolve(self.model_context_name, trusted=True),
             self.actions,
             self.action_states
         )
@@ -81,9 +81,8 @@ class SelectObjects(OpenTableView):
         # the model context that started the action is no the same
         # as the one in which the selection was made
         objects = []
-        try:
-            model_context = initial_naming_context.resolve(tuple(response['model_context_name']))
-        except NameNotFoundException:
+        model_context = initial_naming_context.lookup(tuple(response['model_context_name']))
+        if model_context is not_found:
             return objects
         proxy = model_context.proxy
         if proxy is not None:
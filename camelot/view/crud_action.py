@@ -7,7 +7,7 @@ from camelot.core.item_model import (
     VisibleRole, NullableRole, IsStatusRole
 )
 from camelot.core.qt import Qt, QtGui
-from camelot.core.serializable import DataclassSerializable
+from camelot.core.serializable import DataclassSerializable, ImagePreview, image_encoder
 
 from dataclasses import dataclass, field, InitVar
 from typing import Any, Dict, List, Optional
@@ -56,6 +56,21 @@ class DataUpdate(DataclassSerializable):
         for row, header_item, items in changed_ranges:
             self.header_items.append(header_item)
             self.cells.extend(items)
+        # encode the images in the cells as a batch, before the update is serialized
+        images = []
+        for cell in self.cells:
+            roles = cell.roles
+            for role in image_roles:
+                value = roles.get(role)
+                if type(value) in image_types:
+                    images.append(value)
+        if len(images) > 1:
+            image_encoder.prefetch(images)
+
+
+image_roles = (Qt.ItemDataRole.EditRole.value, PreviewRole)
+# compared by type instead of isinstance, since isinstance checks of Qt types are slow
+image_types = frozenset((QtGui.QImage, ImagePreview))
 
 
 invalid_item = DataCell()
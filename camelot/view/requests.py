@@ -1,14 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields, is_dataclass, replace
+import copy
+import functools
 import logging
 import typing
-
-import orjson
+import weakref
 
 from ..core.exception import CancelRequest, GuiException
 from ..core.naming import (
-    CompositeName, NamingException, NameNotFoundException, initial_naming_context
+    CompositeName, NamingException, NameNotFoundException, NameTable, initial_naming_context, not_found
+)
+from ..core.serializable import (
+    DataclassSerializable, FrameCompressor, NamedDataclassSerializable, Serializable, available_codecs, available_compressions,
+    get_codec, json_codec
 )
-from ..core.serializable import NamedDataclassSerializable, Serializable
 
 LOGGER = logging.getLogger('camelot.view.requests')
 
@@ -25,17 +29,317 @@ class ModelRun(object):
         self.model_context = model_context
 
 model_run_names = initial_naming_context.bind_new_context('model_run')
+leases = initial_naming_context.resolve_context('leases')
+
+def _composite_name(name, name_table=None) -> CompositeName:
+    """
+    Convert a name received from the client to its composite form and validate it,
+    so it can be passed as a trusted name to the naming contexts afterwards.
+
+    :param name_table: the name table of the connection, if the client may refer to the name by its id.
+
+    :raises:
+        NamingException NamingException.Message.invalid_name: when the name is not a valid composite name.
+        NameNotFoundException NamingException.Message.name_not_found: when the name refers to an unknown id.
+    """
+    if name_table is not None:
+        name = name_table.get_name(name)
+    if not isinstance(name, (list, tuple)):
+        raise NamingException(NamingException.Message.invalid_name, reason=NamingException.Message.invalid_composite_name)
+    name = tuple(name)
+    initial_naming_context.validate_composite_name(name)
+    return name
+
+
+def _is_route_type(t):
+    """
+    Return True if the type annotation t is a route, or an optional route.
+    """
+    from ..admin.admin_route import AdminRoute, Route
+    if typing.get_origin(t) is typing.Union:
+        args = [arg for arg in typing.get_args(t) if arg is not type(None)]
+        return len(args) == 1 and _is_route_type(args[0])
+    return t is AdminRoute or t == Route or t == CompositeName
+
+@functools.lru_cache(None)
+def _route_fields(step_type):
+    """
+    Return the names of the fields of an action step class that contain routes, per kind of field,
+    as derived from the field annotations :
+
+     * `Route`, `CompositeName` and `AdminRoute` fields, which are routes themselves.
+     * lists of tuples with a route as first element, such as the action states.
+     * lists of `camelot.admin.admin_route.RouteWithRenderHint`.
+    """
+    from ..admin.admin_route import RouteWithRenderHint
+    try:
+        field_types = typing.get_type_hints(step_type)
+    except (NameError, TypeError):
+        field_types = {}
+    routes, route_tuples, render_hints = [], [], []
+    for step_field in fields(step_type):
+        t = field_types.get(step_field.name, step_field.type)
+        if _is_route_type(t):
+            routes.append(step_field.name)
+        elif typing.get_origin(t) is list and len(typing.get_args(t)) == 1:
+            item_type = typing.get_args(t)[0]
+            if item_type is RouteWithRenderHint:
+                render_hints.append(step_field.name)
+            elif typing.get_origin(item_type) is tuple and len(typing.get_args(item_type)) \
+                 and _is_route_type(typing.get_args(item_type)[0]):
+                route_tuples.append(step_field.name)
+    return tuple(routes), tuple(route_tuples), tuple(render_hints)
+
+# Root contexts of the names that are interned.  Names in other contexts, such as leases and model contexts,
+# are bound for a limited time, and interning them would grow the name table without bound.
+_interned_contexts = frozenset(('admin',))
+
+def _intern_route(route, name_table: NameTable):
+    if len(route) and route[0] in _interned_contexts:
+        return name_table.intern(route)
+    return route
+
+def _intern_routes(step, name_table: NameTable):
+    """
+    Return a shallow copy of an action step, with its routes replaced by their id in the name table.
+    The fields that contain routes are found through their annotations, see `_route_fields`, and only
+    routes in one of the `_interned_contexts` are replaced.
+    Only the fields of the step itself are inspected, to keep the cost independent of the size of eg. data updates.
+    """
+    from ..admin.admin_route import RouteWithRenderHint
+    routes, route_tuples, render_hints = _route_fields(type(step))
+    interned_step = copy.copy(step)
+    for name in routes:
+        value = getattr(step, name)
+        if isinstance(value, (tuple, list)):
+            setattr(interned_step, name, _intern_route(value, name_table))
+    for name in route_tuples:
+        value = getattr(step, name)
+        if value:
+            setattr(interned_step, name, [(_intern_route(route, name_table), *rest) for route, *rest in value])
+    for name in render_hints:
+        value = getattr(step, name)
+        if value:
+            setattr(interned_step, name, [
+                replace(item, route=_intern_route(item.route, name_table)) if isinstance(item, RouteWithRenderHint) else item
+                for item in value
+            ])
+    return interned_step
+
+
+class SentActionStates(object):
+    """
+    The action states last sent to the client for each model context, so that `ChangeSelection` steps
+    only need to include the states that changed since.  The model contexts are weakly referenced, so their
+    states are forgotten together with their model context.
+
+    The states are remembered in their serialized form, as actions might modify and return the same state
+    object, or modify the objects it refers to.
+    """
+
+    def __init__(self):
+        self._states = weakref.WeakKeyDictionary()
+        self.resyncs = 0
+        self.deltas = 0
+
+    @staticmethod
+    def _serialized_state(state):
+        # steps such as `UpdateActionsState` carry states that are serialized to a dictionary already,
+        # which are copied as well
+        return DataclassSerializable._asdict_inner(state)
+
+    @classmethod
+    def _serialized_states(cls, action_states):
+        return {tuple(route): cls._serialized_state(state) for route, state in action_states}
+
+    def changes(self, model_context, action_states):
+        """
+        Remember the action states sent for a model context, and return the states to send.
+
+        :return: a tuple `(resync, action_states)`, where resync is True if all the action states should be sent,
+            because no states were sent before for the model context, or because an action is no longer part of them.
+            Otherwise resync is False, and action_states only contains the states that differ from the states sent before.
+        """
+        serialized = [self._serialized_state(state) for _route, state in action_states]
+        states = {tuple(route): serialized_state for (route, _state), serialized_state in zip(action_states, serialized)}
+        try:
+            previous = self._states.get(model_context)
+            self._states[model_context] = states
+        except TypeError:
+            # model contexts that are not hashable or can not be weakly referenced are always resynced
+            previous = None
+        if previous is None or not previous.keys() <= states.keys():
+            self.resyncs += 1
+            return True, action_states
+        self.deltas += 1
+        return False, [
+            (route, state) for (route, state), serialized_state in zip(action_states, serialized)
+            if previous.get(tuple(route)) != serialized_state
+        ]
+
+    def record(self, model_context, action_states):
+        """
+        Remember the complete action states sent for a model context by another step than `ChangeSelection`,
+        such as the step that opens the view of the model context.
+        """
+        try:
+            self._states[model_context] = self._serialized_states(action_states)
+        except TypeError:
+            pass
+
+    def update(self, model_context, action_states):
+        """
+        Remember the action states sent for some of the actions of a model context by another step than
+        `ChangeSelection`, such as `UpdateActionsState`.
+        """
+        try:
+            previous = self._states.get(model_context)
+        except TypeError:
+            return
+        if previous is not None:
+            previous.update(self._serialized_states(action_states))
+
+
+def _invalid_field(request_type, field_name, value):
+    return TypeError('{} request has an invalid {} : {!r}'.format(request_type.__name__, field_name, value))
+
+def _isinstance_types(t):
+    """
+    Return the classes an instance of the type annotation t should be an instance of, or None if the
+    annotation can not be checked with `isinstance`, such as `typing.Any` or generic aliases.
+    """
+    if typing.get_origin(t) is typing.Union:
+        args = [_isinstance_types(arg) for arg in typing.get_args(t)]
+        if None in args:
+            return None
+        return sum(args, ())
+    if isinstance(t, type) and typing.get_origin(t) is None and t not in (Serializable, object):
+        return (t,)
+    return None
+
+@functools.lru_cache(None)
+def _request_deserializer(request_type):
+    """
+    Return a function that builds a request of request_type from the request data received from the client
+    and the name table of the connection.
+
+    The function is generated from the dataclass fields and their annotations, so each field is converted and
+    checked in a single pass, without dispatching on the annotations at runtime :
+
+     * `CompositeName` fields, and lists of them, are turned into validated tuples, resolving the ids of interned names.
+     * fields annotated as classes, or unions of classes, are checked with `isinstance`.
+     * other fields, such as serialized responses, are passed as they are.
+
+    Missing fields that have a default get their default value.
+
+    :raises:
+        KeyError: when the data lacks a field without default.
+        TypeError: when a field has a value of an invalid type.
+        NamingException: when a composite name is invalid or refers to an unknown id.
+    """
+    field_types = typing.get_type_hints(request_type)
+    namespace = {
+        'request_type': request_type, 'composite_name': _composite_name, 'invalid': _invalid_field, 'str_type': {str},
+    }
+    lines = ['def deserialize(data, name_table):']
+    for f in fields(request_type):
+        name, t = f.name, field_types[f.name]
+        if f.default is not MISSING:
+            namespace['default_' + name] = f.default
+            lines.append('    {0} = data.get({0!r}, default_{0})'.format(name))
+        elif f.default_factory is not MISSING:
+            namespace['factory_' + name] = f.default_factory
+            lines.append('    {0} = data[{0!r}] if {0!r} in data else factory_{0}()'.format(name))
+        else:
+            lines.append('    {0} = data[{0!r}]'.format(name))
+        if t == CompositeName:
+            # names sent as a list of strings are converted inline, others are resolved and validated by _composite_name
+            lines.append('    if type({0}) is list and {0} and str_type.issuperset(map(type, {0})):'.format(name))
+            lines.append('        {0} = tuple({0})'.format(name))
+            lines.append('    else:')
+            lines.append('        {0} = composite_name({0}, name_table)'.format(name))
+        elif t == typing.List[CompositeName]:
+            lines.append('    if type({0}) is not list:'.format(name))
+            lines.append('        raise invalid(request_type, {0!r}, {0})'.format(name))
+            lines.append('    {0} = [composite_name(name, name_table) for name in {0}]'.format(name))
+        else:
+            types = _isinstance_types(t)
+            if types is not None:
+                namespace['types_' + name] = types
+                lines.append('    if not isinstance({0}, types_{0}):'.format(name))
+                lines.append('        raise invalid(request_type, {0!r}, {0})'.format(name))
+    lines.append('    return request_type({})'.format(', '.join('{0}={0}'.format(f.name) for f in fields(request_type))))
+    exec('\n'.join(lines) + '\n', namespace)
+    deserialize = namespace['deserialize']
+    deserialize.__qualname__ = '{}.deserialize'.format(request_type.__qualname__)
+    return deserialize
 
 
 class AbstractClientConnection(object):
     """
     Interface to access the connection to the end-client
+
+    .. attribute:: name_table
+
+        The :class:`camelot.core.naming.NameTable` of this connection, once the client requested
+        to refer to routes by their id, None otherwise.
+
+    .. attribute:: codec
+
+        The :class:`camelot.core.serializable.AbstractCodec` used to decode requests and encode responses,
+        json unless the client selected another one of the codecs offered by this connection.
+
+    .. attribute:: sent_action_states
+
+        The :class:`SentActionStates` of this connection, once the client requested to receive only the
+        changed action states in :class:`camelot.view.action_steps.ChangeSelection` steps, None otherwise.
+
+    .. attribute:: compression
+
+        The :class:`camelot.core.serializable.FrameCompressor` of this connection, once the client selected
+        one of the compressions offered by this connection, None otherwise.
+
+    .. attribute:: compression_threshold
+
+        The size in bytes from which frames are compressed, once the client selected a compression.
+        This can be tuned per deployment, using the ratio and cpu time reported by the compressor.
     """
 
+    name_table = None
+    codec = json_codec
+    sent_action_states = None
+    compression = None
+    compression_threshold = 16 * 1024
+
     def send_response(self, response):
         """Send a response back to the client"""
         raise NotImplementedError()
 
+    def offered_codecs(self) -> typing.List[str]:
+        """
+        The names of the codecs the client can select on this connection, as offered
+        in the :class:`camelot.view.responses.Ready` response.  By default all available codecs.
+        """
+        return available_codecs()
+
+    def offered_compressions(self) -> typing.List[str]:
+        """
+        The names of the compressions the client can select on this connection, as offered
+        in the :class:`camelot.view.responses.Ready` response.  By default all available compressions.
+        """
+        return available_compressions()
+
+    def serialize_response(self, response) -> bytes:
+        """
+        Encode a response with the codec of this connection, and put it in a compression frame
+        if the client selected a compression.  Implementations of `send_response` use this
+        method to obtain the bytes to send.
+        """
+        data = self.codec.encode_dataclass(response)
+        if self.compression is not None:
+            return self.compression.compress(data)
+        return data
+
     def has_cancel_request(self):
         """Check if the client has sent a cancel request"""
         raise NotImplementedError()
@@ -63,22 +367,105 @@ class AbstractRequest(NamedDataclassSerializable):
 
     @classmethod
     def handle_request(cls, request, connection: AbstractClientConnection):
-        request_type_name, request_data = orjson.loads(request)
-        request_type = NamedDataclassSerializable.get_cls_by_name(
-            request_type_name
-        )
-        request_type.execute(request_data, connection)
+        try:
+            request_type_name, request_data = connection.codec.decode(request)
+        except (TypeError, ValueError) as e:
+            LOGGER.error('Received malformed request frame : {}'.format(e))
+            return
+        request_type = None
+        if isinstance(request_type_name, str):
+            request_type = NamedDataclassSerializable.get_cls_by_name(
+                request_type_name
+            )
+        if request_type is None or not issubclass(request_type, AbstractRequest):
+            LOGGER.error('Received unknown request type : {}'.format(request_type_name))
+            return
+        if not isinstance(request_data, dict):
+            request_type.reject(request_data, TypeError('request data should be a dict'), connection)
+            return
+        try:
+            typed_request = request_type.deserialize(request_data, connection.name_table)
+        except (KeyError, TypeError, NamingException) as e:
+            request_type.reject(request_data, e, connection)
+            return
+        request_type.execute(typed_request, connection)
+
+    @classmethod
+    def deserialize(cls, request_data, name_table: typing.Optional[NameTable]=None):
+        """
+        Build a request of this type from the request data received from the client, checking
+        and converting its fields with the deserializer generated for this type.
+
+        :param name_table: the name table of the connection, if the client may refer to names by their id.
+        """
+        return _request_deserializer(cls)(request_data, name_table)
 
     @classmethod
-    def execute(cls, request_data, connection: AbstractClientConnection):
+    def reject(cls, request_data, error, connection: AbstractClientConnection):
+        """
+        Called instead of `execute` when the request data could not be deserialized.
+        The default implementation logs the error.
+        """
+        LOGGER.error('Rejected malformed {} request {} : {}'.format(
+            cls.__name__, request_data, getattr(error, 'message_text', error)
+        ))
+
+    @classmethod
+    def execute(cls, request, connection: AbstractClientConnection):
         cls._iterate_until_blocking(
-            request_data, connection
+            request.run_name, request, connection
         )
 
     @classmethod
-    def _next(cls, run: ModelRun, request_data):
+    def _next(cls, run: ModelRun, request):
         return None
 
+    @classmethod
+    def _step_payload(cls, step, connection: AbstractClientConnection, model_context=None):
+        """
+        Return the step to send in an ActionStepped response.  When the connection has a name table,
+        the step is serialized with its routes replaced by their id, and the ids of new routes are sent first.
+        When the connection keeps the sent action states, a `ChangeSelection` step only contains the states
+        that changed since the previous one of the same model context.
+        """
+        sent_action_states = connection.sent_action_states
+        if sent_action_states is not None:
+            action_states = getattr(step, 'action_states', None)
+            if action_states is not None:
+                step = cls._track_action_states(step, action_states, sent_action_states, model_context)
+        name_table = connection.name_table
+        if name_table is None or not is_dataclass(step):
+            return (type(step).__name__, step)
+        from .responses import NameTableUpdate
+        interned_step = _intern_routes(step, name_table)
+        unsent = name_table.take_unsent()
+        if len(unsent):
+            connection.send_response(NameTableUpdate(names=unsent))
+        return (type(step).__name__, interned_step)
+
+    @classmethod
+    def _track_action_states(cls, step, action_states, sent_action_states: SentActionStates, model_context):
+        """
+        Keep the sent action states up to date with every step that carries action states, and return
+        the step with only the changed states in case of a `ChangeSelection`.
+        """
+        from .action_steps import ChangeSelection
+        if type(step) is ChangeSelection:
+            if model_context is not None:
+                resync, action_states = sent_action_states.changes(model_context, action_states)
+                if not resync:
+                    step = replace(step, action_states=action_states, resync=False)
+            return step
+        # steps that open a view carry the complete states of the model context of that view
+        view_context_name = getattr(step, 'model_context_name', None)
+        if view_context_name:
+            view_context = initial_naming_context.lookup(tuple(view_context_name), trusted=True)
+            if view_context is not not_found:
+                sent_action_states.record(view_context, action_states)
+        elif model_context is not None:
+            sent_action_states.update(model_context, action_states)
+        return step
+
     @classmethod
     def _stop_action(cls, run_name, gui_run_name, connection: AbstractClientConnection, e):
         from .action_steps import PopProgressLevel
@@ -94,7 +481,7 @@ class AbstractRequest(NamedDataclassSerializable):
         # so the client can let go of the run
         if run_name != ('constant', 'null'):
             try:
-                initial_naming_context.unbind(run_name)
+                initial_naming_context.unbind(run_name, trusted=True)
             except NameNotFoundException:
                 LOGGER.error('Request to unbind a non existing run name {}'.format(run_name))
 
@@ -113,63 +500,69 @@ class AbstractRequest(NamedDataclassSerializable):
         cls._stop_action(run_name, gui_run_name, connection, e)
 
     @classmethod
-    def _iterate_until_blocking(cls, request_data, connection: AbstractClientConnection):
+    def _iterate_until_blocking(cls, run_name: CompositeName, request, connection: AbstractClientConnection):
         """Helper calling for generator methods.  The decorated method iterates
         the generator until the generator yields an :class:`ActionStep` object that
         is blocking.  If a non blocking :class:`ActionStep` object is yielded, then
         send it to the GUI thread for execution through the signal slot mechanism.
         
-        :param generator_method: the method of the generator to be called
-        :param *args: the arguments to use when calling the generator method.
+        :param run_name: the validated name of the run to iterate
+        :param request: the request that is passed to `_next`
         """
         from ..admin.action import ActionStep
+        from .action_steps import CloseView
         from .responses import ActionStepped
-        try:
-            run_name = tuple(request_data['run_name'])
-            run = initial_naming_context.resolve(run_name)
-        except NameNotFoundException:
-            LOGGER.error('Run name not found : {} for request {}'.format(run_name, request_data))
+        run = initial_naming_context.lookup(run_name, trusted=True)
+        if run is not_found:
+            LOGGER.error('Run name not found : {} for request {}'.format(run_name, request))
             return
         if run is None:
-            LOGGER.error('Request contains no run {}'.format(request_data))
+            LOGGER.error('Request contains no run {}'.format(request))
             return
         gui_run_name = run.gui_run_name
-        try:
-            result = cls._next(run, request_data)
-            while True:
-                if isinstance(result, ActionStep):
-                    run.last_step = result
-                    connection.send_response(ActionStepped(
-                        run_name=run_name, gui_run_name=gui_run_name,
-                        step=(type(result).__name__, result),
-                        blocking=result.blocking,
-                    ))
-                    if result.blocking:
-                        # this step is blocking, interrupt the loop
-                        return
-                #
-                # Cancel requests can arrive asynchronously through non 
-                # blocking ActionSteps such as UpdateProgress
-                #
-                if connection.has_cancel_request():
-                    LOGGER.debug( 'asynchronous cancel, raise request' )
-                    result = run.generator.throw(CancelRequest())
-                else:
-                    result = next(run.generator)
-        except CancelRequest as e:
-            LOGGER.debug( 'iterator raised cancel request, pass it' )
-            # After the iterator raised a CancelRequest, it will still raise
-            # a StopIteration, so there is no need to stop the action now.
-            # However not doing so results in the progress popup not being
-            # popped in certain cases (eg run forward all schedules -> cancel)
-            cls._stop_action(run_name, gui_run_name, connection, e)
-        except StopIteration as e:
-            cls._stop_action(run_name, gui_run_name, connection, e)
-        except Exception as e:
-            LOGGER.error('Unhandled exception', exc_info=e)
-            cls._send_stop_message(
-                ('constant', 'null'), gui_run_name, connection, e
-            )
+        # Leases bound while iterating are owned by this run
+        with leases.owned_by(run_name, connection):
+            try:
+                result = cls._next(run, request)
+                while True:
+                    if isinstance(result, ActionStep):
+                        run.last_step = result
+                        if type(result) is CloseView:
+                            # the view that is closed is the view of the model context the action runs in
+                            result.closes(run.model_context)
+                        connection.send_response(ActionStepped(
+                            run_name=run_name, gui_run_name=gui_run_name,
+                            step=cls._step_payload(result, connection, run.model_context),
+                            blocking=result.blocking,
+                        ))
+                        result.sent()
+                        if result.blocking:
+                            # this step is blocking, interrupt the loop
+                            return
+                    #
+                    # Cancel requests can arrive asynchronously through non 
+                    # blocking ActionSteps such as UpdateProgress
+                    #
+                    if connection.has_cancel_request():
+                        LOGGER.debug( 'asynchronous cancel, raise request' )
+                        result = run.generator.throw(CancelRequest())
+                    else:
+                        result = next(run.generator)
+            except CancelRequest as e:
+                LOGGER.debug( 'iterator raised cancel request, pass it' )
+                # After the iterator raised a CancelRequest, it will still raise
+                # a StopIteration, so there is no need to stop the action now.
+                # However not doing so results in the progress popup not being
+                # popped in certain cases (eg run forward all schedules -> cancel)
+                cls._stop_action(run_name, gui_run_name, connection, e)
+            except StopIteration as e:
+                cls._stop_action(run_name, gui_run_name, connection, e)
+            except Exception as e:
+                LOGGER.error('Unhandled exception', exc_info=e)
+                cls._send_stop_message(
+                    ('constant', 'null'), gui_run_name, connection, e
+                )
+
 
 @dataclass
 class InitiateAction(AbstractRequest):
@@ -180,41 +573,50 @@ class InitiateAction(AbstractRequest):
     gui_run_name: CompositeName
     action_name: CompositeName
     model_context: CompositeName
-    mode: typing.Union[str, dict, list, int]
+    mode: typing.Union[str, dict, list, int, float, None] = None
 
     @classmethod
-    def _next(cls, run: ModelRun, request_data):
+    def _next(cls, run: ModelRun, request):
         # initiate action should implement next to make sure the action
         # continues until its first step right after starting the action
         return next(run.generator)
 
     @classmethod
-    def execute(cls, request_data, connection: AbstractClientConnection):
+    def reject(cls, request_data, error, connection: AbstractClientConnection):
+        from .responses import ActionStopped
+        super().reject(request_data, error, connection)
+        # let the client know its run will not start, if it can be identified
+        try:
+            gui_run_name = tuple(request_data['gui_run_name'])
+        except (KeyError, TypeError):
+            return
+        connection.send_response(ActionStopped(
+            run_name=('constant', 'null'), gui_run_name=gui_run_name, exception=None
+        ))
+
+    @classmethod
+    def execute(cls, request, connection: AbstractClientConnection):
         from .action_steps import PushProgressLevel
         from .responses import ActionStopped, ActionStepped
-        gui_run_name = tuple(request_data['gui_run_name'])
+        gui_run_name = request.gui_run_name
         LOGGER.debug('Run of action {} with mode {} on model context {}'.format(
-            request_data['action_name'], request_data['mode'], request_data['model_context']
+            request.action_name, request.mode, request.model_context
         ))
-        try:
-            action = initial_naming_context.resolve(tuple(request_data['action_name']))
-            model_context = initial_naming_context.resolve(tuple(request_data['model_context']))
-        except (NamingException, NameNotFoundException) as e:
-            if isinstance(e, NamingException):
-                LOGGER.error('Could not resolve action from gui_run {}, invalid name: {}'.format(
-                    gui_run_name, e.message_text
-                ))
-            else:
+        action = initial_naming_context.lookup(request.action_name, trusted=True)
+        model_context = initial_naming_context.lookup(request.model_context, trusted=True)
+        for name, obj in ((request.action_name, action), (request.model_context, model_context)):
+            if obj is not_found:
                 LOGGER.error('Could not resolve action from gui_run {}, no binding for name: {}'.format(
-                    gui_run_name, e.name
+                    gui_run_name, name
                 ))
+        if action is not_found or model_context is not_found:
             connection.send_response(ActionStopped(
                 run_name=('constant', 'null'), gui_run_name=gui_run_name, exception=None
             ))
             return
         generator, exception = None, None
         try:
-            generator = action.model_run(model_context, request_data.get('mode'))
+            generator = action.model_run(model_context, request.mode)
         except Exception as exc:
             exception = str(exc)
         if generator is None:
@@ -228,10 +630,9 @@ class InitiateAction(AbstractRequest):
             run_name=run_name, gui_run_name=gui_run_name, blocking=False,
             step=(PushProgressLevel.__name__, PushProgressLevel('Please wait'))
         ))
-        request_data["run_name"] = run_name
-        LOGGER.debug('Action {} runs in generator {}'.format(request_data['action_name'], run_name))
+        LOGGER.debug('Action {} runs in generator {}'.format(request.action_name, run_name))
         cls._iterate_until_blocking(
-            request_data, connection
+            run_name, request, connection
         )
 
 @dataclass
@@ -245,9 +646,9 @@ class SendActionResponse(AbstractRequest):
     response: Serializable
 
     @classmethod
-    def _next(cls, run, request_data):
+    def _next(cls, run, request):
         response = run.last_step.deserialize_result(
-            run.model_context, request_data['response']
+            run.model_context, request.response
         )
         return run.generator.send(response)
 
@@ -262,9 +663,9 @@ class ThrowActionException(AbstractRequest):
     exception: Serializable
 
     @classmethod
-    def _next(cls, run, request_data):
-        LOGGER.warn("User interface raised exception while handling action {}".format(request_data))
-        return run.generator.throw(GuiException(request_data['exception']))
+    def _next(cls, run, request):
+        LOGGER.warn("User interface raised exception while handling action {}".format(request))
+        return run.generator.throw(GuiException(request.exception))
 
 
 @dataclass
@@ -277,7 +678,7 @@ class CancelAction(AbstractRequest):
     run_name: CompositeName
 
     @classmethod
-    def _next(cls, run, request_data):
+    def _next(cls, run, request):
         return run.generator.throw(CancelRequest())
 
 @dataclass
@@ -285,7 +686,7 @@ class StopProcess(AbstractRequest):
     """Sentinel task to end all tasks to be executed by a process"""
 
     @classmethod
-    def execute(cls, request_data, connection: AbstractClientConnection):
+    def execute(cls, request, connection: AbstractClientConnection):
         raise SystemExit(0)
 
 
@@ -295,9 +696,75 @@ class Unbind(AbstractRequest):
     names: typing.List[CompositeName]
 
     @classmethod
-    def execute(cls, request_data, connection: AbstractClientConnection):
-        for lease in request_data['names']:
-            try:
-                initial_naming_context.unbind(tuple(lease))
-            except NameNotFoundException:
+    def execute(cls, request, connection: AbstractClientConnection):
+        names = request.names
+        for lease, error in zip(names, initial_naming_context.unbind_many(names, trusted=True)):
+            if isinstance(error, NameNotFoundException):
                 LOGGER.warn('received unbind request for non bound lease : {}'.format(lease))
+            elif error is not None:
+                raise error
+
+
+@dataclass
+class InternNames(AbstractRequest):
+    """
+    Request of the client to receive routes by their id in a name table, instead of their full name.
+    From then on, a :class:`camelot.view.responses.NameTableUpdate` response is sent before any
+    response that refers to newly interned routes.
+    """
+
+    @classmethod
+    def execute(cls, request, connection: AbstractClientConnection):
+        if connection.name_table is None:
+            connection.name_table = NameTable()
+
+
+@dataclass
+class SendStateChanges(AbstractRequest):
+    """
+    Request of the client to receive only the action states that changed in the
+    :class:`camelot.view.action_steps.ChangeSelection` steps of a view, after a first
+    step with all action states.  Steps that contain all action states have their
+    resync flag set.
+    """
+
+    @classmethod
+    def execute(cls, request, connection: AbstractClientConnection):
+        if connection.sent_action_states is None:
+            connection.sent_action_states = SentActionStates()
+
+
+@dataclass
+class SelectCodec(AbstractRequest):
+    """
+    Request of the client to use one of the codecs offered in the :class:`camelot.view.responses.Ready`
+    response for the requests and responses that follow this request.
+    """
+
+    codec: str
+
+    @classmethod
+    def execute(cls, request, connection: AbstractClientConnection):
+        codec = get_codec(request.codec)
+        if codec is None or request.codec not in connection.offered_codecs():
+            LOGGER.error('Request for an unavailable codec : {}'.format(request.codec))
+            return
+        connection.codec = codec
+
+
+@dataclass
+class SelectCompression(AbstractRequest):
+    """
+    Request of the client to receive the responses that follow this request in frames with a one
+    byte compression header, using one of the compressions offered in the :class:`camelot.view.responses.Ready`
+    response.  Only frames as large as the compression threshold of the connection are compressed.
+    """
+
+    compression: str
+
+    @classmethod
+    def execute(cls, request, connection: AbstractClientConnection):
+        if request.compression not in connection.offered_compressions():
+            LOGGER.error('Request for an unavailable compression : {}'.format(request.compression))
+            return
+        connection.compression = FrameCompressor(request.compression, connection.compression_threshold)
@@ -1,9 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 import typing
 
 from ..core.naming import CompositeName
-from ..core.serializable import NamedDataclassSerializable
+from ..core.serializable import NamedDataclassSerializable, available_codecs, available_compressions
 
 LOGGER = logging.getLogger('camelot.view.responses')
 
@@ -23,9 +23,16 @@ class Ready(AbstractResponse):
     This differs from the socket being connected, as it indicates
     end-to-end readiness.  It also provides a hint to the client
     for the name of the first action to run.
+    The codecs are the names of the codecs the client can select with a
+    :class:`camelot.view.requests.SelectCodec` request, the default codec
+    first.  The compressions are the names of the frame compressions the
+    client can select with a :class:`camelot.view.requests.SelectCompression`
+    request.
     """
     action_name: typing.Optional[CompositeName]
     model_context: typing.Optional[CompositeName]
+    codecs: typing.List[str] = field(default_factory=available_codecs)
+    compressions: typing.List[str] = field(default_factory=available_compressions)
 
 
 @dataclass
@@ -33,6 +40,15 @@ class Busy(AbstractResponse):
     busy: bool
 
 
+@dataclass
+class NameTableUpdate(AbstractResponse):
+    """
+    Ids of the names that were interned in the name table of the connection,
+    before they are used in the following responses.
+    """
+    names: typing.List[typing.Tuple[int, CompositeName]]
+
+
 @dataclass
 class ActionStepped(AbstractResponse):
     run_name: CompositeName
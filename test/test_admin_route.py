@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+
+from camelot.admin.admin_route import AdminRoute, AdminSnapshot
+from camelot.core.naming import initial_naming_context
+from camelot.core import serializable
+from camelot.core.serializable import json_encoder
+from camelot.view.action_steps.crud import SetColumns
+from camelot.view.controls import DelegateType
+
+
+class PlainTextDelegate(object):
+
+    delegate_type = DelegateType.PLAIN_TEXT
+
+
+class OpenFieldAction(object):
+
+    name = 'open_field'
+
+    def get_name(self):
+        return self.name
+
+
+class SnapshotAdmin(object):
+    """
+    Admin that registers a new admin route and field action route for each instance,
+    as the admins do after each restart of the application.
+    """
+
+    entity = None
+
+    def __init__(self):
+        self.static_field_attributes_requested = 0
+        self.admin_route = AdminRoute._register_admin_route(self)
+        self.action_route = AdminRoute._register_field_action_route(self.admin_route, 'name', OpenFieldAction())
+
+    def get_name(self):
+        return 'snapshot_admin'
+
+    def get_admin_route(self):
+        return self.admin_route
+
+    def get_columns(self):
+        return ['name']
+
+    def get_static_field_attributes(self, field_names):
+        self.static_field_attributes_requested += 1
+        for field_name in field_names:
+            yield {
+                'field_name': field_name,
+                'name': field_name.capitalize(),
+                'column_width': 20,
+                'delegate': PlainTextDelegate,
+                'action_routes': [self.action_route],
+                'length': 10,
+            }
+
+
+class AdminSnapshotCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'admin_snapshot.json')
+
+    def tearDown(self):
+        AdminRoute.snapshot = None
+        self.directory.cleanup()
+
+    def start(self, version='1.0'):
+        AdminRoute.snapshot = AdminSnapshot(self.path, version)
+        AdminRoute.snapshot.load()
+        return AdminRoute.snapshot
+
+    def test_round_trip(self):
+        self.start()
+        admin = SnapshotAdmin()
+        computed = json_encoder.encode(SetColumns.for_admin(admin, ['name']))
+        self.assertEqual(admin.static_field_attributes_requested, 1)
+        AdminRoute.snapshot.save()
+        self.assertTrue(os.path.exists(self.path))
+        # after a restart, the admin is registered under another route
+        snapshot = self.start()
+        restarted_admin = SnapshotAdmin()
+        self.assertNotEqual(restarted_admin.get_admin_route(), admin.get_admin_route())
+        reused = json_encoder.encode(SetColumns.for_admin(restarted_admin, ['name']))
+        self.assertEqual(restarted_admin.static_field_attributes_requested, 0)
+        self.assertEqual(snapshot.hits, 1)
+        self.assertEqual(
+            reused, computed.replace(
+                json_encoder.encode(list(admin.get_admin_route()))[1:-1],
+                json_encoder.encode(list(restarted_admin.get_admin_route()))[1:-1],
+            )
+        )
+
+    def test_other_version_is_discarded(self):
+        self.start()
+        SetColumns.for_admin(SnapshotAdmin(), ['name'])
+        AdminRoute.snapshot.save()
+        self.assertFalse(self.start('2.0')._entries)
+        admin = SnapshotAdmin()
+        SetColumns.for_admin(admin, ['name'])
+        self.assertEqual(admin.static_field_attributes_requested, 1)
+
+    def test_rebound_route_is_discarded(self):
+        self.start()
+        SetColumns.for_admin(SnapshotAdmin(), ['name'])
+        AdminRoute.snapshot.save()
+        snapshot = self.start()
+        admin = SnapshotAdmin()
+        # the field action route is bound to an object of another class after the restart
+        initial_naming_context.rebind(admin.action_route, object())
+        self.assertIsNone(snapshot.get_columns(admin, ['name']))
+        self.assertEqual(snapshot.misses, 1)
+
+    def test_columns_are_frozen(self):
+        admin = SnapshotAdmin()
+        set_columns = SetColumns.for_admin(admin, ['name'])
+        expected = json_encoder.encode(SetColumns(admin, admin.get_static_field_attributes(['name'])))
+        hits = serializable.fragment_cache.usage().hits
+        self.assertEqual(json_encoder.encode_dataclass(set_columns), expected)
+        reused = SetColumns.for_admin(admin, ['name'])
+        self.assertEqual(admin.static_field_attributes_requested, 2)
+        self.assertIs(reused.columns[0], set_columns.columns[0])
+        self.assertEqual(json_encoder.encode_dataclass(reused), expected)
+        self.assertEqual(serializable.fragment_cache.usage().hits, hits + 1)
+
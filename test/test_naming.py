@@ -0,0 +1,391 @@
+import gc
+import random
+import sys
+import threading
+import unittest
+
+from sqlalchemy import Column, Integer, String, create_engine, event, orm, text
+
+from camelot.core.naming import (
+    BindingType, BoundedNamingContext, Constant, ConstantNamingContext, EntityNamingContext, ExpiredBindingException, LeaseNamingContext,
+    NameNotFoundException, NamingContext, NamingException, TieredNamingContext, _get_session,
+    initial_naming_context, not_found,
+)
+from vfinance.model.entity import EntityBase
+
+
+class BoundObject(object):
+    pass
+
+
+class NamingThreadSafetyCase(unittest.TestCase):
+    """
+    Bind, resolve and unbind names from multiple threads at once, and verify
+    the flat index of the initial naming context remains consistent with the
+    bindings stored in the contexts themselves.
+    """
+
+    threads = 8
+    operations = 2000
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        # switch threads as often as possible, to provoke interleavings
+        sys.setswitchinterval(1e-6)
+        self.context = initial_naming_context.bind_new_context('stress')
+        self.bounded = BoundedNamingContext(max_bindings=50)
+        initial_naming_context.bind_context('stress_bounded', self.bounded)
+        self.tiered = TieredNamingContext(max_bindings=20)
+        initial_naming_context.bind_context('stress_tiered', self.tiered)
+        self.errors = []
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+        initial_naming_context.unbind_context('stress')
+        initial_naming_context.unbind_context('stress_bounded')
+        initial_naming_context.unbind_context('stress_tiered')
+
+    def worker(self, seed):
+        rnd = random.Random(seed)
+        try:
+            for i in range(self.operations):
+                context_name = rnd.choice(['stress', 'stress_bounded', 'stress_tiered', 'transient'])
+                name = str(rnd.randrange(200))
+                operation = rnd.random()
+                try:
+                    if operation < 0.4:
+                        initial_naming_context.rebind((context_name, name), BoundObject())
+                    elif operation < 0.55:
+                        initial_naming_context.unbind((context_name, name))
+                    elif operation < 0.6:
+                        sub_context_name = 'sub_{}'.format(rnd.randrange(5))
+                        if rnd.random() < 0.5:
+                            self.context.rebind_context(sub_context_name, NamingContext())
+                        else:
+                            self.context.unbind_context(sub_context_name)
+                    elif operation < 0.7:
+                        initial_naming_context.rebind(
+                            ('stress', 'sub_{}'.format(rnd.randrange(5)), name), BoundObject()
+                        )
+                    else:
+                        initial_naming_context.resolve_many([(context_name, name), ('stress', 'sub_1', name)])
+                        initial_naming_context.resolve((context_name, name))
+                except NamingException:
+                    # names are unbound concurrently by other threads
+                    pass
+        except Exception as e:
+            self.errors.append(e)
+
+    def test_concurrent_bind_resolve_unbind(self):
+        threads = [threading.Thread(target=self.worker, args=(i,)) for i in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.errors, [])
+        # every indexed name refers to the object that is found by walking the contexts
+        for binding_type, index in initial_naming_context._index.items():
+            for qual_name, (storage, key) in list(index.items()):
+                walked = NamingContext._resolve_binding(initial_naming_context, qual_name, binding_type)
+                self.assertIs(storage.get(key), walked, qual_name)
+        # every stored binding is indexed
+        object_index = initial_naming_context._index[BindingType.named_object]
+        for context in (self.context, self.bounded):
+            for name in context._bindings[BindingType.named_object].list():
+                self.assertIn((*context._name, *name), object_index)
+        # the bounded context respected its maximum number of bindings
+        self.assertLessEqual(len(self.bounded), self.bounded.max_bindings)
+        # the tiered context kept track of the objects in its strong tier
+        storage = self.tiered._bindings[BindingType.named_object]
+        self.assertLessEqual(len(storage._bindings), self.tiered.max_bindings)
+        self.assertEqual(set(storage._sizes), set(storage._bindings))
+        self.assertEqual(storage.bytes_held, sum(storage._sizes.values()))
+
+
+class SessionRegistryCase(unittest.TestCase):
+
+    def test_session_registered_when_begun(self):
+        session = orm.Session(bind=create_engine('sqlite://'))
+        hash_key = session.hash_key
+        self.assertIsNone(_get_session(hash_key))
+        session.execute(text('select 1'))
+        self.assertIs(_get_session(hash_key), session)
+        # the registry does not keep the session alive
+        session.close()
+        del session
+        gc.collect()
+        self.assertIsNone(_get_session(hash_key))
+
+
+class ResolvedPerson(EntityBase):
+
+    __tablename__ = 'test_resolved_person'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(20))
+
+
+class EntityResolveManyCase(unittest.TestCase):
+    """
+    Resolve many names of entity instances at once, spread over multiple sessions.
+    """
+
+    persons = 1200
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine('sqlite://')
+        ResolvedPerson.__table__.create(cls.engine)
+        with cls.engine.begin() as connection:
+            connection.execute(ResolvedPerson.__table__.insert(), [
+                {'id': i, 'name': 'person {}'.format(i)} for i in range(1, cls.persons + 1)
+            ])
+        cls.context = EntityNamingContext(ResolvedPerson)
+        initial_naming_context.resolve_context('entity').bind_context('test_resolved_person', cls.context)
+
+    @classmethod
+    def tearDownClass(cls):
+        initial_naming_context.resolve_context('entity').unbind_context('test_resolved_person')
+        cls.engine.dispose()
+
+    def setUp(self):
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self.count_statement)
+        self.sessions = [orm.Session(bind=self.engine) for _ in range(2)]
+        for session in self.sessions:
+            session.execute(text('select 1'))
+        self.statements.clear()
+
+    def tearDown(self):
+        event.remove(self.engine, 'before_cursor_execute', self.count_statement)
+        for session in self.sessions:
+            session.close()
+
+    def count_statement(self, connection, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            self.statements.append(statement)
+
+    def name(self, session, primary_key):
+        return (str(session.hash_key), str(primary_key))
+
+    def test_in_clause_chunks(self):
+        session = self.sessions[0]
+        primary_keys = list(range(1, self.persons + 1))
+        results = self.context.resolve_many([self.name(session, pk) for pk in primary_keys])
+        # 1200 primary keys are queried in chunks of at most 500
+        self.assertEqual(len(self.statements), 3)
+        self.assertEqual([person.id for person, _e in results], primary_keys)
+        self.assertTrue(all(e is None for _person, e in results))
+        self.assertTrue(all(person in session for person, _e in results))
+        # once in the identity map, the instances are resolved without querying
+        self.statements.clear()
+        results = self.context.resolve_many([self.name(session, pk) for pk in primary_keys[:10]])
+        self.assertEqual(len(self.statements), 0)
+        self.assertEqual([person.id for person, _e in results], primary_keys[:10])
+
+    def test_mixed_sessions(self):
+        first, second = self.sessions
+        cached = first.get(ResolvedPerson, 3)
+        self.statements.clear()
+        names = [
+            self.name(first, 1), self.name(second, 1), self.name(first, 2),
+            self.name(second, 3), self.name(first, 3), self.name(first, 1),
+        ]
+        results = self.context.resolve_many(names)
+        # one query per session, the cached instance is taken from the identity map
+        self.assertEqual(len(self.statements), 2)
+        sessions = [first, second, first, second, first, first]
+        for (person, e), name, session in zip(results, names, sessions):
+            self.assertIsNone(e)
+            self.assertEqual(person.id, int(name[1]))
+            self.assertIn(person, session)
+        self.assertIs(results[4][0], cached)
+        self.assertIs(results[0][0], results[5][0])
+        self.assertIsNot(results[0][0], results[1][0])
+        # the results match resolving the names one by one
+        for (person, _e), name in zip(results, names):
+            self.assertIs(initial_naming_context.resolve(('entity', 'test_resolved_person', *name)), person)
+
+    def test_missing_primary_keys(self):
+        session = self.sessions[0]
+        missing = self.persons + 1
+        names = [self.name(session, 1), self.name(session, missing), self.name(session, 2), self.name(session, missing)]
+        results = self.context.resolve_many(names)
+        self.assertEqual([person.id for person, _e in results[0::2]], [1, 2])
+        for person, e in results[1::2]:
+            self.assertIsNone(person)
+            self.assertIsInstance(e, NameNotFoundException)
+        # each missing name gets its own exception
+        self.assertIsNot(results[1][1], results[3][1])
+        # names of unknown sessions or invalid names do not raise either
+        results = self.context.resolve_many([('0', '1'), ('a', '1'), self.name(session, 2)])
+        self.assertIsInstance(results[0][1], NameNotFoundException)
+        self.assertIsInstance(results[1][1], NamingException)
+        self.assertEqual(results[2][0].id, 2)
+
+
+class ConstantMemoCase(unittest.TestCase):
+
+    def test_memo_is_bounded(self):
+        context = initial_naming_context.resolve_context(('constant', 'decimal'))
+        self.assertIsInstance(context, ConstantNamingContext)
+        self.assertEqual(context._memo_size, 1024)
+        first = context.resolve('0.5')
+        self.assertIs(context.resolve('0.5'), first)
+        for i in range(2 * context._memo_size):
+            context.resolve(str(i))
+            # the least recently used value is kept while it is in use
+            self.assertIs(context.resolve('0.5'), first)
+        self.assertEqual(len(context._memo), context._memo_size)
+        self.assertNotIn('0', context._memo)
+        self.assertEqual(context.resolve('0'), 0)
+
+    def test_invalid_names_are_not_memoized(self):
+        context = ConstantNamingContext(Constant.integer, memo_size=2)
+        initial_naming_context.bind_context('test_constant', context)
+        try:
+            with self.assertRaises(NamingException):
+                context.resolve('x')
+            self.assertEqual(len(context._memo), 0)
+            for name in ('1', '2', '3'):
+                self.assertEqual(context.resolve(name), int(name))
+            self.assertEqual(list(context._memo), ['2', '3'])
+        finally:
+            initial_naming_context.unbind_context('test_constant')
+
+    def test_colors_are_not_memoized(self):
+        context = initial_naming_context.resolve_context(('constant', 'color'))
+        self.assertIsNone(context._memo)
+        color = initial_naming_context.resolve(('constant', 'color', '#ff0000'))
+        other = initial_naming_context.resolve(('constant', 'color', '#ff0000'))
+        self.assertIsNot(color, other)
+        # modifying a resolved color does not affect the next one
+        color.setRgb(0, 255, 0)
+        self.assertEqual(initial_naming_context.resolve(('constant', 'color', '#ff0000')).name(), '#ff0000')
+
+
+class BoundedNamingContextCase(unittest.TestCase):
+
+    def test_byte_budget_evicts(self):
+        context = BoundedNamingContext(max_bindings=100)
+        initial_naming_context.bind_context('bounded_bytes', context)
+        try:
+            context.bind('a', list(range(100)))
+            size = context.bytes_held
+            context.max_bytes = 2 * size
+            context.bind('b', list(range(100)))
+            context.resolve('a')
+            context.bind('c', list(range(100)))
+            # the least recently used binding was evicted to stay within the byte budget
+            self.assertEqual(context.bytes_held, 2 * size)
+            self.assertEqual(context.evicted, 1)
+            with self.assertRaises(ExpiredBindingException):
+                context.resolve('b')
+            context.release(context.resolve('a'))
+            self.assertEqual(context.bytes_held, size)
+        finally:
+            initial_naming_context.unbind_context('bounded_bytes')
+
+
+class LeaseNamingContextCase(unittest.TestCase):
+
+    def setUp(self):
+        self.context = LeaseNamingContext(ttl=60, sweep_interval=60)
+        initial_naming_context.bind_context('test_leases', self.context)
+
+    def tearDown(self):
+        initial_naming_context.unbind_context('test_leases')
+
+    def age(self, name, seconds):
+        """
+        Make a lease and the previous sweep older than they are.
+        """
+        bound_lease = self.context.get_lease(name)
+        self.context._leases[name] = bound_lease._replace(created=bound_lease.created - seconds)
+        self.context._last_sweep -= seconds
+
+    def test_lease_outlives_its_bind(self):
+        self.context.ttl = 0
+        self.context.sweep_interval = 0
+        name = self.context.bind('a', BoundObject())
+        self.assertEqual(self.context.get_lease('a').size, self.context.bytes_held)
+        # the next use of the context sweeps the lease
+        self.assertIs(initial_naming_context.lookup(name), not_found)
+        self.assertEqual(self.context.bytes_held, 0)
+
+    def test_sweep_on_unbind(self):
+        self.context.bind('a', BoundObject())
+        self.context.bind('b', BoundObject())
+        self.age('a', 120)
+        initial_naming_context.unbind_many([('test_leases', 'b')])
+        self.assertEqual(list(self.context.list()), [])
+        self.assertEqual(self.context.bytes_held, 0)
+
+    def test_sweep_on_lookup(self):
+        name = self.context.bind('a', BoundObject())
+        self.assertIsInstance(initial_naming_context.resolve(name), BoundObject)
+        self.age('a', 120)
+        self.assertIs(initial_naming_context.lookup(name), not_found)
+        with self.assertRaises(NamingException):
+            initial_naming_context.resolve(name)
+
+
+class IndexConsistencyCase(unittest.TestCase):
+    """
+    The flat index of the initial naming context resolves the same objects as
+    the recursive walk through the contexts, after each kind of modification.
+    """
+
+    def setUp(self):
+        self.context = initial_naming_context.bind_new_context('indexed')
+
+    def tearDown(self):
+        initial_naming_context.unbind_context('indexed')
+
+    def assertConsistent(self, *names):
+        for name in names:
+            walked = NamingContext._lookup_binding(initial_naming_context, name, BindingType.named_object, not_found)
+            self.assertIs(initial_naming_context.lookup(name), walked, name)
+            if walked is not_found:
+                self.assertNotIn(name, initial_naming_context._index[BindingType.named_object])
+                with self.assertRaises(NamingException):
+                    initial_naming_context.resolve(name)
+            else:
+                self.assertIs(initial_naming_context.resolve(name), walked, name)
+
+    def test_overwrite_atomic_binding(self):
+        first, second = BoundObject(), BoundObject()
+        name = self.context.bind('a', first)
+        self.assertConsistent(name)
+        self.context.rebind('a', second)
+        self.assertIs(initial_naming_context.resolve(name), second)
+        self.assertConsistent(name)
+        self.context.unbind('a')
+        self.assertConsistent(name)
+
+    def test_rebind_context(self):
+        sub_context = self.context.bind_new_context('sub')
+        name = sub_context.bind('a', BoundObject())
+        self.assertConsistent(name)
+        # the bindings of the replaced context are no longer resolvable
+        other_context = NamingContext()
+        self.context.rebind_context('sub', other_context)
+        self.assertConsistent(name)
+        other_name = other_context.bind('a', BoundObject())
+        self.assertEqual(other_name, name)
+        self.assertConsistent(name)
+
+    def test_unbind_context(self):
+        sub_context = self.context.bind_new_context('sub')
+        nested_context = sub_context.bind_new_context('nested')
+        names = [sub_context.bind('a', BoundObject()), nested_context.bind('b', BoundObject())]
+        self.assertConsistent(*names)
+        self.context.unbind_context('sub')
+        self.assertConsistent(*names)
+        # binding a new context under the same name does not revive the old bindings
+        self.context.bind_new_context('sub')
+        self.assertConsistent(*names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,394 @@
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+import datetime
+import typing
+import unittest
+
+from camelot.admin.action.application_action import model_context_naming
+from camelot.admin.action.base import Mode, RenderHint, State
+from camelot.admin.admin_route import AdminRoute, Route, RouteWithRenderHint
+from camelot.core.naming import CompositeName, NameTable, NamingException, initial_naming_context, not_found
+from camelot.core.serializable import (
+    DataclassSerializable, FrameCompressor, MetaNamedDataclassSerializable, get_codec, json_codec,
+)
+from camelot.view.action_steps import ChangeSelection, CloseView, UpdateActionsState
+from camelot.view.requests import (
+    AbstractClientConnection, AbstractRequest, InitiateAction, SelectCodec, SelectCompression, SendStateChanges,
+    _isinstance_types, _request_deserializer,
+)
+from camelot.view.responses import NameTableUpdate
+
+
+class ClientConnection(AbstractClientConnection):
+
+    def send_response(self, response):
+        pass
+
+    def has_cancel_request(self):
+        return False
+
+
+class ModelContext(object):
+    pass
+
+
+routes = [('admin', 'Person', '0', 'list', 'actions', 'action_{}'.format(i)) for i in range(3)]
+
+
+class SendStateChangesCase(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = ClientConnection()
+        SendStateChanges.execute(SendStateChanges(), self.connection)
+        self.model_context = ModelContext()
+
+    def send(self, step):
+        step_type_name, step = AbstractRequest._step_payload(step, self.connection, self.model_context)
+        return step
+
+    def change_selection(self, *states):
+        return self.send(ChangeSelection(action_states=list(zip(routes, states))))
+
+    def test_only_changes_are_sent(self):
+        step = self.change_selection(State(enabled=True), State(enabled=True), State(enabled=True))
+        self.assertTrue(step.resync)
+        self.assertEqual(len(step.action_states), 3)
+        step = self.change_selection(State(enabled=True), State(enabled=False), State(enabled=True))
+        self.assertFalse(step.resync)
+        self.assertEqual([route for route, _state in step.action_states], [routes[1]])
+
+    def test_states_modified_in_place(self):
+        state = State(modes=[Mode('a', 'A')])
+        self.change_selection(state, State(), State())
+        state.modes[0].enabled = False
+        step = self.change_selection(state, State(), State())
+        self.assertEqual([route for route, _state in step.action_states], [routes[0]])
+
+    def test_update_actions_state_then_change_selection(self):
+        self.change_selection(State(enabled=True), State(enabled=True), State(enabled=True))
+        # the action disabled on the client by UpdateActionsState should be enabled again
+        update_actions_state = UpdateActionsState.__new__(UpdateActionsState)
+        update_actions_state.action_states = [(routes[0], State(enabled=False)._to_dict())]
+        self.send(update_actions_state)
+        step = self.change_selection(State(enabled=True), State(enabled=True), State(enabled=True))
+        self.assertFalse(step.resync)
+        self.assertEqual([route for route, _state in step.action_states], [routes[0]])
+
+
+class CloseAction(object):
+
+    def __init__(self, accept):
+        self.accept = accept
+
+    def model_run(self, model_context, mode):
+        yield CloseView(accept=self.accept)
+
+
+class CloseViewCase(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = ClientConnection()
+        self.actions = initial_naming_context.bind_new_context('close_view_actions')
+
+    def tearDown(self):
+        initial_naming_context.unbind_context('close_view_actions')
+
+    def close(self, accept):
+        model_context_name = model_context_naming.bind('close_view', ModelContext())
+        action_name = self.actions.rebind('close', CloseAction(accept))
+        InitiateAction.execute(InitiateAction(
+            gui_run_name=('gui_run', '1'), action_name=action_name, model_context=model_context_name
+        ), self.connection)
+        return model_context_name
+
+    def test_accepted_close_releases_model_context(self):
+        model_context_name = self.close(True)
+        self.assertIs(initial_naming_context.lookup(model_context_name), not_found)
+
+    def test_rejected_close_keeps_model_context(self):
+        model_context_name = self.close(False)
+        self.assertIsInstance(initial_naming_context.lookup(model_context_name), ModelContext)
+        model_context_naming.unbind('close_view')
+
+
+class JsonClientConnection(ClientConnection):
+
+    def offered_codecs(self):
+        return [json_codec.name]
+
+    def offered_compressions(self):
+        return []
+
+
+@dataclass
+class Payment(DataclassSerializable):
+
+    amount: int
+    due: datetime.date
+    booked: datetime.datetime
+
+
+class CodecCase(unittest.TestCase):
+
+    @unittest.skipIf(get_codec('msgpack') is None, 'msgpack is not installed')
+    def test_offered_codec_is_selected(self):
+        connection = ClientConnection()
+        SelectCodec.execute(SelectCodec(codec='msgpack'), connection)
+        self.assertIs(connection.codec, get_codec('msgpack'))
+
+    def test_unoffered_codec_is_rejected(self):
+        connection = JsonClientConnection()
+        for codec in ('msgpack', 'unknown'):
+            SelectCodec.execute(SelectCodec(codec=codec), connection)
+            self.assertIs(connection.codec, json_codec)
+
+    def test_date_round_trip(self):
+        payment = Payment(10, datetime.date(2024, 2, 29), datetime.datetime(2024, 2, 29, 13, 30, 15, 250))
+        expected = {'amount': 10, 'due': '2024-02-29', 'booked': '2024-02-29T13:30:15.000250'}
+        for name in ('json', 'msgpack'):
+            codec = get_codec(name)
+            if codec is None:
+                continue
+            with self.subTest(codec=name):
+                self.assertEqual(codec.decode(codec.encode_dataclass(payment)), expected)
+
+
+class RecordingClientConnection(ClientConnection):
+
+    def __init__(self):
+        super().__init__()
+        self.responses = []
+
+    def send_response(self, response):
+        self.responses.append(response)
+
+
+class MalformedRequestCase(unittest.TestCase):
+
+    def handle(self, frame):
+        connection = RecordingClientConnection()
+        with self.assertLogs('camelot.view.requests', level='ERROR'):
+            AbstractRequest.handle_request(frame, connection)
+        return connection.responses
+
+    def test_malformed_frames_are_logged(self):
+        for frame in (b'{', b'[1, 2, 3]', b'"x"', b'[["InitiateAction"], {}]', b'["Unknown", {}]'):
+            with self.subTest(frame=frame):
+                self.assertEqual(self.handle(frame), [])
+
+    def test_request_data_is_not_a_dict(self):
+        for frame in (b'["InitiateAction", [1]]', b'["InitiateAction", "gui_run_name"]', b'["Unbind", null]'):
+            with self.subTest(frame=frame):
+                self.assertEqual(self.handle(frame), [])
+
+    def test_rejected_initiate_action_is_stopped(self):
+        responses = self.handle(b'["InitiateAction", {"gui_run_name": ["gui_run", "1"], "action_name": 1}]')
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(responses[0].gui_run_name, ('gui_run', '1'))
+
+    def test_mode_accepts_float(self):
+        request = InitiateAction.deserialize({
+            'gui_run_name': ['gui_run', '1'], 'action_name': ['action'], 'model_context': ['model_context'], 'mode': 0.5,
+        })
+        self.assertEqual(request.mode, 0.5)
+
+
+@dataclass
+class OpenView(DataclassSerializable):
+
+    view: AdminRoute
+    model_context_name: Route
+    back: typing.Optional[Route] = None
+    title: str = 'view'
+    actions: typing.List[RouteWithRenderHint] = field(default_factory=list)
+    action_states: typing.List[typing.Tuple[Route, State]] = field(default_factory=list)
+
+
+class InternNamesCase(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = RecordingClientConnection()
+        AbstractRequest.handle_request(b'["InternNames", {}]', self.connection)
+        self.names = dict()
+
+    def send(self, step):
+        """
+        Send a step and decode it as the client would, returning the step with the ids replaced by their names.
+        """
+        step_type_name, interned_step = AbstractRequest._step_payload(step, self.connection)
+        for response in self.connection.responses:
+            self.assertIsInstance(response, NameTableUpdate)
+            response_type_name, response_data = json_codec.decode(json_codec.encode_dataclass(response))
+            self.assertEqual(response_type_name, 'NameTableUpdate')
+            names = response_data['names']
+            self.names.update((name_id, tuple(name)) for name_id, name in names)
+        self.connection.responses.clear()
+        return json_codec.decode(json_codec.encode_dataclass(interned_step))
+
+    def test_round_trip(self):
+        step = OpenView(
+            view=('admin', 'Person', '0'),
+            model_context_name=('model_context', '1'),
+            back=routes[2],
+            actions=[RouteWithRenderHint(route, RenderHint.PUSH_BUTTON) for route in routes[:2]],
+            action_states=[(route, State()) for route in routes],
+        )
+        data = self.send(step)
+        # the routes are identified by their field type, not by their field name
+        self.assertIsInstance(data['view'], int)
+        self.assertIsInstance(data['back'], int)
+        self.assertEqual(self.names[data['view']], step.view)
+        self.assertEqual(self.names[data['back']], routes[2])
+        self.assertEqual([self.names[action['route']] for action in data['actions']], routes[:2])
+        self.assertEqual([self.names[route] for route, _state in data['action_states']], routes)
+        # names outside the admin context are not interned
+        self.assertEqual(tuple(data['model_context_name']), step.model_context_name)
+        self.assertEqual(len(self.names), 4)
+        # the step itself is left untouched
+        self.assertEqual(step.view, ('admin', 'Person', '0'))
+        # interned names are sent only once
+        data = self.send(OpenView(view=('admin', 'Person', '0'), model_context_name=('model_context', '2')))
+        self.assertEqual(self.names[data['view']], ('admin', 'Person', '0'))
+        self.assertIsNone(data['back'])
+        self.assertEqual(len(self.names), 4)
+
+    def test_request_refers_to_id(self):
+        data = self.send(OpenView(view=('admin', 'Person', '0'), model_context_name=('model_context', '1'), back=routes[0]))
+        request = InitiateAction.deserialize({
+            'gui_run_name': ['gui_run', '1'], 'action_name': data['back'], 'model_context': data['model_context_name'],
+        }, self.connection.name_table)
+        self.assertEqual(request.action_name, routes[0])
+        self.assertEqual(request.model_context, ('model_context', '1'))
+        # an id that was never sent is rejected
+        with self.assertLogs('camelot.view.requests', level='ERROR'):
+            AbstractRequest.handle_request(
+                json_codec.encode(['InitiateAction', {
+                    'gui_run_name': ['gui_run', '1'], 'action_name': len(self.names), 'model_context': ['model_context', '1'],
+                }]), self.connection
+            )
+        self.assertEqual(len(self.connection.responses), 1)
+
+
+class DeserializerParityCase(unittest.TestCase):
+    """
+    The generated deserializer of each registered request type builds the same request as
+    the dataclass constructor does from the decoded payload.
+    """
+
+    # values of each json type, to check the fields annotated with classes
+    json_values = ['x', 1, 1.5, True, None, [1], {'a': 1}]
+
+    def request_types(self):
+        request_types = [
+            cls for cls in MetaNamedDataclassSerializable.cls_register.values()
+            if issubclass(cls, AbstractRequest) and is_dataclass(cls) and cls is not AbstractRequest
+        ]
+        self.assertIn(InitiateAction, request_types)
+        return request_types
+
+    def sample(self, field_type):
+        """
+        Return a value as sent by the client for a field type, and the value the request should hold.
+        """
+        if field_type == CompositeName:
+            return ['admin', 'Person'], ('admin', 'Person')
+        if field_type == typing.List[CompositeName]:
+            return [['leases', '1'], ['leases', '2']], [('leases', '1'), ('leases', '2')]
+        types = _isinstance_types(field_type)
+        if types is not None:
+            value = [value for value in self.json_values if isinstance(value, types)][0]
+            return value, value
+        return {'a': [1]}, {'a': [1]}
+
+    def payloads(self, request_type):
+        field_types = typing.get_type_hints(request_type)
+        sent, expected = dict(), dict()
+        for f in fields(request_type):
+            sent[f.name], expected[f.name] = self.sample(field_types[f.name])
+        return field_types, sent, expected
+
+    def test_all_fields(self):
+        for request_type in self.request_types():
+            with self.subTest(request_type=request_type.__name__):
+                field_types, sent, expected = self.payloads(request_type)
+                self.assertEqual(_request_deserializer(request_type)(sent, None), request_type(**expected))
+
+    def test_optional_fields(self):
+        for request_type in self.request_types():
+            with self.subTest(request_type=request_type.__name__):
+                field_types, sent, expected = self.payloads(request_type)
+                for f in fields(request_type):
+                    if f.default is not MISSING or f.default_factory is not MISSING:
+                        del sent[f.name], expected[f.name]
+                request = _request_deserializer(request_type)(sent, None)
+                self.assertEqual(request, request_type(**expected))
+                # default factories are called for each request
+                for f in fields(request_type):
+                    if f.default_factory is not MISSING:
+                        self.assertIsNot(getattr(request, f.name), getattr(request_type(**expected), f.name))
+
+    def test_missing_fields(self):
+        for request_type in self.request_types():
+            field_types, sent, expected = self.payloads(request_type)
+            for f in fields(request_type):
+                if f.default is MISSING and f.default_factory is MISSING:
+                    with self.subTest(request_type=request_type.__name__, field=f.name):
+                        incomplete = {name: value for name, value in sent.items() if name != f.name}
+                        with self.assertRaises(TypeError):
+                            request_type(**{name: value for name, value in expected.items() if name != f.name})
+                        with self.assertRaises(KeyError):
+                            _request_deserializer(request_type)(incomplete, None)
+
+    def test_isinstance_types(self):
+        for request_type in self.request_types():
+            field_types, sent, expected = self.payloads(request_type)
+            for f in fields(request_type):
+                types = _isinstance_types(field_types[f.name])
+                if types is None:
+                    continue
+                for value in self.json_values:
+                    with self.subTest(request_type=request_type.__name__, field=f.name, value=value):
+                        data = dict(sent, **{f.name: value})
+                        if isinstance(value, types):
+                            request = _request_deserializer(request_type)(data, None)
+                            self.assertEqual(request, request_type(**dict(expected, **{f.name: value})))
+                        else:
+                            with self.assertRaises(TypeError):
+                                _request_deserializer(request_type)(data, None)
+
+    def test_interned_names(self):
+        name_table = NameTable()
+        name_id = name_table.intern(('admin', 'Person'))
+        for request_type in self.request_types():
+            field_types, sent, expected = self.payloads(request_type)
+            for f in fields(request_type):
+                if field_types[f.name] == CompositeName:
+                    with self.subTest(request_type=request_type.__name__, field=f.name):
+                        data = dict(sent, **{f.name: name_id})
+                        self.assertEqual(_request_deserializer(request_type)(data, name_table), request_type(**expected))
+                        # without a name table, the client can not refer to names by their id
+                        with self.assertRaises(NamingException):
+                            _request_deserializer(request_type)(data, None)
+
+
+class CompressionCase(unittest.TestCase):
+
+    def test_offered_compression_is_selected(self):
+        connection = ClientConnection()
+        connection.compression_threshold = 10
+        SelectCompression.execute(SelectCompression(compression='zlib'), connection)
+        self.assertEqual(connection.compression.compression, 'zlib')
+        step = ChangeSelection(action_states=[(route, State()) for route in routes])
+        frame = connection.serialize_response(step)
+        self.assertNotEqual(frame[:1], b'\x00')
+        self.assertEqual(FrameCompressor.decompress(frame), json_codec.encode_dataclass(step))
+
+    def test_unoffered_compression_is_rejected(self):
+        for connection, compression in ((JsonClientConnection(), 'zlib'), (ClientConnection(), 'unknown')):
+            with self.subTest(compression=compression):
+                with self.assertLogs('camelot.view.requests', level='ERROR'):
+                    SelectCompression.execute(SelectCompression(compression=compression), connection)
+                self.assertIsNone(connection.compression)
+
+
+if __name__ == '__main__':
+    unittest.main()
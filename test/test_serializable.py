@@ -0,0 +1,258 @@
+import dataclasses
+import unittest
+
+from camelot.admin.action.base import Mode, State
+from camelot.admin.icon import CompletionValue, Icon
+from camelot.core.item_model import PreviewRole
+from camelot.core.qt import Qt, QtGui
+from camelot.core.serializable import (
+    DataclassEncoderOrjson, DataclassSerializable, FragmentCache, FrameCompressor, ImageEncoder, ImagePreview,
+    NamedDataclassSerializable, _dataclass_fields, _is_dataclass_type, _is_native_value, freeze,
+    available_compressions, json_encoder, touch,
+)
+from camelot.core import serializable
+from camelot.view.action_steps.crud import (
+    ChangeSelection, Completion, Created, DataColumn, RowCount, SetColumns, Update,
+)
+from camelot.view.action_steps.item_view import SetSelection, ToLastRow
+from camelot.view.crud_action import CrudActions, DataCell, DataRowHeader, DataUpdate
+from camelot.view.responses import ActionStepped, ActionStopped
+
+
+def reference_asdict(obj):
+    """
+    The recursive serialization of dataclasses as it was implemented before
+    the fields serializers were generated and dataclasses were handed to
+    orjson as they are.
+    """
+    t = type(obj)
+    if _is_dataclass_type(t):
+        fields = dict(
+            (f.name, reference_asdict(getattr(obj, f.name))) for f in _dataclass_fields(t)
+        )
+        if issubclass(t, NamedDataclassSerializable):
+            return t.__name__, fields
+        return fields
+    if t is dict:
+        return {k: reference_asdict(v) for k, v in obj.items()}
+    if t is list:
+        return [reference_asdict(v) for v in obj]
+    if t is tuple:
+        return tuple(reference_asdict(v) for v in obj)
+    return obj
+
+
+def changed_ranges(rows, columns, nested=False):
+    ranges = []
+    for row in range(rows):
+        header = DataRowHeader(
+            row=row, tool_tip='tip', verbose_identifier='obj {}'.format(row),
+            object=row, display=str(row), decoration=Icon('cog'),
+        )
+        cells = []
+        for column in range(columns):
+            cell = DataCell(row=row, column=column)
+            cell.roles = {
+                0: 'value {}'.format(column), 2: column * 1.5, 256: None,
+                257: '[]', 258: Qt.FocusPolicy.NoFocus, 259: True,
+            }
+            if nested:
+                cell.roles[260] = [('a', 'b')]
+            cells.append(cell)
+        ranges.append((row, header, cells))
+    return ranges
+
+
+class SerializerCompatibilityCase(unittest.TestCase):
+    """
+    The serialized form of the existing action steps should remain byte for
+    byte the same, whichever path the encoder takes.
+    """
+
+    def steps(self):
+        set_columns = SetColumns.__new__(SetColumns)
+        set_columns.columns = [DataColumn(
+            'field_{}'.format(i), 'Field {}'.format(i), True, 100, 'PlainTextDelegate',
+            {'length': 10, 'action_routes': [], 'column_span': 1, 'crud_actions': CrudActions(None)},
+            True,
+        ) for i in range(10)]
+        change_selection = ChangeSelection(action_states=[(
+            ('admin', 'x', '0', 'list', 'actions', str(i)),
+            State(verbose_name='action', enabled=True, modes=[Mode('m', 'M')])
+        ) for i in range(10)])
+        extra_attribute = DataRowHeader(row=2)
+        extra_attribute.something = 'x'
+        # annotations are not enforced, so fields might hold other values than their annotation suggests
+        misannotated = DataRowHeader(row=3, tool_tip=Icon('cog'), display=[Icon('cog')])
+        named_in_primitive = RowCount(ActionStopped(('model_run', '1'), ('gui_run', '1'), None))
+        return [
+            Update(changed_ranges(20, 5)),
+            Update(changed_ranges(5, 5, nested=True)),
+            Created(changed_ranges(5, 5)),
+            set_columns,
+            change_selection,
+            Completion(1, 2, 'pre', [CompletionValue(('a', 'b'), 'A'), CompletionValue(('c',), 'C', 'tip')]),
+            RowCount(10),
+            SetSelection([1, 2]),
+            ToLastRow(),
+            CrudActions(None),
+            extra_attribute,
+            misannotated,
+            named_in_primitive,
+            ActionStepped(('model_run', '1'), ('gui_run', '1'), False, change_selection),
+        ]
+
+    def test_byte_compatible(self):
+        python_encoder = DataclassEncoderOrjson(native_dataclasses=False)
+        for step in self.steps():
+            with self.subTest(type(step).__name__):
+                expected = json_encoder.encode(reference_asdict(step))
+                self.assertEqual(DataclassSerializable.asdict(step), reference_asdict(step))
+                self.assertEqual(json_encoder.encode_dataclass(step), expected)
+                self.assertEqual(python_encoder.encode_dataclass(step), expected)
+                self.assertEqual(step._to_bytes(), expected)
+
+
+
+@dataclasses.dataclass
+class SlotsColumn(DataclassSerializable):
+
+    __slots__ = ('name', 'width')
+
+    name: str
+    width: int
+
+
+class FreezeCase(unittest.TestCase):
+
+    def setUp(self):
+        self.fragment_cache = serializable.fragment_cache
+        serializable.fragment_cache = FragmentCache()
+
+    def tearDown(self):
+        serializable.fragment_cache = self.fragment_cache
+
+    def test_freeze_instance(self):
+        icon = Icon('frozen')
+        other_icon = Icon('other')
+        expected = json_encoder.encode(reference_asdict(icon))
+        freeze(icon)
+        # the instance itself is not modified, so other instances remain native
+        self.assertEqual(list(vars(icon)), ['name', 'pixmap_size', 'color'])
+        self.assertFalse(_is_native_value(icon))
+        self.assertTrue(_is_native_value(other_icon))
+        for i in range(2):
+            self.assertEqual(json_encoder.encode_dataclass(icon), expected)
+        self.assertEqual(serializable.fragment_cache.usage().hits, 1)
+        icon.name = 'touched'
+        touch(icon)
+        self.assertEqual(json_encoder.encode_dataclass(icon), json_encoder.encode(reference_asdict(icon)))
+
+    def test_freeze_slots_instance(self):
+        column = SlotsColumn('name', 100)
+        freeze(column)
+        step = RowCount([column, column])
+        expected = json_encoder.encode(reference_asdict(step))
+        self.assertEqual(json_encoder.encode_dataclass(step), expected)
+        self.assertEqual(serializable.fragment_cache.usage().hits, 1)
+        column.width = 200
+        touch(column)
+        self.assertEqual(json_encoder.encode_dataclass(step), json_encoder.encode(reference_asdict(step)))
+
+
+def filled_image(width, height, color):
+    image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_RGB32)
+    image.fill(QtGui.QColor(color))
+    return image
+
+
+class ImageEncoderCase(unittest.TestCase):
+
+    def setUp(self):
+        self.image_encoder = serializable.image_encoder
+        self.max_bytes = self.image_encoder.max_bytes
+        self.image_encoder.clear()
+        self.usage = self.image_encoder.usage()
+
+    def tearDown(self):
+        self.image_encoder.max_bytes = self.max_bytes
+        self.image_encoder.clear()
+
+    def assertUsage(self, **expected):
+        usage = self.image_encoder.usage()._asdict()
+        for name in ('hits', 'misses', 'evictions'):
+            usage[name] -= getattr(self.usage, name)
+        self.assertEqual({name: usage[name] for name in expected}, expected)
+
+    def test_repeated_cache_key_is_hit(self):
+        image = filled_image(40, 30, 'red')
+        encoded = json_encoder.encode(image)
+        # a copy shares the data of the image, and thus its cache key
+        self.assertEqual(json_encoder.encode(QtGui.QImage(image)), encoded)
+        self.assertUsage(hits=1, misses=1)
+        # a modified image has a new cache key
+        image.setPixel(0, 0, 0)
+        self.assertNotEqual(json_encoder.encode(image), encoded)
+        self.assertUsage(hits=1, misses=2)
+
+    def test_byte_budget_evicts(self):
+        images = [filled_image(40, 30, color) for color in ('red', 'green', 'blue')]
+        size = len(ImageEncoder._encode(images[0], None, None, False))
+        self.image_encoder.max_bytes = 2 * size
+        for image in images:
+            json_encoder.encode(image)
+        self.assertUsage(images=2, misses=3, evictions=1)
+        self.assertLessEqual(self.image_encoder.usage().bytes, 2 * size)
+        # the least recently used image was evicted
+        json_encoder.encode(images[0])
+        self.assertUsage(hits=0, misses=4)
+        json_encoder.encode(images[2])
+        self.assertUsage(hits=1, misses=4)
+
+    def test_preview_is_downscaled(self):
+        image = filled_image(400, 300, 'red')
+        preview = QtGui.QImage.fromData(ImageEncoder._encode(image, 40, 40, True))
+        self.assertEqual((preview.width(), preview.height()), (40, 30))
+        small_image = filled_image(20, 10, 'red')
+        self.assertEqual(
+            json_encoder.encode(ImagePreview(small_image, 40, 40)), json_encoder.encode(small_image)
+        )
+
+    def test_update_prefetches_images(self):
+        changed_ranges = []
+        for row, color in enumerate(('red', 'green', 'blue')):
+            cell = DataCell(row, 0)
+            cell.roles[PreviewRole] = ImagePreview(filled_image(400, 300, color), 40, 40)
+            changed_ranges.append((row, DataRowHeader(row), [cell]))
+        update = DataUpdate(changed_ranges)
+        self.assertUsage(images=3, hits=0, misses=3)
+        json_encoder.encode_dataclass(update)
+        self.assertUsage(images=3, hits=3, misses=3)
+
+
+class FrameCompressorCase(unittest.TestCase):
+
+    def test_small_frame_is_not_compressed(self):
+        compressor = FrameCompressor('zlib', threshold=100)
+        data = b'x' * 99
+        frame = compressor.compress(data)
+        self.assertEqual(frame, b'\x00' + data)
+        self.assertEqual(FrameCompressor.decompress(frame), data)
+        self.assertEqual(compressor.usage().compressed, 0)
+
+    def test_round_trip(self):
+        threshold = 100
+        for compression in available_compressions():
+            compressor = FrameCompressor(compression, threshold)
+            for size in (0, threshold - 1, threshold, 10 * threshold):
+                with self.subTest(compression=compression, size=size):
+                    data = json_encoder.encode(list(range(size)))[:size]
+                    frame = compressor.compress(data)
+                    # a single byte header flags whether the frame is compressed
+                    self.assertEqual(frame[:1] == b'\x00', size < threshold)
+                    self.assertEqual(FrameCompressor.decompress(frame), data)
+                    self.assertEqual(FrameCompressor.decompress(memoryview(frame)), data)
+
+
+if __name__ == '__main__':
+    unittest.main()